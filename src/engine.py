@@ -63,6 +63,7 @@ from .core.outbound_store import get_outbound_store
 from .utils.audio_capture import AudioCaptureManager
 from src.pipelines.base import LLMResponse
 from src.tools.telephony.hangup_policy import resolve_hangup_policy, text_contains_marker_word
+from src.tools.http.in_call_lookup import invalidate_pre_call_cache
 
 logger = get_logger(__name__)
 
@@ -1875,6 +1876,17 @@ class Engine:
             await self.pipeline_orchestrator.stop()
         except Exception:
             logger.debug("Pipeline orchestrator stop error", exc_info=True)
+        # Release pooled HTTP tool connections (best-effort)
+        try:
+            from src.tools.http.generic_webhook import close_shared_connector
+            await close_shared_connector()
+        except Exception:
+            logger.debug("Webhook connector close error", exc_info=True)
+        try:
+            from src.tools.http.in_call_lookup import close_shared_session
+            await close_shared_session()
+        except Exception:
+            logger.debug("In-call HTTP session close error", exc_info=True)
         # Stop MCP servers last (best-effort)
         try:
             if self.mcp_manager:
@@ -4726,6 +4738,7 @@ class Engine:
             # Clean up in-memory guard
             if resolved_call_id:
                 _cleanup_in_progress.discard(resolved_call_id)
+                invalidate_pre_call_cache(resolved_call_id)
 
     async def _persist_call_history(self, session: CallSession, call_id: str) -> None:
         """Persist call record to history database (Milestone 21)."""
@@ -9173,7 +9186,7 @@ class Engine:
                     llm_adapter_key = getattr(getattr(pipeline, "llm_adapter", None), "component_key", None)
                     guardrail_cfg = (llm_options or {}).get("hangup_call_guardrail")
                     hangup_policy = resolve_hangup_policy(getattr(self.config, "tools", None))
-                    policy_mode = str(hangup_policy.get("mode") or "normal").strip().lower()
+                    policy_mode = hangup_policy.mode
                     if policy_mode == "relaxed":
                         hangup_guardrail_enabled = False
                     elif policy_mode == "strict":
@@ -9186,8 +9199,7 @@ class Engine:
 
                     if hangup_guardrail_enabled and tool_calls and any(tc.get("name") == "hangup_call" for tc in tool_calls):
                         normalized_user_text = re.sub(r"\s+", " ", (transcript_text or "").strip().lower())
-                        end_markers = (hangup_policy.get("markers") or {}).get("end_call", [])
-                        has_end_intent = text_contains_marker_word(normalized_user_text, end_markers)
+                        has_end_intent = text_contains_marker_word(normalized_user_text, hangup_policy.end_call)
                         if not has_end_intent:
                             before_count = len(tool_calls)
                             tool_calls = [tc for tc in tool_calls if tc.get("name") != "hangup_call"]
@@ -11965,6 +11977,7 @@ class Engine:
             # Store pre-call results in session for debugging and in-call access
             session.pre_call_results = results
             await self._save_session(session)
+            invalidate_pre_call_cache(call_id)
             
             logger.info("Pre-call tools completed",
                        call_id=call_id,
@@ -12001,6 +12014,7 @@ class Engine:
         """
         from src.tools.base import ToolPhase
         from src.tools.context import PostCallContext
+        from src.tools.http.generic_webhook import GenericWebhookTool
         from src.tools.registry import tool_registry
         
         try:
@@ -12071,8 +12085,35 @@ class Engine:
                                 error=str(e),
                                 exc_info=True)
             
-            # Create fire-and-forget tasks for all post-call tools
-            for tool in tools_to_run:
+            async def run_webhook_batch(webhooks):
+                tool_names = [t.definition.name for t in webhooks]
+                try:
+                    batch_start = time.time()
+                    await GenericWebhookTool.dispatch_many(webhooks, post_call_ctx)
+                    duration_ms = (time.time() - batch_start) * 1000
+                    logger.info("Post-call webhooks completed",
+                               call_id=call_id,
+                               tools=tool_names,
+                               duration_ms=round(duration_ms, 2))
+                except Exception as e:
+                    logger.error("Post-call webhooks failed",
+                                call_id=call_id,
+                                tools=tool_names,
+                                error=str(e),
+                                exc_info=True)
+            
+            # Several webhooks share one batch so a requested summary is generated once
+            webhooks = [t for t in tools_to_run if isinstance(t, GenericWebhookTool)]
+            standalone_tools = tools_to_run
+            if len(webhooks) > 1:
+                asyncio.create_task(
+                    run_webhook_batch(webhooks),
+                    name=f"post-call-webhooks-{call_id}"
+                )
+                standalone_tools = [t for t in tools_to_run if not isinstance(t, GenericWebhookTool)]
+            
+            # Create fire-and-forget tasks for the remaining post-call tools
+            for tool in standalone_tools:
                 asyncio.create_task(
                     run_post_call_tool(tool),
                     name=f"post-call-{tool.definition.name}-{call_id}"
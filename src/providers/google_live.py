@@ -25,7 +25,7 @@ import time
 import struct
 import audioop
 import re
-from typing import Any, Dict, Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Tuple, Union
 from collections import deque
 
 import websockets
@@ -42,7 +42,7 @@ from ..audio import (
     resample_audio,
 )
 from ..config import GoogleProviderConfig
-from src.tools.telephony.hangup_policy import normalize_hangup_policy
+from src.tools.telephony.hangup_policy import HangupPolicy, normalize_hangup_policy
 
 # Tool calling support
 from src.tools.registry import tool_registry
@@ -123,7 +123,7 @@ class GoogleLiveProvider(AIProviderInterface):
         config: GoogleProviderConfig,
         on_event,
         gating_manager=None,
-        hangup_policy: Optional[Dict[str, Any]] = None,
+        hangup_policy: Optional[Union[HangupPolicy, Dict[str, Any]]] = None,
     ):
         super().__init__(on_event)
         self.config = config
@@ -331,7 +331,7 @@ class GoogleLiveProvider(AIProviderInterface):
         t = self._norm_text(text)
         if not t:
             return None
-        markers = (self._hangup_policy.get("markers") or {}).get("end_call", [])
+        markers = self._hangup_policy.end_call.markers
         for m in markers:
             if m in t:
                 return m
@@ -341,7 +341,7 @@ class GoogleLiveProvider(AIProviderInterface):
         t = self._norm_text(text)
         if not t:
             return None
-        markers = (self._hangup_policy.get("markers") or {}).get("assistant_farewell", [])
+        markers = self._hangup_policy.assistant_farewell.markers
         for m in markers:
             if m in t:
                 return m
@@ -10,7 +10,7 @@ from structlog import get_logger
 
 from ..config import LocalProviderConfig
 from .base import AIProviderInterface
-from ..tools.parser import parse_response_with_tools
+from ..tools.parser import parse_response_with_tools_async
 
 logger = get_logger(__name__)
 
@@ -611,7 +611,7 @@ class LocalProvider(AIProviderInterface):
                             call_id = data.get("call_id") or self._active_call_id
                             
                             # Parse the response for tool calls
-                            clean_text, tool_calls = parse_response_with_tools(llm_text)
+                            clean_text, tool_calls = await parse_response_with_tools_async(llm_text)
                             
                             # Emit agent transcript for conversation history (use clean text)
                             response_text = clean_text if clean_text else llm_text
@@ -28,7 +28,7 @@ class ToolCategory(Enum):
     HYBRID = "hybrid"         # May use both telephony and business logic
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolParameter:
     """Definition of a tool parameter."""
     name: str
@@ -57,12 +57,13 @@ class ToolParameter:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolDefinition:
     """
     Provider-agnostic tool definition.
     
     Contains all metadata needed to expose a tool to any AI provider.
+    Slotted: most tools build a fresh definition per access, so no per-instance __dict__.
     """
     name: str
     description: str
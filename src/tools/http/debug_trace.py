@@ -9,13 +9,29 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
 
 
 _ENV_PATTERN = re.compile(r"\$\{([A-Z_][A-Z0-9_]*)\}")
 _BRACE_PATTERN = re.compile(r"\{([a-zA-Z_][a-zA-Z0-9_]*)\}")
 
 
+class LazyStr:
+    """Defer an expensive `str()` until a log record is actually formatted."""
+
+    __slots__ = ("_func", "_args", "_kwargs")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args, **self._kwargs))
+
+    __repr__ = __str__
+
+
 def debug_enabled(logger: logging.Logger) -> bool:
     """Return True when DEBUG logging is enabled for this logger."""
     return bool(logger and logger.isEnabledFor(logging.DEBUG))
@@ -26,8 +42,8 @@ def preview(value: Any, *, limit: int = 4096) -> str:
     if value is None:
         return ""
     try:
-        if isinstance(value, bytes):
-            s = value.decode("utf-8", errors="replace")
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            s = bytes(value).decode("utf-8", errors="replace")
         else:
             s = str(value)
     except Exception:
@@ -27,6 +27,19 @@ from src.tools.http.debug_trace import (
 
 logger = logging.getLogger(__name__)
 
+_CONTEXT_VARS = (
+    "caller_number",
+    "called_number",
+    "caller_name",
+    "context_name",
+    "call_id",
+    "campaign_id",
+    "lead_id",
+)
+_SUBSTITUTION_PATTERN = re.compile(
+    r'\{(' + "|".join(map(re.escape, _CONTEXT_VARS)) + r')\}|\$\{([A-Z_][A-Z0-9_]*)\}'
+)
+
 
 @dataclass
 class HTTPLookupConfig:
@@ -312,31 +325,17 @@ class GenericHTTPLookupTool(PreCallTool):
         - {call_id} - Call identifier
         - ${ENV_VAR} - Environment variable
         """
-        result = template
-        
-        # Context variables
-        replacements = {
-            "{caller_number}": context.caller_number or "",
-            "{called_number}": context.called_number or "",
-            "{caller_name}": context.caller_name or "",
-            "{context_name}": context.context_name or "",
-            "{call_id}": context.call_id or "",
-            "{campaign_id}": context.campaign_id or "",
-            "{lead_id}": context.lead_id or "",
-        }
-        
-        for placeholder, value in replacements.items():
-            result = result.replace(placeholder, value)
-        
-        # Environment variables: ${VAR_NAME}
-        env_pattern = r'\$\{([A-Z_][A-Z0-9_]*)\}'
-        def env_replacer(match):
-            var_name = match.group(1)
-            return os.environ.get(var_name, "")
+        if "{" not in template:
+            return template
         
-        result = re.sub(env_pattern, env_replacer, result)
+        def replacer(match):
+            context_var, env_var = match.groups()
+            if context_var is not None:
+                return getattr(context, context_var, None) or ""
+            return os.environ.get(env_var, "")
         
-        return result
+        # One scan resolves context variables and ${VAR_NAME} together.
+        return _SUBSTITUTION_PATTERN.sub(replacer, template)
     
     def _extract_output_variables(self, data: Any) -> Dict[str, str]:
         """
@@ -4,18 +4,23 @@ Generic Webhook Tool - Post-call webhook notifications.
 Sends call data to external systems after call ends (fire-and-forget).
 """
 
+import asyncio
+import hashlib
 import os
 import re
 import json
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
+from json.encoder import encode_basestring_ascii
 
 import aiohttp
+from multidict import CIMultiDict
 
 from src.tools.base import PostCallTool, ToolDefinition, ToolCategory, ToolPhase
 from src.tools.context import PostCallContext
+from src.tools.http.summary_cache import get_summary_cache, summary_cache_key
 from src.tools.http.debug_trace import (
     build_var_snapshot,
     debug_enabled,
@@ -31,6 +36,130 @@ try:
 except ImportError:  # pragma: no cover
     openai = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _dumps_bytes(value: Any) -> bytes:
+    """Serialize `value` to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value).encode("utf-8")
+
+
+# Environment variables: ${VAR_NAME}
+_ENV_PATTERN = re.compile(r'\$\{([A-Z_][A-Z0-9_]*)\}')
+# Sensitive query parameters redacted from logged URLs
+_REDACT_PATTERN = re.compile(r'(api_key|apikey|key|token|auth)=[^&]+', re.IGNORECASE)
+# Cheap substring pre-check covering every _REDACT_PATTERN alternative
+_REDACT_HINTS = ("key=", "token=", "auth=")
+# Payload variables: {var_name}
+_PLACEHOLDER_PATTERN = re.compile(r'\{([a-zA-Z_][a-zA-Z0-9_]*)\}')
+
+
+def _resolve_env_eagerly(template: str) -> Tuple[str, bool]:
+    """
+    Resolve `${ENV}` references in a URL/header template up front.
+    
+    Returns:
+        (template, needs_runtime_env). If any referenced variable is unset the
+        template is returned untouched and flagged for per-request resolution.
+    """
+    if "${" not in template:
+        return template, False
+    names = _ENV_PATTERN.findall(template)
+    if any(name not in os.environ for name in names):
+        return template, True
+    return _ENV_PATTERN.sub(lambda m: os.environ[m.group(1)], template), False
+
+
+def _compile_payload_template(template: str) -> List[Union[str, Tuple[str, bool]]]:
+    """
+    Split a payload template into literal text and `(name, is_raw)` placeholders.
+    
+    `is_raw` is True for `*_json` variables, which are inserted without JSON
+    string escaping.
+    """
+    plan: List[Union[str, Tuple[str, bool]]] = []
+    pos = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(template):
+        if match.start() > pos:
+            plan.append(template[pos:match.start()])
+        name = match.group(1)
+        plan.append((name, name.endswith("_json")))
+        pos = match.end()
+    if pos < len(template):
+        plan.append(template[pos:])
+    return plan
+
+
+def _json_escape(value: Any) -> str:
+    """Escape a value for embedding inside a JSON string literal (no quotes)."""
+    return encode_basestring_ascii(str(value))[1:-1]
+
+
+# Webhook responses are only used for log previews, so never buffer more than this.
+_BODY_PREVIEW_BYTES = 1024
+_DEBUG_BODY_PREVIEW_BYTES = 4096
+
+# Background deliveries scheduled with `await_response: false`.
+_INFLIGHT_TASKS: Set[asyncio.Task] = set()
+
+_SUMMARY_MODEL = "gpt-4o-mini"
+
+# Full tracebacks for unexpected errors are limited per window so a failing
+# endpoint cannot turn into a traceback-formatting storm on the event loop.
+_ERROR_TB_WINDOW_SECONDS = 60.0
+_ERROR_TB_MAX_PER_WINDOW = 5
+_ERROR_TB_BUCKET = {"window_start": float("-inf"), "count": 0}
+
+
+def _allow_error_traceback() -> bool:
+    """Return True if the next unexpected error may be logged with a traceback."""
+    now = time.monotonic()
+    if now - _ERROR_TB_BUCKET["window_start"] >= _ERROR_TB_WINDOW_SECONDS:
+        _ERROR_TB_BUCKET["window_start"] = now
+        _ERROR_TB_BUCKET["count"] = 0
+    _ERROR_TB_BUCKET["count"] += 1
+    return _ERROR_TB_BUCKET["count"] <= _ERROR_TB_MAX_PER_WINDOW
+
+# Identical deliveries currently on the wire, keyed by request fingerprint
+# (only used when `coalesce: true`).
+_INFLIGHT_COALESCE: Dict[str, asyncio.Future] = {}
+
+# Connection pool shared by all webhook sessions so keep-alive TCP/TLS
+# connections survive across calls. Bound to the loop that created it.
+_SHARED_CONNECTOR: Optional[aiohttp.TCPConnector] = None
+_SHARED_CONNECTOR_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the shared webhook connector, creating it for the running loop if needed."""
+    global _SHARED_CONNECTOR, _SHARED_CONNECTOR_LOOP
+    loop = asyncio.get_running_loop()
+    if _SHARED_CONNECTOR is None or _SHARED_CONNECTOR.closed or _SHARED_CONNECTOR_LOOP is not loop:
+        _SHARED_CONNECTOR = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=30)
+        _SHARED_CONNECTOR_LOOP = loop
+    return _SHARED_CONNECTOR
+
+
+async def close_shared_connector() -> None:
+    """Close the shared webhook connector (call on engine shutdown)."""
+    global _SHARED_CONNECTOR, _SHARED_CONNECTOR_LOOP
+    connector = _SHARED_CONNECTOR
+    _SHARED_CONNECTOR = None
+    _SHARED_CONNECTOR_LOOP = None
+    if connector is not None and not connector.closed:
+        await connector.close()
+
+
+async def _read_body_preview(response: aiohttp.ClientResponse, limit: int) -> str:
+    """Read at most `limit` bytes of the response body and decode them."""
+    raw = await response.content.read(limit)
+    return raw.decode(response.charset or "utf-8", errors="replace")
+
 
 @dataclass
 class WebhookConfig:
@@ -55,6 +184,20 @@ class WebhookConfig:
     # Summary generation (optional - uses LLM to summarize transcript)
     generate_summary: bool = False
     summary_max_words: int = 100
+    
+    # Summary cache: "memory" (per process), "sqlite"/"redis" (shared across workers), or "none"
+    summary_cache_backend: str = "memory"
+    summary_cache_url: str = ""  # SQLite file path or Redis URL
+    summary_cache_ttl_seconds: int = 86400
+    
+    # When False, execute() schedules delivery in the background and returns immediately
+    await_response: bool = True
+    
+    # When True, identical concurrent requests (method/url/headers/payload) are sent once
+    coalesce: bool = False
+    
+    # When True, ${ENV} in url/headers is read on every request instead of once at load
+    defer_env: bool = False
 
 
 class GenericWebhookTool(PostCallTool):
@@ -106,6 +249,30 @@ class GenericWebhookTool(PostCallTool):
             is_global=config.is_global,
             timeout_ms=config.timeout_ms,
         )
+        # URL/headers/template are fixed per tool, so the debug-trace variable
+        # scans only need to run once.
+        trace_templates = (
+            config.url,
+            *(config.headers or {}).values(),
+            config.payload_template,
+        )
+        self._used_brace_vars = extract_used_brace_vars(*trace_templates)
+        self._used_env_vars = extract_used_env_vars(*trace_templates)
+        # Most webhook payloads reference no env vars; skip the regex pass for them.
+        self._payload_has_env = "${" in (config.payload_template or "")
+        self._payload_plan = _compile_payload_template(config.payload_template or "{}")
+        # ${ENV} values in url/headers are constant for the process lifetime,
+        # so resolve them once; only {call} variables remain per request.
+        if config.defer_env:
+            self._url_tmpl = (config.url, "${" in config.url)
+            self._header_tmpls = [
+                (k, v, "${" in v) for k, v in (config.headers or {}).items()
+            ]
+        else:
+            self._url_tmpl = _resolve_env_eagerly(config.url)
+            self._header_tmpls = [
+                (k, *_resolve_env_eagerly(v)) for k, v in (config.headers or {}).items()
+            ]
     
     @property
     def definition(self) -> ToolDefinition:
@@ -115,6 +282,10 @@ class GenericWebhookTool(PostCallTool):
         """
         Execute the webhook (fire-and-forget).
         
+        By default the HTTP call is awaited so callers can time it; with
+        `await_response: false` it is scheduled as a background task and this
+        returns as soon as the task is created.
+        
         Args:
             context: PostCallContext with comprehensive call data
         """
@@ -126,117 +297,224 @@ class GenericWebhookTool(PostCallTool):
             logger.warning(f"Webhook tool has no URL configured: {self.config.name}")
             return
         
+        if self.config.await_response:
+            await self._deliver(context)
+            return
+        
+        task = asyncio.create_task(
+            self._deliver(context),
+            name=f"webhook-{self.config.name}-{context.call_id}",
+        )
+        # Keep a strong reference so the task is not garbage-collected mid-flight
+        _INFLIGHT_TASKS.add(task)
+        task.add_done_callback(_INFLIGHT_TASKS.discard)
+    
+    @classmethod
+    async def dispatch_many(
+        cls,
+        tools: Iterable["GenericWebhookTool"],
+        context: PostCallContext,
+    ) -> None:
+        """
+        Deliver several webhooks for the same call concurrently.
+        
+        The summary (if any tool wants one) is generated once up front instead
+        of once per tool, then all deliveries run together over the shared
+        connection pool.
+        
+        Args:
+            tools: Webhook tools to run for this call
+            context: PostCallContext shared by all deliveries
+        """
+        tools = [t for t in tools if t.config.enabled and t.config.url]
+        if not tools:
+            return
+        
+        summary_tool = next((t for t in tools if t.config.generate_summary), None)
+        if summary_tool is not None and not context.summary:
+            context.summary = await summary_tool._generate_summary(context)
+        
+        await asyncio.gather(*(t.execute(context) for t in tools))
+    
+    async def _deliver(self, context: PostCallContext) -> None:
+        """Build and send the webhook request, logging (never raising) failures."""
         try:
             started = time.monotonic()
             # Generate summary if requested and not already present
             if self.config.generate_summary and not context.summary:
                 context.summary = await self._generate_summary(context)
             
-            # Build request
-            url = self._substitute_variables(self.config.url, context)
-            headers = {
-                k: self._substitute_variables(v, context)
-                for k, v in self.config.headers.items()
-            }
-            
-            # Ensure content-type is set
-            if 'Content-Type' not in headers and 'content-type' not in headers:
-                headers['Content-Type'] = self.config.content_type
-            
-            # Build payload
-            payload = None
-            if self.config.payload_template:
-                payload = self._build_payload(context)
+            url, headers, payload = self._prepare_request(context)
+            if self.config.coalesce:
+                await self._send_coalesced(url, headers, payload, context, started=started)
             else:
-                # Default payload using context's to_payload_dict
-                payload = json.dumps(context.to_payload_dict())
-
-            if debug_enabled(logger):
-                used_brace = extract_used_brace_vars(
-                    self.config.url,
-                    *(self.config.headers or {}).values(),
-                    self.config.payload_template,
-                )
-                used_env = extract_used_env_vars(
-                    self.config.url,
-                    *(self.config.headers or {}).values(),
-                    self.config.payload_template,
-                )
-                values = context.to_payload_dict()
-                logger.debug(
-                    "[HTTP_TOOL_TRACE] request_resolved post_call tool=%s method=%s url=%s headers=%s payload=%s vars=%s call_id=%s",
-                    self.config.name,
-                    self.config.method,
-                    url,
-                    headers,
-                    preview(payload),
-                    build_var_snapshot(
-                        used_brace_vars=used_brace,
-                        used_env_vars=used_env,
-                        values=values,
-                        env=os.environ,
-                    ),
-                    getattr(context, "call_id", None),
-                )
-            
-            logger.info(f"Sending webhook: {self.config.name} {self.config.method} {self._redact_url(url)}")
-            
-            # Make request (fire-and-forget)
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout_ms / 1000.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.request(
-                    method=self.config.method,
-                    url=url,
-                    headers=headers,
-                    data=payload,
-                ) as response:
-                    status = response.status
-                    body_text = ""
-                    try:
-                        body_text = await response.text()
-                    except Exception as e:
-                        logger.debug(f"Failed to read response body: {e}")
-                    
-                    if 200 <= status < 300:
-                        logger.info(f"Webhook sent successfully: {self.config.name} status={status}")
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] response_ok post_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
-                                self.config.name,
-                                status,
-                                elapsed_ms,
-                                preview(body_text),
-                                getattr(context, "call_id", None),
-                            )
-                    else:
-                        # Log but don't fail (fire-and-forget)
-                        body_preview = (body_text[:200] if body_text else "")
-                        logger.warning(
-                            f"Webhook returned non-2xx: {self.config.name} status={status} body={body_preview}"
-                        )
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] response_non_2xx post_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
-                                self.config.name,
-                                status,
-                                elapsed_ms,
-                                preview(body_text),
-                                getattr(context, "call_id", None),
-                            )
+                await self._send(url, headers, payload, context, started=started)
         
         except aiohttp.ClientError as e:
             logger.warning(f"Webhook request failed: {self.config.name} error={e}")
         except Exception as e:
-            logger.error(f"Webhook unexpected error: {self.config.name} error={e}", exc_info=True)
+            if _allow_error_traceback():
+                logger.error(f"Webhook unexpected error: {self.config.name} error={e}", exc_info=True)
+            else:
+                logger.warning(f"Webhook unexpected error (traceback suppressed): {self.config.name} error={e}")
+    
+    def _prepare_request(self, context: PostCallContext) -> Tuple[str, CIMultiDict, Optional[Union[str, bytes]]]:
+        """
+        Resolve URL, headers and payload for this call.
+        
+        Returns:
+            (url, headers, payload) ready to hand to `_send`.
+        """
+        url_tmpl, url_needs_env = self._url_tmpl
+        url = self._substitute_variables(url_tmpl, context, resolve_env=url_needs_env)
+        headers = CIMultiDict(
+            (k, self._substitute_variables(v, context, resolve_env=needs_env))
+            for k, v, needs_env in self._header_tmpls
+        )
+        
+        # Ensure content-type is set (case-insensitive)
+        headers.setdefault('Content-Type', self.config.content_type)
+        
+        # Build payload
+        payload = None
+        if self.config.payload_template:
+            payload = self._build_payload(context)
+        else:
+            # Default payload using context's to_payload_dict (bytes are fine for aiohttp data=)
+            payload = _dumps_bytes(context.to_payload_dict())
+
+        if debug_enabled(logger):
+            values = context.to_payload_dict()
+            logger.debug(
+                "[HTTP_TOOL_TRACE] request_resolved post_call tool=%s method=%s url=%s headers=%s payload=%s vars=%s call_id=%s",
+                self.config.name,
+                self.config.method,
+                url,
+                headers,
+                preview(payload),
+                build_var_snapshot(
+                    used_brace_vars=self._used_brace_vars,
+                    used_env_vars=self._used_env_vars,
+                    values=values,
+                    env=os.environ,
+                ),
+                getattr(context, "call_id", None),
+            )
+        
+        return url, headers, payload
+    
+    async def _send_coalesced(
+        self,
+        url: str,
+        headers: CIMultiDict,
+        payload: Optional[Union[str, bytes]],
+        context: PostCallContext,
+        *,
+        started: Optional[float] = None,
+    ) -> None:
+        """
+        Send unless an identical request is already in flight, in which case
+        wait for that one to finish instead of issuing a duplicate.
+        """
+        hasher = hashlib.sha1(f"{self.config.method}\n{url}\n".encode("utf-8"))
+        for k, v in sorted(headers.items()):
+            hasher.update(f"{k.lower()}:{v}\n".encode("utf-8"))
+        if payload is not None:
+            hasher.update(payload.encode("utf-8") if isinstance(payload, str) else payload)
+        key = hasher.hexdigest()
+        
+        pending = _INFLIGHT_COALESCE.get(key)
+        if pending is not None:
+            logger.info(f"Coalesced duplicate webhook: {self.config.name} call_id={context.call_id}")
+            await asyncio.shield(pending)
+            return
+        
+        done = asyncio.get_running_loop().create_future()
+        _INFLIGHT_COALESCE[key] = done
+        try:
+            await self._send(url, headers, payload, context, started=started)
+        finally:
+            _INFLIGHT_COALESCE.pop(key, None)
+            done.set_result(None)
+    
+    async def _send(
+        self,
+        url: str,
+        headers: CIMultiDict,
+        payload: Optional[Union[str, bytes]],
+        context: PostCallContext,
+        *,
+        started: Optional[float] = None,
+    ) -> None:
+        """
+        Send a prepared webhook request and log the outcome.
+        
+        Raises:
+            aiohttp.ClientError: On transport failures (callers log these).
+        """
+        if started is None:
+            started = time.monotonic()
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Sending webhook: {self.config.name} {self.config.method} {self._redact_url(url)}")
+        
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout_ms / 1000.0)
+        async with aiohttp.ClientSession(
+            timeout=timeout,
+            connector=_get_shared_connector(),
+            connector_owner=False,
+        ) as session:
+            async with session.request(
+                method=self.config.method,
+                url=url,
+                headers=headers,
+                data=payload,
+            ) as response:
+                status = response.status
+                body_text = ""
+                try:
+                    limit = (
+                        _DEBUG_BODY_PREVIEW_BYTES
+                        if debug_enabled(logger)
+                        else _BODY_PREVIEW_BYTES
+                    )
+                    body_text = await _read_body_preview(response, limit)
+                except Exception as e:
+                    logger.debug(f"Failed to read response body: {e}")
+                
+                if 200 <= status < 300:
+                    logger.info(f"Webhook sent successfully: {self.config.name} status={status}")
+                    if debug_enabled(logger):
+                        elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                        logger.debug(
+                            "[HTTP_TOOL_TRACE] response_ok post_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
+                            self.config.name,
+                            status,
+                            elapsed_ms,
+                            preview(body_text),
+                            getattr(context, "call_id", None),
+                        )
+                else:
+                    # Log but don't fail (fire-and-forget)
+                    body_preview = (body_text[:200] if body_text else "")
+                    logger.warning(
+                        f"Webhook returned non-2xx: {self.config.name} status={status} body={body_preview}"
+                    )
+                    if debug_enabled(logger):
+                        elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                        logger.debug(
+                            "[HTTP_TOOL_TRACE] response_non_2xx post_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
+                            self.config.name,
+                            status,
+                            elapsed_ms,
+                            preview(body_text),
+                            getattr(context, "call_id", None),
+                        )
     
     def _build_payload(self, context: PostCallContext) -> str:
         """
         Build payload from template with variable substitution.
         """
-        template = self.config.payload_template or "{}"
-        
         # Get payload dict from context
         payload_vars = context.to_payload_dict()
         
@@ -249,36 +527,51 @@ class GenericWebhookTool(PostCallTool):
         else:
             payload_vars["summary_json"] = json.dumps("")
         
-        # Substitute variables
-        result = template
-        
-        # Simple variable substitution: {var_name}
-        for key, value in payload_vars.items():
-            placeholder = "{" + key + "}"
-            if placeholder in result:
+        # Simple variable substitution: {var_name}, single pass over the precompiled template
+        parts: List[str] = []
+        for segment in self._payload_plan:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            key, is_raw = segment
+            if key not in payload_vars:
+                # Unknown placeholder: leave as-is
+                parts.append("{" + key + "}")
+            elif is_raw:
                 # For JSON fields (ending with _json), don't quote
-                if key.endswith("_json"):
-                    result = result.replace(placeholder, str(value))
-                else:
-                    # Escape for JSON string
-                    escaped = json.dumps(str(value))[1:-1]  # Remove outer quotes
-                    result = result.replace(placeholder, escaped)
+                parts.append(str(payload_vars[key]))
+            else:
+                # Escape for JSON string
+                parts.append(_json_escape(payload_vars[key]))
+        result = "".join(parts)
         
         # Environment variables: ${VAR_NAME}
-        env_pattern = r'\$\{([A-Z_][A-Z0-9_]*)\}'
-        def env_replacer(match):
-            var_name = match.group(1)
-            value = os.environ.get(var_name, "")
-            return json.dumps(value)[1:-1]  # Escape for JSON
-        
-        result = re.sub(env_pattern, env_replacer, result)
+        if self._payload_has_env:
+            def env_replacer(match):
+                var_name = match.group(1)
+                return _json_escape(os.environ.get(var_name, ""))
+            
+            result = _ENV_PATTERN.sub(env_replacer, result)
         
         return result
     
-    def _substitute_variables(self, template: str, context: PostCallContext) -> str:
+    def _substitute_variables(
+        self,
+        template: str,
+        context: PostCallContext,
+        *,
+        resolve_env: bool = True,
+    ) -> str:
         """
         Substitute variables in URL/headers.
+        
+        Args:
+            resolve_env: Set False for templates whose ${ENV} refs were already resolved
         """
+        # Static URL/header values (the common case) need no substitution
+        if "{" not in template:
+            return template
+        
         result = template
         
         # Context variables
@@ -298,19 +591,24 @@ class GenericWebhookTool(PostCallTool):
             result = result.replace(placeholder, value)
         
         # Environment variables: ${VAR_NAME}
-        env_pattern = r'\$\{([A-Z_][A-Z0-9_]*)\}'
-        def env_replacer(match):
-            var_name = match.group(1)
-            return os.environ.get(var_name, "")
-        
-        result = re.sub(env_pattern, env_replacer, result)
+        if resolve_env and "${" in template:
+            def env_replacer(match):
+                var_name = match.group(1)
+                return os.environ.get(var_name, "")
+            
+            result = _ENV_PATTERN.sub(env_replacer, result)
         
         return result
     
     def _redact_url(self, url: str) -> str:
         """Redact sensitive parts of URL for logging."""
-        redacted = re.sub(r'(api_key|apikey|key|token|auth)=([^&]+)', r'\1=***', url, flags=re.IGNORECASE)
-        return redacted
+        # Most webhook URLs carry no credentials; skip the regex for them
+        if "=" not in url:
+            return url
+        lower = url.lower()
+        if not any(hint in lower for hint in _REDACT_HINTS):
+            return url
+        return _REDACT_PATTERN.sub(r'\1=***', url)
     
     async def _generate_summary(self, context: PostCallContext) -> str:
         """
@@ -342,12 +640,20 @@ class GenericWebhookTool(PostCallTool):
                 logger.warning(f"Cannot generate summary - OPENAI_API_KEY not set: {self.config.name}")
                 return ""
             
-            client = openai.AsyncOpenAI(api_key=api_key)
-            
             max_words = self.config.summary_max_words
             
+            cache = get_summary_cache(self.config.summary_cache_backend, self.config.summary_cache_url)
+            cache_key = summary_cache_key(transcript_text, model=_SUMMARY_MODEL, max_words=max_words)
+            if cache is not None:
+                cached = await cache.get(cache_key)
+                if cached:
+                    logger.info(f"Using cached summary for webhook: {self.config.name} length={len(cached)}")
+                    return cached
+            
+            client = openai.AsyncOpenAI(api_key=api_key)
+            
             response = await client.chat.completions.create(
-                model="gpt-4o-mini",
+                model=_SUMMARY_MODEL,
                 messages=[
                     {
                         "role": "system",
@@ -364,6 +670,8 @@ class GenericWebhookTool(PostCallTool):
             
             summary = response.choices[0].message.content.strip() if response.choices else ""
             logger.info(f"Generated summary for webhook: {self.config.name} length={len(summary)}")
+            if cache is not None and summary:
+                await cache.set(cache_key, summary, self.config.summary_cache_ttl_seconds)
             return summary
             
         except Exception as e:
@@ -395,6 +703,12 @@ def create_webhook_tool(name: str, config_dict: Dict[str, Any]) -> GenericWebhoo
         content_type=config_dict.get('content_type', 'application/json'),
         generate_summary=config_dict.get('generate_summary', False),
         summary_max_words=config_dict.get('summary_max_words', 100),
+        summary_cache_backend=config_dict.get('summary_cache_backend', 'memory'),
+        summary_cache_url=config_dict.get('summary_cache_url', ''),
+        summary_cache_ttl_seconds=config_dict.get('summary_cache_ttl_seconds', 86400),
+        await_response=config_dict.get('await_response', True),
+        coalesce=config_dict.get('coalesce', False),
+        defer_env=config_dict.get('defer_env', False),
     )
     
     return GenericWebhookTool(config)
@@ -5,12 +5,17 @@ Allows AI to make HTTP requests mid-call to fetch data (e.g., check availability
 lookup order status) and receive results to inform the conversation.
 """
 
+import asyncio
+import functools
+import hashlib
 import os
 import re
 import json
 import logging
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Sequence, Set, Tuple, Union
 from dataclasses import dataclass, field
 
 import aiohttp
@@ -18,6 +23,7 @@ import aiohttp
 from src.tools.base import Tool, ToolDefinition, ToolCategory, ToolPhase, ToolParameter
 from src.tools.context import ToolExecutionContext
 from src.tools.http.debug_trace import (
+    LazyStr,
     build_var_snapshot,
     debug_enabled,
     extract_used_brace_vars,
@@ -25,8 +31,375 @@ from src.tools.http.debug_trace import (
     preview,
 )
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_PATH_SPLIT_RE = re.compile(r'\.(?![^\[]*\])')
+_ARRAY_RE = re.compile(r'^(\w+)\[(\d+)\]$')
+_REDACT_RE = re.compile(r'(api_key|apikey|key|token|auth|password)=([^&]+)', re.IGNORECASE)
+
+# `{name}` accepts any key the context can hold (e.g. "customer-id", "account.id");
+# quotes and whitespace are excluded so compact JSON like {"a":1} is not a token.
+_TOKEN_RE = re.compile(r'\$\{([A-Z_][A-Z0-9_]*)\}|\{([^{}\s"$]+)\}')
+
+PathPlan = Tuple[Tuple[str, Optional[int]], ...]
+TemplatePlan = List[Union[str, Tuple[str, str]]]
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_template(template: str) -> Tuple[Union[str, Tuple[str, str]], ...]:
+    """
+    Split a template into literal text and `("var", name)` / `("env", name)` tokens.
+    
+    `{name}` is a context/parameter variable and `${NAME}` an environment variable.
+    Memoized, so the result is an immutable tuple shared between callers.
+    """
+    plan: TemplatePlan = []
+    pos = 0
+    for match in _TOKEN_RE.finditer(template):
+        if match.start() > pos:
+            plan.append(template[pos:match.start()])
+        env_name, var_name = match.groups()
+        plan.append(("env", env_name) if env_name else ("var", var_name))
+        pos = match.end()
+    if pos < len(template):
+        plan.append(template[pos:])
+    return tuple(plan)
+
+
+def _prepare_template(template: str, *, resolve_env: bool = True) -> Union[str, TemplatePlan]:
+    """
+    Pre-compile a request template for repeated rendering.
+    
+    Returns the template itself when nothing needs substituting. With
+    `resolve_env`, `${ENV}` references that are set now are folded into the
+    literal text; unset ones stay as tokens and resolve per request.
+    """
+    if "{" not in template:
+        return template
+    plan: TemplatePlan = []
+    for token in _parse_template(template):
+        if token.__class__ is not str and token[0] == "env" and resolve_env:
+            value = os.environ.get(token[1])
+            if value is not None:
+                token = value
+        if token.__class__ is str and plan and plan[-1].__class__ is str:
+            plan[-1] += token
+        else:
+            plan.append(token)
+    if len(plan) == 1 and plan[0].__class__ is str:
+        return plan[0]
+    return plan
+
+
+def _render(template: Union[str, TemplatePlan], values: Dict[str, str]) -> str:
+    """Render a `_prepare_template` result (literals pass through untouched)."""
+    if template.__class__ is str:
+        return template
+    return _render_template(template, values)
+
+
+class _TemplateString:
+    """A JSON string (key or value) that contains placeholders."""
+    
+    __slots__ = ("plan",)
+    
+    def __init__(self, plan: TemplatePlan):
+        self.plan = plan
+
+
+def _compile_json_template(node: Any, *, resolve_env: bool = True) -> Any:
+    """Replace placeholder-bearing strings in a parsed JSON template with `_TemplateString`."""
+    if isinstance(node, str):
+        prepared = _prepare_template(node, resolve_env=resolve_env)
+        return prepared if prepared.__class__ is str else _TemplateString(prepared)
+    if isinstance(node, dict):
+        return {
+            _compile_json_template(k, resolve_env=resolve_env): _compile_json_template(v, resolve_env=resolve_env)
+            for k, v in node.items()
+        }
+    if isinstance(node, list):
+        return [_compile_json_template(v, resolve_env=resolve_env) for v in node]
+    return node
+
+
+def _render_json_template(node: Any, values: Dict[str, str]) -> Any:
+    """Build a fresh JSON object from a compiled template, rendering only placeholder strings."""
+    cls = node.__class__
+    if cls is _TemplateString:
+        return _render_template(node.plan, values)
+    if cls is dict:
+        return {
+            _render_json_template(k, values): _render_json_template(v, values)
+            for k, v in node.items()
+        }
+    if cls is list:
+        return [_render_json_template(v, values) for v in node]
+    return node
+
+
+def _render_template(plan: Sequence[Union[str, Tuple[str, str]]], values: Dict[str, str]) -> str:
+    """
+    Render a parsed template in one pass.
+    
+    Unknown `{name}` placeholders are kept verbatim (so literal JSON braces in
+    body templates survive); unset environment variables render as "".
+    """
+    parts: List[str] = []
+    append = parts.append
+    lookup = values.get
+    for token in plan:
+        if token.__class__ is str:
+            append(token)
+        elif token[0] == "var":
+            value = lookup(token[1])
+            append(value if value is not None else "{" + token[1] + "}")
+        else:
+            append(os.environ.get(token[1], ""))
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(path: str) -> PathPlan:
+    """Split a dot/array path ("items[0].name") into (field, index_or_None) segments (memoized)."""
+    if not path:
+        return ()
+    plan = []
+    for segment in _PATH_SPLIT_RE.split(path):
+        array_match = _ARRAY_RE.match(segment)
+        if array_match:
+            plan.append((array_match.group(1), int(array_match.group(2))))
+        else:
+            plan.append((segment, None))
+    return tuple(plan)
+
+
+async def _read_capped(content: aiohttp.StreamReader, max_bytes: int) -> bytearray:
+    """
+    Read a response body into one buffer, stopping past `max_bytes`.
+    
+    Returns at most `max_bytes + 1` bytes, so `len(result) > max_bytes` means
+    the body was too large. Each read asks for the whole remaining budget.
+    """
+    buf = bytearray()
+    limit = max_bytes + 1
+    while len(buf) < limit:
+        chunk = await content.read(limit - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def _json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Parse JSON from bytes or str (orjson when available).
+
+    Inputs orjson rejects but stdlib accepts (NaN, >64-bit ints) fall back to
+    `json.loads`, which raises `json.JSONDecodeError` for genuinely bad input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8", errors="replace")
+    return json.loads(data)
+
+
+def _json_dumps_bytes(value: Any) -> bytes:
+    """Serialize `value` to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            pass
+    return json.dumps(value).encode("utf-8")
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize `value` to a JSON string (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value)
+
+# One pooled session for every in-call HTTP tool: mid-call lookups reuse
+# keep-alive TCP/TLS connections and DNS results instead of paying a fresh
+# handshake per AI invocation. Bound to the loop that created it.
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_SHARED_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Return the shared in-call session, creating it for the running loop if needed."""
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP
+    # Creation is synchronous (no await), so no lock is needed to avoid
+    # building two sessions concurrently.
+    loop = asyncio.get_running_loop()
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed or _SHARED_SESSION_LOOP is not loop:
+        # Sized for many concurrent calls: a per-host cap keeps one slow API
+        # from starving the pool, and DNS results are cached for 5 minutes.
+        connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=32,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        _SHARED_SESSION = aiohttp.ClientSession(connector=connector, json_serialize=_json_dumps)
+        _SHARED_SESSION_LOOP = loop
+    return _SHARED_SESSION
+
+
+async def close_shared_session() -> None:
+    """Close the shared in-call session (call on engine shutdown)."""
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP
+    session = _SHARED_SESSION
+    _SHARED_SESSION = None
+    _SHARED_SESSION_LOOP = None
+    if session is not None and not session.closed:
+        await session.close()
+
+
+_BUILTIN_CONTEXT_VARS = frozenset(
+    ("caller_number", "called_number", "caller_name", "context_name", "call_id")
+)
+
+
+class _SubstitutionValues:
+    """
+    Read-only view over AI params, call context and pre-call results.
+    
+    Lookup order matches the historical merge: AI params override everything,
+    built-in call variables override pre-call results. Values are stringified
+    on lookup, so unreferenced params cost nothing.
+    """
+    
+    __slots__ = ("_ai_params", "_context", "_pre_call")
+    
+    def __init__(
+        self,
+        ai_params: Dict[str, Any],
+        context: ToolExecutionContext,
+        pre_call_results: Dict[str, Any],
+    ):
+        self._ai_params = ai_params
+        self._context = context
+        self._pre_call = pre_call_results
+    
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        if name in self._ai_params:
+            value = self._ai_params[name]
+        elif name in _BUILTIN_CONTEXT_VARS:
+            value = getattr(self._context, name, None)
+        elif name in self._pre_call:
+            value = self._pre_call[name]
+        else:
+            return default
+        return str(value) if value is not None else ""
+    
+    def __getitem__(self, name: str) -> str:
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+    
+    def __contains__(self, name: object) -> bool:
+        return (
+            name in self._ai_params
+            or name in _BUILTIN_CONTEXT_VARS
+            or name in self._pre_call
+        )
+
+
+_RESULT_CACHE_MAX_ENTRIES = 256
+
+_COMPRESS_MODES = ("auto", "identity", "gzip")
+
+# Pre-call results are written once when the call starts, so in-call tools
+# read them from the session store once per call rather than per invocation.
+# The engine invalidates an entry when pre-call tools write and on cleanup.
+_PRE_CALL_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_PRE_CALL_CACHE_MAX_ENTRIES = 1024
+
+
+def invalidate_pre_call_cache(call_id: Optional[str] = None) -> None:
+    """Forget cached pre-call results for `call_id` (or for every call)."""
+    if call_id is None:
+        _PRE_CALL_CACHE.clear()
+    else:
+        _PRE_CALL_CACHE.pop(call_id, None)
+
+_BATCH_WINDOW_S = 0.015
+_BATCH_MAX_SIZE = 8
+_BATCH_TASKS: Set["asyncio.Task[None]"] = set()
+
+
+class _BatchError(aiohttp.ClientError):
+    """A batched request failed as a whole (bad status, size, or shape)."""
+
+
+class _BatchCoalescer:
+    """
+    Collect concurrent invocations of one tool and send them as a single POST.
+    
+    Requests sharing a resolved URL and headers are held for a short window
+    (or until the batch is full), sent together, and each caller receives
+    its own `results[i]`. A batch failure is raised to every caller.
+    """
+    
+    def __init__(self, tool: "InCallHTTPTool"):
+        self._tool = tool
+        self._pending: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], List[Tuple[Any, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], asyncio.TimerHandle] = {}
+    
+    async def submit(self, url: str, headers: Mapping[str, str], item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (url, tuple(sorted(headers.items())))
+        batch = self._pending.setdefault(key, [])
+        if not batch:
+            self._timers[key] = loop.call_later(_BATCH_WINDOW_S, self._flush, key)
+        batch.append((item, future))
+        if len(batch) >= _BATCH_MAX_SIZE:
+            self._flush(key)
+        return await future
+    
+    def _flush(self, key: Tuple[str, Tuple[Tuple[str, str], ...]]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._send(key, batch))
+            _BATCH_TASKS.add(task)
+            task.add_done_callback(_BATCH_TASKS.discard)
+    
+    async def _send(
+        self,
+        key: Tuple[str, Tuple[Tuple[str, str], ...]],
+        batch: List[Tuple[Any, asyncio.Future]],
+    ) -> None:
+        url, header_items = key
+        try:
+            results = await self._tool._post_batch(url, dict(header_items), [item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
 
 @dataclass
 class InCallHTTPConfig:
@@ -48,6 +421,9 @@ class InCallHTTPConfig:
     query_params: Dict[str, str] = field(default_factory=dict)
     body_template: Optional[str] = None
     
+    # Resolve ${ENV} per request instead of once at load (for rotating secrets)
+    defer_env: bool = False
+    
     # AI-provided parameters (registered with provider for function calling)
     parameters: List[Dict[str, Any]] = field(default_factory=list)
     
@@ -58,8 +434,36 @@ class InCallHTTPConfig:
     # Response limits
     max_response_size_bytes: int = 65536  # 64KB max
     
+    # Response compression: "auto" (aiohttp default), "identity" (request
+    # uncompressed bodies, no decompression), or "gzip"
+    compress: str = "auto"
+    
+    # Response cache: reuse a successful result for identical requests made
+    # within this window (0 disables). Useful when the AI re-asks a lookup.
+    cache_ttl_ms: int = 0
+    
+    # Share one upstream call between identical concurrent requests
+    coalesce: bool = False
+    
+    # Batching: coalesce concurrent invocations into one POST {"batch": [...]}
+    # answered by {"results": [...]} (endpoint must support this contract)
+    batch_endpoint: bool = False
+    
     # Error handling
     error_message: str = "I'm sorry, I couldn't retrieve that information right now."
+    
+    def __post_init__(self):
+        """Validate limits up front so misconfiguration fails at load time."""
+        try:
+            max_bytes = int(self.max_response_size_bytes)
+        except (TypeError, ValueError):
+            max_bytes = 0
+        if max_bytes <= 0:
+            raise ValueError(
+                f"In-call HTTP tool {self.name}: max_response_size_bytes must be a positive integer "
+                f"(got {self.max_response_size_bytes!r})"
+            )
+        self.max_response_size_bytes = max_bytes
 
 
 class InCallHTTPTool(Tool):
@@ -103,12 +507,14 @@ class InCallHTTPTool(Tool):
           available: "available"
           next_available_slot: "next_slot"
         return_raw_json: false
+        compress: identity  # JSON API sends plain bodies; skip gzip negotiation
         error_message: "I couldn't check the appointment availability. Would you like me to try again?"
     ```
     """
     
     def __init__(self, config: InCallHTTPConfig):
         self.config = config
+        self._max_bytes: int = config.max_response_size_bytes
         
         # Convert config parameters to ToolParameter objects
         tool_params = []
@@ -133,6 +539,113 @@ class InCallHTTPTool(Tool):
             hold_audio_file=config.hold_audio_file,
             hold_audio_threshold_ms=config.hold_audio_threshold_ms,
         )
+        
+        # `connect` covers waiting for a pooled connection plus the TCP/TLS
+        # handshake, so a saturated pool fails fast instead of silently
+        # eating the whole budget; `sock_read` bounds stalls between reads.
+        total_s = config.timeout_ms / 1000.0
+        self._timeout = aiohttp.ClientTimeout(
+            total=total_s,
+            connect=min(2.0, total_s / 2),
+            sock_read=total_s,
+        )
+        
+        # Request templates are config-fixed: tokenize them once, not per call.
+        # Static templates stay plain strings; ${ENV} values are folded in
+        # now unless defer_env is set (e.g. secrets rotated while running).
+        resolve_env = not config.defer_env
+        self._url_tpl = _prepare_template(config.url or "", resolve_env=resolve_env)
+        self._header_tpls = {
+            k: _prepare_template(v, resolve_env=resolve_env) for k, v in config.headers.items()
+        }
+        self._query_tpls = {
+            k: _prepare_template(v, resolve_env=resolve_env) for k, v in config.query_params.items()
+        }
+        self._body_tpl = (
+            _prepare_template(config.body_template, resolve_env=resolve_env)
+            if config.body_template else None
+        )
+        # A body template that is itself valid JSON is parsed once into a
+        # tree; requests then render only its placeholder strings and
+        # serialize once, skipping the render -> parse -> serialize trip.
+        self._body_tree: Any = None
+        if config.body_template:
+            try:
+                parsed = json.loads(config.body_template)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(parsed, (dict, list)):
+                    self._body_tree = _compile_json_template(parsed, resolve_env=resolve_env)
+        
+        # Response compression: "identity" asks for plain bodies and skips
+        # aiohttp's zlib step; "gzip" asks for gzip; "auto" leaves aiohttp's
+        # default negotiation alone. An explicit Accept-Encoding header wins.
+        compress = (config.compress or "auto").strip().lower()
+        if compress not in _COMPRESS_MODES:
+            logger.warning(
+                f"Unknown compress mode for in-call HTTP tool {config.name}: {config.compress!r}; using 'auto'"
+            )
+            compress = "auto"
+        self._auto_decompress = compress != "identity"
+        if compress != "auto" and not any(k.lower() == "accept-encoding" for k in self._header_tpls):
+            self._header_tpls["Accept-Encoding"] = compress
+        
+        # Fully static headers/params are built once and shared read-only
+        # across requests (aiohttp copies them into its own structures).
+        self._static_headers: Optional[Mapping[str, str]] = (
+            MappingProxyType(dict(self._header_tpls))
+            if all(tpl.__class__ is str for tpl in self._header_tpls.values()) else None
+        )
+        self._static_query_params: Optional[Mapping[str, str]] = (
+            MappingProxyType(dict(self._query_tpls))
+            if all(tpl.__class__ is str for tpl in self._query_tpls.values()) else None
+        )
+        
+        # Referenced variable names for debug traces (config-fixed).
+        trace_templates = (
+            config.url,
+            *(config.headers or {}).values(),
+            *(config.query_params or {}).values(),
+            config.body_template,
+        )
+        self._used_brace = extract_used_brace_vars(*trace_templates)
+        self._used_env = extract_used_env_vars(*trace_templates)
+        
+        # Pre-call results live in the session store; only fetch them when a
+        # template references a name that built-ins/AI params cannot supply.
+        param_names = {p.get('name') for p in config.parameters}
+        template_vars = {
+            token[1]
+            for tpl in (self._url_tpl, *self._header_tpls.values(), *self._query_tpls.values(), self._body_tpl)
+            if tpl is not None and tpl.__class__ is not str
+            for token in tpl
+            if token.__class__ is not str and token[0] == "var"
+        }
+        self._needs_pre_call = any(
+            name not in _BUILTIN_CONTEXT_VARS and name not in param_names
+            for name in template_vars
+        )
+        
+        self._cache: Optional["OrderedDict[bytes, Tuple[float, Dict[str, Any]]]"] = (
+            OrderedDict() if config.cache_ttl_ms > 0 else None
+        )
+        
+        # Single-flight: identical concurrent requests share one upstream call
+        self._inflight: Optional[Dict[bytes, "asyncio.Future[Dict[str, Any]]"]] = (
+            {} if config.coalesce else None
+        )
+        
+        self._batcher = _BatchCoalescer(self) if config.batch_endpoint else None
+        
+        # Output paths are config-fixed: split them once, not per response.
+        self._output_plans: List[Tuple[str, PathPlan]] = [
+            (var_name, _compile_path(path))
+            for var_name, path in config.output_variables.items()
+        ]
+        self._readable_keys: Dict[str, str] = {
+            k: k.replace('_', ' ').title() for k in config.output_variables
+        }
     
     @property
     def definition(self) -> ToolDefinition:
@@ -173,54 +686,53 @@ class InCallHTTPTool(Tool):
         try:
             started = time.monotonic()
             # Build substitution context (context vars + pre-call results + AI params)
-            sub_context = await self._build_substitution_context(parameters, context)
+            sub_context = await self._build_substitution_context(
+                parameters, context, include_pre_call=self._needs_pre_call
+            )
             
             # Build request
-            url = self._substitute_variables(self.config.url, sub_context)
-            headers = {
-                k: self._substitute_variables(v, sub_context)
-                for k, v in self.config.headers.items()
-            }
-            query_params = {
-                k: self._substitute_variables(v, sub_context)
-                for k, v in self.config.query_params.items()
-            }
+            url = _render(self._url_tpl, sub_context)
+            if self._static_headers is not None:
+                headers = self._static_headers
+            else:
+                headers = {
+                    k: _render(tpl, sub_context)
+                    for k, tpl in self._header_tpls.items()
+                }
+            if self._static_query_params is not None:
+                query_params = self._static_query_params
+            else:
+                query_params = {
+                    k: _render(tpl, sub_context)
+                    for k, tpl in self._query_tpls.items()
+                }
             
             body = None
             json_body = None
-            if self.config.body_template:
-                body_str = self._substitute_variables(self.config.body_template, sub_context)
+            if self._body_tree is not None:
+                json_body = _render_json_template(self._body_tree, sub_context)
+            elif self._body_tpl is not None:
+                body_str = _render(self._body_tpl, sub_context)
                 # Try to parse as JSON for proper Content-Type handling
                 try:
-                    json_body = json.loads(body_str)
+                    json_body = _json_loads(body_str)
                 except json.JSONDecodeError:
                     body = body_str
 
             if debug_enabled(logger):
-                used_brace = extract_used_brace_vars(
-                    self.config.url,
-                    *(self.config.headers or {}).values(),
-                    *(self.config.query_params or {}).values(),
-                    self.config.body_template,
-                )
-                used_env = extract_used_env_vars(
-                    self.config.url,
-                    *(self.config.headers or {}).values(),
-                    *(self.config.query_params or {}).values(),
-                    self.config.body_template,
-                )
                 logger.debug(
                     "[HTTP_TOOL_TRACE] request_resolved in_call tool=%s method=%s url=%s headers=%s params=%s body=%s json_body=%s vars=%s call_id=%s",
                     self.config.name,
                     self.config.method,
                     url,
-                    headers,
-                    query_params,
-                    preview(body),
-                    preview(json.dumps(json_body)) if json_body is not None else "",
-                    build_var_snapshot(
-                        used_brace_vars=used_brace,
-                        used_env_vars=used_env,
+                    dict(headers),
+                    dict(query_params),
+                    LazyStr(preview, body),
+                    LazyStr(preview, LazyStr(_json_dumps, json_body)) if json_body is not None else "",
+                    LazyStr(
+                        build_var_snapshot,
+                        used_brace_vars=self._used_brace,
+                        used_env_vars=self._used_env,
                         values=sub_context,
                         env=os.environ,
                     ),
@@ -236,191 +748,45 @@ class InCallHTTPTool(Tool):
                 }
             )
             
-            # Make request
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout_ms / 1000.0)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                request_kwargs = {
-                    "method": self.config.method,
-                    "url": url,
-                    "headers": headers,
-                    "params": query_params if query_params else None,
+            result_key = (
+                self._request_key(url, headers, query_params, json_body, body)
+                if self._cache is not None or self._inflight is not None else None
+            )
+            if self._cache is not None:
+                cached = self._cache_get(result_key)
+                if cached is not None:
+                    logger.debug(f"In-call HTTP tool cache hit: {self.config.name}")
+                    return cached
+            
+            if self._inflight is not None:
+                pending = self._inflight.get(result_key)
+                if pending is not None:
+                    logger.debug(f"In-call HTTP tool coalesced duplicate request: {self.config.name}")
+                    return dict(await asyncio.shield(pending))
+                done = asyncio.get_running_loop().create_future()
+                self._inflight[result_key] = done
+                # Waiters share the leader's outcome; a raised error reaches
+                # them as the tool's error result.
+                result = {
+                    "status": "error",
+                    "message": self.config.error_message,
                 }
-                
-                if json_body is not None:
-                    request_kwargs["json"] = json_body
-                elif body is not None:
-                    request_kwargs["data"] = body
-                
-                async with session.request(**request_kwargs) as response:
-                    # Check response size
-                    content_length = response.headers.get('Content-Length')
-                    if content_length and int(content_length) > self.config.max_response_size_bytes:
-                        logger.warning(
-                            f"Response too large: {self.config.name}",
-                            extra={"size": content_length, "max": self.config.max_response_size_bytes}
-                        )
-                        return {
-                            "status": "error",
-                            "message": self.config.error_message,
-                        }
-                    
-                    if response.status != 200:
-                        logger.warning(
-                            f"In-call HTTP tool returned non-200: {self.config.name}",
-                            extra={"status": response.status, "call_id": context.call_id}
-                        )
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            body_preview = ""
-                            try:
-                                body_preview = preview(await response.text())
-                            except Exception as e:
-                                body_preview = f"<failed to read body: {e}>"
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] response_non_200 in_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
-                                self.config.name,
-                                response.status,
-                                elapsed_ms,
-                                body_preview,
-                                context.call_id,
-                            )
-                        return {
-                            "status": "failed",
-                            "message": self.config.error_message,
-                        }
-                    
-                    # Read body with enforced size limit (do not trust Content-Length header).
-                    body_bytes = b""
-                    try:
-                        max_bytes = int(self.config.max_response_size_bytes or 0)
-                        if max_bytes <= 0:
-                            logger.warning(
-                                "Invalid max_response_size_bytes for %s: %s",
-                                self.config.name,
-                                self.config.max_response_size_bytes,
-                            )
-                            return {
-                                "status": "error",
-                                "message": self.config.error_message,
-                            }
-
-                        total = 0
-                        chunks: list[bytes] = []
-                        async for chunk in response.content.iter_chunked(8192):
-                            if not chunk:
-                                continue
-                            total += len(chunk)
-                            if total > max_bytes:
-                                logger.warning(
-                                    "Response too large: %s max=%s",
-                                    self.config.name,
-                                    max_bytes,
-                                )
-                                if debug_enabled(logger):
-                                    elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                                    logger.debug(
-                                        "[HTTP_TOOL_TRACE] response_too_large in_call tool=%s status=%s elapsed_ms=%s body_len=%s max=%s call_id=%s",
-                                        self.config.name,
-                                        getattr(response, "status", None),
-                                        elapsed_ms,
-                                        total,
-                                        max_bytes,
-                                        context.call_id,
-                                    )
-                                return {
-                                    "status": "error",
-                                    "message": self.config.error_message,
-                                }
-                            chunks.append(chunk)
-
-                        body_bytes = b"".join(chunks)
-                        charset = getattr(response, "charset", None) or "utf-8"
-                        body_text = body_bytes.decode(charset, errors="replace")
-                        data = json.loads(body_text)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse JSON response: {self.config.name} error={e}")
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] response_invalid_json in_call tool=%s elapsed_ms=%s body_len=%s body_preview=%s call_id=%s error=%s",
-                                self.config.name,
-                                elapsed_ms,
-                                len(body_bytes or b""),
-                                preview(body_bytes),
-                                context.call_id,
-                                str(e),
-                            )
-                        return {
-                            "status": "error",
-                            "message": self.config.error_message,
-                        }
-                    except Exception as e:
-                        logger.warning(f"Failed to read response: {self.config.name} error={e}")
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] response_read_failed in_call tool=%s status=%s elapsed_ms=%s error=%s body_len=%s body_preview=%s call_id=%s",
-                                self.config.name,
-                                getattr(response, "status", None),
-                                elapsed_ms,
-                                str(e),
-                                len(body_bytes or b""),
-                                preview(body_bytes),
-                                context.call_id,
-                            )
-                        return {
-                            "status": "error",
-                            "message": self.config.error_message,
-                        }
-
-                    if debug_enabled(logger):
-                        elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                        logger.debug(
-                            "[HTTP_TOOL_TRACE] response_ok in_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
-                            self.config.name,
-                            response.status,
-                            elapsed_ms,
-                            preview(body_text),
-                            context.call_id,
-                        )
-                    
-                    # Build result
-                    result = {
-                        "status": "success",
-                    }
-                    
-                    if self.config.return_raw_json:
-                        # Return full JSON to AI
-                        result["data"] = data
-                        result["message"] = f"Retrieved data successfully."
-                    else:
-                        # Extract output variables
-                        extracted = self._extract_output_variables(data)
-                        result["data"] = extracted
-                        # Build human-readable message
-                        result["message"] = self._build_result_message(extracted)
-
-                        if debug_enabled(logger):
-                            elapsed_ms = round((time.monotonic() - started) * 1000, 2)
-                            logger.debug(
-                                "[HTTP_TOOL_TRACE] outputs in_call tool=%s elapsed_ms=%s outputs=%s call_id=%s",
-                                self.config.name,
-                                elapsed_ms,
-                                extracted,
-                                context.call_id,
-                            )
-                    
-                    logger.info(
-                        f"In-call HTTP tool completed: {self.config.name}",
-                        extra={
-                            "status": response.status,
-                            "call_id": context.call_id,
-                            "output_keys": list(result.get("data", {}).keys()),
-                        }
+                try:
+                    result = await self._perform_request(
+                        url, headers, query_params, json_body, body, context, started
                     )
-                    
-                    return result
-        
+                finally:
+                    self._inflight.pop(result_key, None)
+                    done.set_result(result)
+            else:
+                result = await self._perform_request(
+                    url, headers, query_params, json_body, body, context, started
+                )
+            
+            if self._cache is not None and result.get("status") == "success":
+                self._cache_put(result_key, result)
+            return result
+    
         except aiohttp.ClientError as e:
             logger.warning(f"In-call HTTP tool request failed: {self.config.name} error={e}")
             return {
@@ -434,11 +800,309 @@ class InCallHTTPTool(Tool):
                 "message": self.config.error_message,
             }
     
+    def _request_key(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        query_params: Mapping[str, str],
+        json_body: Any,
+        body: Optional[str],
+    ) -> bytes:
+        """Digest of everything that makes up a resolved request."""
+        if json_body is not None:
+            body_bytes = _json_dumps(json_body).encode("utf-8")
+        else:
+            body_bytes = (body or "").encode("utf-8")
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            url.encode("utf-8"),
+            self.config.method.encode("utf-8"),
+            body_bytes,
+            _json_dumps(sorted(query_params.items())).encode("utf-8"),
+            _json_dumps(sorted(headers.items())).encode("utf-8"),
+        ):
+            digest.update(part)
+            digest.update(b"\0")
+        return digest.digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return dict(result)
+    
+    def _cache_put(self, key: bytes, result: Dict[str, Any]) -> None:
+        self._cache[key] = (time.monotonic() + self.config.cache_ttl_ms / 1000.0, dict(result))
+        self._cache.move_to_end(key)
+        while len(self._cache) > _RESULT_CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+    
+    async def _perform_request(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        query_params: Mapping[str, str],
+        json_body: Any,
+        body: Optional[str],
+        context: ToolExecutionContext,
+        started: float,
+    ) -> Dict[str, Any]:
+        """Send the resolved request and turn the response into a tool result."""
+        if self._batcher is not None:
+            data = await self._batcher.submit(
+                url,
+                headers,
+                json_body if json_body is not None else dict(query_params),
+            )
+            return self._build_result(data, 200, context, started)
+        
+        if json_body is not None and not any(k.lower() == "content-type" for k in headers):
+            headers = {**headers, "Content-Type": "application/json"}
+        
+        # Make request (shared pooled session, per-tool timeout)
+        session = _get_shared_session()
+        request_kwargs = {
+            "method": self.config.method,
+            "url": url,
+            "headers": headers,
+            "params": query_params if query_params else None,
+            "timeout": self._timeout,
+        }
+        if not self._auto_decompress:
+            request_kwargs["auto_decompress"] = False
+        
+        if json_body is not None:
+            request_kwargs["data"] = _json_dumps_bytes(json_body)
+        elif body is not None:
+            request_kwargs["data"] = body
+        
+        async with session.request(**request_kwargs) as response:
+            # Check response size
+            content_length = response.headers.get('Content-Length')
+            if content_length and int(content_length) > self._max_bytes:
+                logger.warning(
+                    f"Response too large: {self.config.name}",
+                    extra={"size": content_length, "max": self._max_bytes}
+                )
+                return {
+                    "status": "error",
+                    "message": self.config.error_message,
+                }
+            
+            if response.status != 200:
+                logger.warning(
+                    f"In-call HTTP tool returned non-200: {self.config.name}",
+                    extra={"status": response.status, "call_id": context.call_id}
+                )
+                if debug_enabled(logger):
+                    elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                    body_preview = ""
+                    try:
+                        body_preview = preview(await response.text())
+                    except Exception as e:
+                        body_preview = f"<failed to read body: {e}>"
+                    logger.debug(
+                        "[HTTP_TOOL_TRACE] response_non_200 in_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
+                        self.config.name,
+                        response.status,
+                        elapsed_ms,
+                        body_preview,
+                        context.call_id,
+                    )
+                return {
+                    "status": "failed",
+                    "message": self.config.error_message,
+                }
+            
+            # Read body with enforced size limit (do not trust Content-Length header).
+            # The body lands in one contiguous buffer that is parsed in
+            # place: no chunk list, join copy, or decoded str.
+            body_bytes = bytearray()
+            max_bytes = self._max_bytes
+            try:
+                # Hard-cap body time to what is left of the tool's budget so a
+                # drip-feeding server cannot stall the conversation turn.
+                remaining = max(0.05, self.config.timeout_ms / 1000.0 - (time.monotonic() - started))
+                body_bytes = await asyncio.wait_for(
+                    _read_capped(response.content, max_bytes), timeout=remaining
+                )
+                if len(body_bytes) > max_bytes:
+                    logger.warning(
+                        "Response too large: %s max=%s",
+                        self.config.name,
+                        max_bytes,
+                    )
+                    if debug_enabled(logger):
+                        elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                        logger.debug(
+                            "[HTTP_TOOL_TRACE] response_too_large in_call tool=%s status=%s elapsed_ms=%s body_len=%s max=%s call_id=%s",
+                            self.config.name,
+                            getattr(response, "status", None),
+                            elapsed_ms,
+                            len(body_bytes),
+                            max_bytes,
+                            context.call_id,
+                        )
+                    return {
+                        "status": "error",
+                        "message": self.config.error_message,
+                    }
+
+                charset = (getattr(response, "charset", None) or "utf-8").lower()
+                if charset in ("utf-8", "utf8"):
+                    # Parse the UTF-8 buffer directly; no str intermediate.
+                    data = _json_loads(body_bytes)
+                else:
+                    data = _json_loads(body_bytes.decode(charset, errors="replace"))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse JSON response: {self.config.name} error={e}")
+                if debug_enabled(logger):
+                    elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                    logger.debug(
+                        "[HTTP_TOOL_TRACE] response_invalid_json in_call tool=%s elapsed_ms=%s body_len=%s body_preview=%s call_id=%s error=%s",
+                        self.config.name,
+                        elapsed_ms,
+                        len(body_bytes or b""),
+                        preview(body_bytes),
+                        context.call_id,
+                        str(e),
+                    )
+                return {
+                    "status": "error",
+                    "message": self.config.error_message,
+                }
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"In-call HTTP tool response body timed out: {self.config.name} "
+                    f"timeout_ms={self.config.timeout_ms}"
+                )
+                return {
+                    "status": "error",
+                    "message": self.config.error_message,
+                }
+            except Exception as e:
+                logger.warning(f"Failed to read response: {self.config.name} error={e}")
+                if debug_enabled(logger):
+                    elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                    logger.debug(
+                        "[HTTP_TOOL_TRACE] response_read_failed in_call tool=%s status=%s elapsed_ms=%s error=%s body_len=%s body_preview=%s call_id=%s",
+                        self.config.name,
+                        getattr(response, "status", None),
+                        elapsed_ms,
+                        str(e),
+                        len(body_bytes or b""),
+                        preview(body_bytes),
+                        context.call_id,
+                    )
+                return {
+                    "status": "error",
+                    "message": self.config.error_message,
+                }
+
+            if debug_enabled(logger):
+                elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                logger.debug(
+                    "[HTTP_TOOL_TRACE] response_ok in_call tool=%s status=%s elapsed_ms=%s body_preview=%s call_id=%s",
+                    self.config.name,
+                    response.status,
+                    elapsed_ms,
+                    preview(body_bytes),
+                    context.call_id,
+                )
+            
+            return self._build_result(data, response.status, context, started)
+    
+    def _build_result(
+        self,
+        data: Any,
+        status: int,
+        context: ToolExecutionContext,
+        started: float,
+    ) -> Dict[str, Any]:
+        """Turn parsed response JSON into the tool result returned to the AI."""
+        result = {
+            "status": "success",
+        }
+        
+        if self.config.return_raw_json:
+            # Return full JSON to AI
+            result["data"] = data
+            result["message"] = f"Retrieved data successfully."
+        else:
+            # Extract output variables
+            extracted = self._extract_output_variables(data)
+            result["data"] = extracted
+            # Build human-readable message
+            result["message"] = self._build_result_message(extracted)
+
+            if debug_enabled(logger):
+                elapsed_ms = round((time.monotonic() - started) * 1000, 2)
+                logger.debug(
+                    "[HTTP_TOOL_TRACE] outputs in_call tool=%s elapsed_ms=%s outputs=%s call_id=%s",
+                    self.config.name,
+                    elapsed_ms,
+                    extracted,
+                    context.call_id,
+                )
+        
+        logger.info(
+            f"In-call HTTP tool completed: {self.config.name}",
+            extra={
+                "status": status,
+                "call_id": context.call_id,
+                "output_keys": list(result.get("data", {}).keys()),
+            }
+        )
+        
+        return result
+    
+    async def _post_batch(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        items: List[Any],
+    ) -> List[Any]:
+        """
+        POST `{"batch": items}` to a batch-capable endpoint.
+        
+        The endpoint must answer 200 with `{"results": [...]}` holding one
+        entry per item, in order.
+        """
+        session = _get_shared_session()
+        max_bytes = self._max_bytes * len(items)
+        async with session.post(
+            url,
+            headers=headers,
+            json={"batch": items},
+            timeout=self._timeout,
+            auto_decompress=self._auto_decompress,
+        ) as response:
+            if response.status != 200:
+                raise _BatchError(f"batch endpoint returned status {response.status}")
+            body_bytes = await _read_capped(response.content, max_bytes)
+            if len(body_bytes) > max_bytes:
+                raise _BatchError(f"batch response exceeds {max_bytes} bytes")
+        try:
+            data = _json_loads(body_bytes)
+        except json.JSONDecodeError as e:
+            raise _BatchError(f"batch response is not valid JSON: {e}") from e
+        results = data.get("results") if isinstance(data, dict) else None
+        if not isinstance(results, list) or len(results) != len(items):
+            raise _BatchError("batch response must contain one result per request")
+        return results
+    
     async def _build_substitution_context(
         self,
         ai_params: Dict[str, Any],
-        context: ToolExecutionContext
-    ) -> Dict[str, str]:
+        context: ToolExecutionContext,
+        *,
+        include_pre_call: bool = True,
+    ) -> "_SubstitutionValues":
         """
         Build combined substitution context from call context, pre-call results, and AI parameters.
         
@@ -448,29 +1112,30 @@ class InCallHTTPTool(Tool):
         
         Pre-call variables (from pre-call HTTP lookups):
         - Any variables fetched by pre-call tools (e.g., customer_name, account_id)
+        - Skipped (no session store lookup) when `include_pre_call` is False
         
         AI parameters (provided by AI during function call):
         - Whatever parameters are defined in the tool config
+        
+        Values are converted to strings only when a template looks them up.
         """
-        sub = {
-            "caller_number": context.caller_number or "",
-            "called_number": context.called_number or "",
-            "caller_name": context.caller_name or "",
-            "context_name": context.context_name or "",
-            "call_id": context.call_id or "",
-        }
+        pre_call_results: Dict[str, Any] = {}
         
         # Add pre-call tool results (fetched before call started)
         # These are stored in session.pre_call_results by pre-call HTTP lookup tools
         try:
-            if context.session_store:
+            cached = _PRE_CALL_CACHE.get(context.call_id) if include_pre_call else None
+            if cached is not None:
+                _PRE_CALL_CACHE.move_to_end(context.call_id)
+                pre_call_results = cached
+            elif include_pre_call and context.session_store:
                 session = await context.session_store.get_by_call_id(context.call_id)
                 if session:
                     pre_call_results = getattr(session, 'pre_call_results', None) or {}
-                    for key, value in pre_call_results.items():
-                        # Don't override built-in context variables
-                        if key not in sub:
-                            sub[key] = str(value) if value is not None else ""
+                    if context.call_id:
+                        _PRE_CALL_CACHE[context.call_id] = pre_call_results
+                        while len(_PRE_CALL_CACHE) > _PRE_CALL_CACHE_MAX_ENTRIES:
+                            _PRE_CALL_CACHE.popitem(last=False)
                     if pre_call_results:
                         logger.debug(
                             f"Added pre-call variables to in-call tool context: {list(pre_call_results.keys())}",
@@ -479,14 +1144,7 @@ class InCallHTTPTool(Tool):
         except Exception as e:
             logger.warning(f"Failed to load pre-call results for in-call tool: {e}")
         
-        # Add AI-provided parameters (these override pre-call vars if same name)
-        for key, value in ai_params.items():
-            if value is not None:
-                sub[key] = str(value)
-            else:
-                sub[key] = ""
-        
-        return sub
+        return _SubstitutionValues(ai_params, context, pre_call_results)
     
     def _substitute_variables(self, template: str, context: Dict[str, str]) -> str:
         """
@@ -496,21 +1154,7 @@ class InCallHTTPTool(Tool):
         - {variable} - Context or AI parameter
         - ${ENV_VAR} - Environment variable
         """
-        result = template
-        
-        # Context/parameter variables: {var_name}
-        for key, value in context.items():
-            result = result.replace(f"{{{key}}}", value)
-        
-        # Environment variables: ${VAR_NAME}
-        env_pattern = r'\$\{([A-Z_][A-Z0-9_]*)\}'
-        def env_replacer(match):
-            var_name = match.group(1)
-            return os.environ.get(var_name, "")
-        
-        result = re.sub(env_pattern, env_replacer, result)
-        
-        return result
+        return _render_template(_parse_template(template), context)
     
     def _extract_output_variables(self, data: Any) -> Dict[str, Any]:
         """
@@ -518,13 +1162,13 @@ class InCallHTTPTool(Tool):
         """
         results = {}
         
-        for var_name, path in self.config.output_variables.items():
-            try:
-                value = self._extract_path(data, path)
-                results[var_name] = value if value is not None else ""
-            except Exception as e:
-                logger.debug(f"Failed to extract variable {var_name}: {e}")
-                results[var_name] = ""
+        walk = self._walk_path
+        for var_name, plan in self._output_plans:
+            value = walk(data, plan)
+            if value is None:
+                logger.debug("Output variable %s not found in response", var_name)
+                value = ""
+            results[var_name] = value
         
         return results
     
@@ -537,37 +1181,18 @@ class InCallHTTPTool(Tool):
         - "contact.email" -> data["contact"]["email"]
         - "items[0].name" -> data["items"][0]["name"]
         """
-        if not path:
-            return data
-        
+        return self._walk_path(data, _compile_path(path))
+    
+    @staticmethod
+    def _walk_path(data: Any, plan: PathPlan) -> Any:
+        """Follow pre-split path segments through nested dicts/lists (never raises)."""
         current = data
-        segments = re.split(r'\.(?![^\[]*\])', path)
-        
-        for segment in segments:
+        for field_name, index in plan:
+            current = current.get(field_name) if isinstance(current, dict) else None
+            if index is not None:
+                current = current[index] if isinstance(current, list) and index < len(current) else None
             if current is None:
                 return None
-            
-            # Check for array access: field[index]
-            array_match = re.match(r'^(\w+)\[(\d+)\]$', segment)
-            if array_match:
-                field_name = array_match.group(1)
-                index = int(array_match.group(2))
-                
-                if isinstance(current, dict) and field_name in current:
-                    arr = current[field_name]
-                    if isinstance(arr, list) and len(arr) > index:
-                        current = arr[index]
-                    else:
-                        return None
-                else:
-                    return None
-            else:
-                # Simple field access
-                if isinstance(current, dict) and segment in current:
-                    current = current[segment]
-                else:
-                    return None
-        
         return current
     
     def _build_result_message(self, data: Dict[str, Any]) -> str:
@@ -578,11 +1203,12 @@ class InCallHTTPTool(Tool):
             return "No data retrieved."
         
         # Simple key-value format
-        parts = []
-        for key, value in data.items():
-            if value:
-                readable_key = key.replace('_', ' ').title()
-                parts.append(f"{readable_key}: {value}")
+        readable_keys = self._readable_keys
+        parts = [
+            f"{readable_keys.get(key) or key.replace('_', ' ').title()}: {value}"
+            for key, value in data.items()
+            if value
+        ]
         
         if parts:
             return "Retrieved: " + ", ".join(parts)
@@ -590,13 +1216,7 @@ class InCallHTTPTool(Tool):
     
     def _redact_url(self, url: str) -> str:
         """Redact sensitive parts of URL for logging."""
-        redacted = re.sub(
-            r'(api_key|apikey|key|token|auth|password)=([^&]+)',
-            r'\1=***',
-            url,
-            flags=re.IGNORECASE
-        )
-        return redacted
+        return _REDACT_RE.sub(r'\1=***', url)
 
 
 def create_in_call_http_tool(name: str, config_dict: Dict[str, Any]) -> InCallHTTPTool:
@@ -623,10 +1243,15 @@ def create_in_call_http_tool(name: str, config_dict: Dict[str, Any]) -> InCallHT
         headers=config_dict.get('headers', {}),
         query_params=config_dict.get('query_params', {}),
         body_template=config_dict.get('body_template'),
+        defer_env=config_dict.get('defer_env', False),
         parameters=config_dict.get('parameters', []),
         output_variables=config_dict.get('output_variables', {}),
         return_raw_json=config_dict.get('return_raw_json', False),
         max_response_size_bytes=config_dict.get('max_response_size_bytes', 65536),
+        compress=config_dict.get('compress', 'auto'),
+        cache_ttl_ms=config_dict.get('cache_ttl_ms', 0),
+        coalesce=config_dict.get('coalesce', False),
+        batch_endpoint=config_dict.get('batch_endpoint', False),
         error_message=config_dict.get('error_message', "I'm sorry, I couldn't retrieve that information right now."),
     )
     
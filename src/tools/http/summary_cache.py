@@ -0,0 +1,211 @@
+"""
+Summary cache for post-call webhook tools.
+
+Generated call summaries are keyed by a hash of the transcript and the summary
+settings, so a repeated transcript skips the LLM round-trip. The `memory`
+backend is per-process; `sqlite` and `redis` are shared across workers.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as redis_asyncio  # type: ignore
+except ImportError:  # pragma: no cover
+    redis_asyncio = None
+
+
+DEFAULT_SQLITE_PATH = "/app/data/webhook_summary_cache.db"
+
+
+def summary_cache_key(transcript_text: str, *, model: str, max_words: int) -> str:
+    """Build a stable cache key for a transcript summarized with the given settings."""
+    digest = hashlib.sha256()
+    digest.update(f"{model}\n{max_words}\n".encode("utf-8"))
+    digest.update(transcript_text.encode("utf-8"))
+    return f"aava:webhook_summary:{digest.hexdigest()}"
+
+
+class SummaryCache(ABC):
+    """Async key/value cache for generated summaries. Failures never raise."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached summary for `key`, or None on miss/error."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store `value` under `key` for `ttl_seconds`."""
+        pass
+
+
+class MemorySummaryCache(SummaryCache):
+    """Bounded in-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        self._entries[key] = (value, time.time() + ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class SQLiteSummaryCache(SummaryCache):
+    """SQLite-backed cache shared by every process that can reach the file."""
+
+    def __init__(self, db_path: str):
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=30.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA busy_timeout=30000;")
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        if self._initialized:
+            return
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS summary_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.commit()
+        self._initialized = True
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        with self._lock:
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = self._get_connection()
+            try:
+                self._ensure_schema(conn)
+                row = conn.execute(
+                    "SELECT value FROM summary_cache WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+                return row[0] if row else None
+            finally:
+                conn.close()
+
+    def _set_sync(self, key: str, value: str, ttl_seconds: int) -> None:
+        with self._lock:
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = self._get_connection()
+            try:
+                self._ensure_schema(conn)
+                now = time.time()
+                conn.execute("DELETE FROM summary_cache WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO summary_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, now + ttl_seconds),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._get_sync, key)
+        except Exception as e:
+            logger.debug(f"Summary cache read failed ({self._db_path}): {e}")
+            return None
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._set_sync, key, value, ttl_seconds)
+        except Exception as e:
+            logger.debug(f"Summary cache write failed ({self._db_path}): {e}")
+
+
+class RedisSummaryCache(SummaryCache):
+    """Redis-backed cache (requires the optional `redis` package)."""
+
+    def __init__(self, url: str):
+        self._url = url
+        self._client = redis_asyncio.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self._client.get(key)
+        except Exception as e:
+            logger.debug(f"Summary cache read failed (redis): {e}")
+            return None
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        try:
+            await self._client.set(key, value, ex=ttl_seconds)
+        except Exception as e:
+            logger.debug(f"Summary cache write failed (redis): {e}")
+
+
+_CACHES: Dict[Tuple[str, str], SummaryCache] = {}
+
+
+def get_summary_cache(backend: str, url: str = "") -> Optional[SummaryCache]:
+    """
+    Return the shared cache instance for a backend, or None when disabled.
+
+    Args:
+        backend: "none", "memory", "sqlite" or "redis"
+        url: SQLite file path or Redis URL (ignored for memory)
+    """
+    backend = (backend or "none").strip().lower()
+    if backend in ("none", "off", "disabled"):
+        return None
+
+    if backend == "sqlite":
+        url = url or os.getenv("WEBHOOK_SUMMARY_CACHE_DB_PATH", DEFAULT_SQLITE_PATH)
+    elif backend == "redis":
+        if redis_asyncio is None:
+            logger.warning("Summary cache backend 'redis' requested but redis package not installed; using memory")
+            backend, url = "memory", ""
+        elif not url:
+            logger.warning("Summary cache backend 'redis' requires summary_cache_url; using memory")
+            backend = "memory"
+    elif backend != "memory":
+        logger.warning(f"Unknown summary cache backend '{backend}'; using memory")
+        backend = "memory"
+
+    if backend == "memory":
+        url = ""
+
+    cache_id = (backend, url)
+    cache = _CACHES.get(cache_id)
+    if cache is None:
+        if backend == "sqlite":
+            cache = SQLiteSummaryCache(url)
+        elif backend == "redis":
+            cache = RedisSummaryCache(url)
+        else:
+            cache = MemorySummaryCache()
+        _CACHES[cache_id] = cache
+    return cache
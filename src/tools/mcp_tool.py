@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import re
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import structlog
 
@@ -11,13 +14,13 @@ from src.tools.context import ToolExecutionContext
 logger = structlog.get_logger(__name__)
 
 
-def _pick_field(data: Any, dotted: str) -> Optional[Any]:
+def _pick_field_parts(data: Any, parts: Tuple[str, ...]) -> Optional[Any]:
     if data is None:
         return None
-    if not dotted:
+    if not parts:
         return None
     cur: Any = data
-    for part in dotted.split("."):
+    for part in parts:
         if isinstance(cur, dict) and part in cur:
             cur = cur[part]
         else:
@@ -25,19 +28,82 @@ def _pick_field(data: Any, dotted: str) -> Optional[Any]:
     return cur
 
 
+_PLACEHOLDER_RE = re.compile(r"\{([a-zA-Z0-9_.-]+)\}")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a speech template into (literal, key) segments; key is None for trailing text."""
+    segments: List[Tuple[str, Optional[str]]] = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(template or ""):
+        segments.append((template[pos:match.start()], match.group(1)))
+        pos = match.end()
+    if template and pos < len(template):
+        segments.append((template[pos:], None))
+    return tuple(segments)
+
+
+def _render_compiled(segments: Tuple[Tuple[str, Optional[str]], ...], data: Dict[str, Any]) -> str:
+    # Only `{key}` placeholders for top-level fields; missing keys become empty strings.
+    data = data or {}
+    parts: List[str] = []
+    for literal, key in segments:
+        parts.append(literal)
+        if key is not None:
+            parts.append(str(data.get(key, "")))
+    return " ".join("".join(parts).split())
+
+
+def _specialize_template(
+    segments: Tuple[Tuple[str, Optional[str]], ...],
+) -> Optional[Callable[[Dict[str, Any]], str]]:
+    """Return a renderer for compiled segments, with fast closures for 0/1 placeholders."""
+    if not segments:
+        return None
+    keys = [key for _, key in segments if key is not None]
+    if not keys:
+        constant = " ".join("".join(literal for literal, _ in segments).split())
+        return lambda data: constant
+    if len(keys) == 1:
+        prefix, key = segments[0]
+        suffix = segments[1][0] if len(segments) > 1 else ""
+
+        def render_one(data: Dict[str, Any]) -> str:
+            value = str(data.get(key, "")) if data else ""
+            return " ".join((prefix + value + suffix).split())
+
+        return render_one
+    return functools.partial(_render_compiled, segments)
+
+
 def _render_template(template: str, data: Dict[str, Any]) -> str:
     # Simple and safe-ish: only allow `{key}` placeholders where key is a top-level field.
     # Missing keys become empty strings.
     if not template:
         return ""
-    out = template
-    for key, value in (data or {}).items():
-        out = out.replace("{" + str(key) + "}", str(value))
-    # Clear any unreplaced placeholders
-    import re
-
-    out = re.sub(r"\{[a-zA-Z0-9_.-]+\}", "", out)
-    return " ".join(out.split()).strip()
+    return _render_compiled(_compile_template(template), data)
+
+
+def _select_data_obj(result: Any) -> Dict[str, Any]:
+    # Allow server-side structured payloads. Many servers include a "data" field or similar.
+    if type(result) is not dict:
+        return {}
+    # Some servers return {"content":[...], "structured":{...}}
+    d = result.get("structured")
+    if type(d) is not dict:
+        d = result.get("data")
+        if type(d) is not dict:
+            d = result.get("result")
+            if type(d) is not dict:
+                d = result.get("output")
+    if type(d) is dict and d:
+        return d
+    # Use top-level fields as a last resort; the result is only read, so copy
+    # it only when "content" has to be hidden.
+    if "content" not in result:
+        return result
+    return {k: v for k, v in result.items() if k != "content"}
 
 
 @dataclass(frozen=True)
@@ -71,19 +137,26 @@ class MCPTool(Tool):
         self._input_schema = input_schema
         self._manager = manager
         self._behavior = behavior
-
-    @property
-    def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name=self._exposed_name,
-            description=self._description or f"MCP tool '{self._mcp_tool_name}' from server '{self._server_id}'.",
+        self._template_segments = _compile_template(behavior.speech_template or "")
+        self._render_speech = _specialize_template(self._template_segments)
+        # All inputs are fixed at construction, so the definition is built once.
+        self._definition = ToolDefinition(
+            name=exposed_name,
+            description=description or f"MCP tool '{mcp_tool_name}' from server '{server_id}'.",
             category=ToolCategory.BUSINESS,
             requires_channel=False,
-            max_execution_time=max(1, int((self._behavior.timeout_ms or 10000) / 1000)),
+            max_execution_time=max(1, int((behavior.timeout_ms or 10000) / 1000)),
             parameters=[],
-            input_schema=self._input_schema,
+            input_schema=input_schema,
+        )
+        self._speech_field_parts: Optional[Tuple[str, ...]] = (
+            tuple(sys.intern(part) for part in behavior.speech_field.split(".")) if behavior.speech_field else None
         )
 
+    @property
+    def definition(self) -> ToolDefinition:
+        return self._definition
+
     @property
     def slow_response_threshold_ms(self) -> int:
         return int(self._behavior.slow_response_threshold_ms or 0)
@@ -120,42 +193,28 @@ class MCPTool(Tool):
         }
 
     def _build_speech_message(self, result: Dict[str, Any]) -> str:
+        if self._template_segments or self._speech_field_parts:
+            data_obj = _select_data_obj(result)
+
+            if self._render_speech is not None:
+                rendered = self._render_speech(data_obj)
+                if rendered:
+                    return rendered
+
+            if self._speech_field_parts:
+                picked = _pick_field_parts(data_obj, self._speech_field_parts)
+                if picked is not None:
+                    return str(picked).strip()
+
         # If MCP server returns content blocks with text, prefer that as a fallback.
-        content_text = ""
-        try:
-            content = result.get("content", [])
-            if isinstance(content, list):
-                parts = []
-                for item in content:
-                    if isinstance(item, dict) and item.get("type") == "text" and item.get("text"):
-                        parts.append(str(item["text"]))
-                content_text = " ".join(parts).strip()
-        except Exception:
-            content_text = ""
-
-        # Allow server-side structured payloads. Many servers include a "data" field or similar.
-        data_obj: Dict[str, Any] = {}
-        if isinstance(result, dict):
-            # Some servers return {"content":[...], "structured":{...}}
-            for key in ("structured", "data", "result", "output"):
-                if isinstance(result.get(key), dict):
-                    data_obj = result[key]
-                    break
-            if not data_obj:
-                # Use top-level fields as a last resort
-                data_obj = {k: v for k, v in result.items() if k not in ("content",)}
-
-        if self._behavior.speech_template:
-            rendered = _render_template(self._behavior.speech_template, data_obj)
-            if rendered:
-                return rendered
-
-        if self._behavior.speech_field:
-            picked = _pick_field(data_obj, self._behavior.speech_field)
-            if picked is not None:
-                return str(picked).strip()
-
-        if content_text:
-            return content_text
+        content = result.get("content") if type(result) is dict else None
+        if isinstance(content, list):
+            content_text = " ".join(
+                str(item["text"])
+                for item in content
+                if isinstance(item, dict) and item.get("type") == "text" and item.get("text")
+            ).strip()
+            if content_text:
+                return content_text
 
         return "I have the result."
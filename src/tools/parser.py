@@ -9,16 +9,26 @@ Parses LLM responses to extract tool calls in the format:
 This is model-agnostic and works with any LLM that can output structured text.
 """
 
+import asyncio
+import copy
+import functools
 import re
 import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Any, Collection, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-# Pattern to match tool calls in LLM output
+# Patterns used to strip tool-call markers from text (extract_text_without_tools)
+# Body allows one level of nested braces without backtracking; deeper nesting
+# is left to the candidate scanner.
 TOOL_CALL_PATTERN = re.compile(
-    r'<tool_call>\s*(\{.*?\})\s*</tool_call>',
+    r'<tool_call>\s*(\{(?:[^{}]|\{[^{}]*\})*\})\s*</tool_call>',
     re.DOTALL | re.IGNORECASE
 )
 
@@ -33,6 +43,260 @@ JSON_FUNCTION_PATTERN = re.compile(
     re.DOTALL
 )
 
+# All three marker patterns in one alternation, used to strip malformed
+# markup the scanner does not accept. Case-insensitivity stays scoped to the
+# formats that had it.
+_ALL_TOOL_MARKERS_PATTERN = re.compile(
+    "(?i:" + TOOL_CALL_PATTERN.pattern + ")"
+    "|(?i:" + FUNCTOOLS_PATTERN.pattern + ")"
+    "|(?:" + JSON_FUNCTION_PATTERN.pattern + ")",
+    re.DOTALL
+)
+
+
+# Single-pass scanner: literal anchors locate candidates, then the JSON that
+# follows is decoded in place. Linear in the response length (no backtracking).
+_ANCHOR_PATTERN = re.compile(r'<tool_call>|functools\[|"function"', re.IGNORECASE)
+_TOOL_CALL_CLOSE_PATTERN = re.compile(r'</tool_call>', re.IGNORECASE)
+_DECODER = json.JSONDecoder()
+_BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+
+_FORMAT_PRIORITY = ("tool_call", "functools", "function")
+
+
+def _loads(text: str) -> Any:
+    """Decode JSON with orjson when available, falling back to stdlib for input it rejects (e.g. NaN)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            pass
+    return json.loads(text)
+
+
+def _decode_span(response: str, start: int, end: int) -> Any:
+    """
+    Decode response[start:end] as one JSON value.
+    
+    Without orjson the stdlib decoder reads straight from the response buffer
+    (no substring copy); orjson needs its own str, so the span is sliced once.
+    """
+    if orjson is not None:
+        return _loads(response[start:end])
+    payload, stop = _DECODER.raw_decode(response, start)
+    if stop != end:
+        raise ValueError(f"Extra data at char {stop}")
+    return payload
+
+
+def _has_tool_markers(response: str) -> bool:
+    """
+    Cheap pre-check before any regex work.
+    
+    Every supported format needs '<' (<tool_call>, any case), '[' (functools[)
+    or the literal '"function"' key, so a response with none of them cannot
+    contain a tool call. Most spoken replies take this path.
+    """
+    return "<" in response or "[" in response or '"function"' in response
+
+
+def _rstrip_index(response: str, start: int, end: int) -> int:
+    """Return end moved left past trailing whitespace, but not before start."""
+    while end > start and response[end - 1].isspace():
+        end -= 1
+    return end
+
+
+def _match_tool_call_block(response: str, pos: int) -> Optional[Tuple[int, Any]]:
+    """
+    Match the body of a <tool_call> block whose opening tag ends at pos.
+    
+    Returns (end, payload) where end is just past </tool_call> and payload is
+    the decoded object, or None as payload when the body is not valid JSON.
+    Returns None when there is no "{...}</tool_call>" body at all.
+    """
+    close = _TOOL_CALL_CLOSE_PATTERN.search(response, pos)
+    if close is None:
+        return None
+    # Trim whitespace by index so the body is copied at most once.
+    body_start = pos
+    while body_start < close.start() and response[body_start].isspace():
+        body_start += 1
+    if body_start == close.start() or response[body_start] != "{":
+        return None
+    
+    body_end = _rstrip_index(response, body_start, close.start())
+    if response[body_end - 1] == "}":
+        try:
+            return close.end(), _decode_span(response, body_start, body_end)
+        except ValueError:
+            pass
+    
+    # The first </tool_call> may sit inside a JSON string: decode the object
+    # in place and require the closing tag right after it.
+    try:
+        payload, end = _DECODER.raw_decode(response, body_start)
+    except ValueError as e:
+        error = str(e)
+    else:
+        while end < len(response) and response[end].isspace():
+            end += 1
+        close_after = _TOOL_CALL_CLOSE_PATTERN.match(response, end)
+        if close_after is not None:
+            return close_after.end(), payload
+        error = f"Extra data at char {end}"
+    
+    # Malformed body: strip it up to the first </tool_call> preceded by "}",
+    # as the original lazy regex did.
+    while close is not None:
+        if response[_rstrip_index(response, body_start, close.start()) - 1] == "}":
+            logger.warning("Failed to parse tool call JSON: %s", error)
+            return close.end(), None
+        close = _TOOL_CALL_CLOSE_PATTERN.search(response, close.end())
+    return None
+
+
+def _iter_candidates(response: str) -> Iterator[Tuple[str, int, int, Any]]:
+    """
+    Scan the response once for tool-call regions.
+    
+    Yields:
+        (format, start, end, payload) where format is "tool_call", "functools"
+        or "function", [start, end) spans the whole marker, and payload is the
+        decoded JSON (None when a <tool_call> block is not valid JSON).
+    """
+    pos = 0
+    n = len(response)
+    while True:
+        match = _ANCHOR_PATTERN.search(response, pos)
+        if match is None:
+            return
+        anchor = match.group(0).lower()
+        pos = match.end()
+        
+        if anchor == "<tool_call>":
+            block = _match_tool_call_block(response, pos)
+            if block is None:
+                continue
+            end, payload = block
+            yield ("tool_call", match.start(), end, payload)
+            pos = end
+        
+        elif anchor == "functools[":
+            if pos >= n or response[pos] != "[":
+                continue
+            try:
+                payload, end = _DECODER.raw_decode(response, pos)
+            except ValueError:
+                continue
+            if end < n and response[end] == "]":
+                yield ("functools", match.start(), end + 1, payload)
+                pos = end + 1
+        
+        else:
+            # {"function": "...", "function_parameters": {...}} - the anchor
+            # must be the first key of an object.
+            brace = match.start() - 1
+            while brace >= 0 and response[brace].isspace():
+                brace -= 1
+            if brace < 0 or response[brace] != "{":
+                continue
+            try:
+                payload, end = _DECODER.raw_decode(response, brace)
+            except ValueError:
+                continue
+            if (
+                isinstance(payload, dict)
+                and isinstance(payload.get("function"), str)
+                and payload["function"]
+                and isinstance(payload.get("function_parameters"), dict)
+            ):
+                yield ("function", brace, end, payload)
+                pos = end
+
+
+def _tool_calls_from_candidates(candidates: List[Tuple[str, int, int, Any]]) -> List[Dict[str, Any]]:
+    """Build tool calls from the highest-priority format that produced any."""
+    for fmt in _FORMAT_PRIORITY:
+        tool_calls: List[Dict[str, Any]] = []
+        for cand_fmt, _start, _end, payload in candidates:
+            if cand_fmt != fmt:
+                continue
+            if fmt == "tool_call":
+                if isinstance(payload, dict) and "name" in payload:
+                    tool_calls.append({
+                        "name": payload["name"],
+                        "parameters": payload.get("arguments", payload.get("parameters", {}))
+                    })
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Parsed tool call (primary format): tool=%s params=%s",
+                            payload["name"],
+                            payload.get("arguments", {})
+                        )
+            elif fmt == "functools":
+                if isinstance(payload, list):
+                    for tool_data in payload:
+                        if isinstance(tool_data, dict) and "name" in tool_data:
+                            tool_calls.append({
+                                "name": tool_data["name"],
+                                "parameters": tool_data.get("arguments", {})
+                            })
+            else:
+                tool_calls.append({
+                    "name": payload["function"],
+                    "parameters": payload["function_parameters"]
+                })
+        if tool_calls:
+            return tool_calls
+    return []
+
+
+def _strip_spans(response: str, candidates: List[Tuple[str, int, int, Any]]) -> str:
+    """Return the response with every candidate region removed."""
+    if not candidates:
+        return response
+    parts: List[str] = []
+    pos = 0
+    for _fmt, start, end, _payload in candidates:
+        parts.append(response[pos:start])
+        pos = end
+    parts.append(response[pos:])
+    return "".join(parts)
+
+
+def _clean_text(response: str, candidates: List[Tuple[str, int, int, Any]]) -> str:
+    """
+    Remove every tool-call marker region, whether or not its JSON decodes.
+    
+    The scanner's spans cover well-formed calls; if an anchor survives, the
+    leftover markup is malformed and the marker patterns strip it so it never
+    reaches TTS.
+    """
+    clean = _strip_spans(response, candidates)
+    if _ANCHOR_PATTERN.search(clean):
+        clean = _ALL_TOOL_MARKERS_PATTERN.sub('', clean)
+    return _BLANK_LINES_PATTERN.sub('\n', clean).strip()
+
+
+def _scan_response(response: str) -> Tuple[str, Tuple[Dict[str, Any], ...]]:
+    """One scan yields both the tool calls and the clean text."""
+    candidates = list(_iter_candidates(response))
+    tool_calls = tuple(_tool_calls_from_candidates(candidates))
+    return _clean_text(response, candidates), tool_calls
+
+
+# Identical responses recur (provider resends, validation retries). Results are
+# cached for responses below this size; callers get deep copies of the calls.
+_PARSE_CACHE_MAX_LEN = 32768
+_scan_response_cached = functools.lru_cache(maxsize=128)(_scan_response)
+
+
+def _scan(response: str) -> Tuple[str, Tuple[Dict[str, Any], ...]]:
+    if len(response) < _PARSE_CACHE_MAX_LEN:
+        return _scan_response_cached(response)
+    return _scan_response(response)
+
 
 def parse_tool_calls(response: str) -> List[Dict[str, Any]]:
     """
@@ -43,67 +307,17 @@ def parse_tool_calls(response: str) -> List[Dict[str, Any]]:
     2. functools[{"name": "...", "arguments": {...}}]
     3. {"function": "...", "function_parameters": {...}}
     
+    Formats are tried in that order; the first one that yields any calls wins.
+    
     Args:
         response: Raw LLM response text
         
     Returns:
         List of tool call dictionaries with 'name' and 'parameters' keys
     """
-    tool_calls = []
-    
-    # Try primary format: <tool_call>...</tool_call>
-    matches = TOOL_CALL_PATTERN.findall(response)
-    for match in matches:
-        try:
-            tool_data = json.loads(match)
-            if "name" in tool_data:
-                tool_calls.append({
-                    "name": tool_data["name"],
-                    "parameters": tool_data.get("arguments", tool_data.get("parameters", {}))
-                })
-                logger.debug(
-                    "Parsed tool call (primary format): tool=%s params=%s",
-                    tool_data["name"],
-                    tool_data.get("arguments", {})
-                )
-        except json.JSONDecodeError as e:
-            logger.warning("Failed to parse tool call JSON: %s", e)
-            continue
-    
-    if tool_calls:
-        return tool_calls
-    
-    # Try functools format: functools[{...}]
-    functools_matches = FUNCTOOLS_PATTERN.findall(response)
-    for match in functools_matches:
-        try:
-            tools_list = json.loads(match)
-            if isinstance(tools_list, list):
-                for tool_data in tools_list:
-                    if "name" in tool_data:
-                        tool_calls.append({
-                            "name": tool_data["name"],
-                            "parameters": tool_data.get("arguments", {})
-                        })
-        except json.JSONDecodeError:
-            continue
-    
-    if tool_calls:
-        return tool_calls
-    
-    # Try function format: {"function": "...", "function_parameters": {...}}
-    func_matches = JSON_FUNCTION_PATTERN.findall(response)
-    for func_name, params_str in func_matches:
-        try:
-            params = json.loads(params_str)
-            tool_calls.append({
-                "name": func_name,
-                "parameters": params
-            })
-        except json.JSONDecodeError:
-            continue
-    
-    return tool_calls
+    if not _has_tool_markers(response):
+        return []
+    return copy.deepcopy(list(_scan(response)[1]))
 
 
 def extract_text_without_tools(response: str) -> str:
@@ -116,20 +330,9 @@ def extract_text_without_tools(response: str) -> str:
     Returns:
         Clean text suitable for TTS
     """
-    # Remove <tool_call>...</tool_call> blocks
-    clean = TOOL_CALL_PATTERN.sub('', response)
-    
-    # Remove functools[...] blocks
-    clean = FUNCTOOLS_PATTERN.sub('', clean)
-    
-    # Remove {"function": ...} blocks
-    clean = JSON_FUNCTION_PATTERN.sub('', clean)
-    
-    # Clean up extra whitespace
-    clean = re.sub(r'\n\s*\n', '\n', clean)
-    clean = clean.strip()
-    
-    return clean
+    if not _has_tool_markers(response):
+        return _BLANK_LINES_PATTERN.sub('\n', response).strip()
+    return _scan(response)[0]
 
 
 def parse_response_with_tools(response: str) -> Tuple[Optional[str], Optional[List[Dict]]]:
@@ -144,32 +347,54 @@ def parse_response_with_tools(response: str) -> Tuple[Optional[str], Optional[Li
         - clean_text: Text suitable for TTS (None if empty)
         - tool_calls: List of tool call dicts (None if no tools)
     """
-    tool_calls = parse_tool_calls(response)
-    clean_text = extract_text_without_tools(response)
+    if not _has_tool_markers(response):
+        clean_text = _BLANK_LINES_PATTERN.sub('\n', response).strip()
+        return (clean_text or None, None)
+    
+    clean_text, tool_calls = _scan(response)
     
     return (
         clean_text if clean_text else None,
-        tool_calls if tool_calls else None
+        copy.deepcopy(list(tool_calls)) if tool_calls else None
     )
 
 
-def validate_tool_call(tool_call: Dict[str, Any], available_tools: List[str]) -> bool:
+# Responses above this size are parsed off the event loop; below it the
+# thread hop costs more than the scan itself.
+_ASYNC_PARSE_THRESHOLD = 8192
+
+
+async def parse_response_with_tools_async(response: str) -> Tuple[Optional[str], Optional[List[Dict]]]:
+    """
+    Async variant of parse_response_with_tools for use on the event loop.
+    
+    Large responses are parsed in a worker thread so long LLM outputs do not
+    stall audio processing; small ones are parsed inline.
+    """
+    if len(response) > _ASYNC_PARSE_THRESHOLD:
+        return await asyncio.to_thread(parse_response_with_tools, response)
+    return parse_response_with_tools(response)
+
+
+def validate_tool_call(tool_call: Dict[str, Any], available_tools: Collection[str]) -> bool:
     """
     Validate that a tool call references a known tool.
     
     Args:
         tool_call: Tool call dictionary with 'name' key
-        available_tools: List of valid tool names
+        available_tools: Valid tool names; pass a set/frozenset for O(1) lookups
         
     Returns:
         True if valid, False otherwise
     """
+    if len(available_tools) > 8 and not isinstance(available_tools, (set, frozenset)):
+        available_tools = frozenset(available_tools)
     name = tool_call.get("name", "")
     if name not in available_tools:
         logger.warning(
             "Unknown tool in LLM response: %s (available: %s)",
             name,
-            available_tools
+            sorted(available_tools)
         )
         return False
     return True
@@ -4,14 +4,138 @@ Tool registry - central repository for all available tools.
 Singleton pattern ensures only one registry exists across the application.
 """
 
-from typing import Dict, List, Type, Optional, Iterable, Set, Union, Any
+from typing import Dict, List, Type, Optional, Iterable, Set, FrozenSet, Tuple, Union, Any
 from src.tools.base import Tool, ToolDefinition, ToolCategory, ToolPhase, PreCallTool, PostCallTool
 import logging
+import functools
 import hashlib
+import importlib
 import json
+import threading
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import xxhash  # type: ignore
+except ImportError:  # pragma: no cover
+    xxhash = None
 
 logger = logging.getLogger(__name__)
 
+# Built-in tools registered by initialize_default_tools, in registration order.
+# Future tools will be registered here.
+_DEFAULT_TOOLS = (
+    # Telephony tools
+    ("src.tools.telephony.unified_transfer", "UnifiedTransferTool"),
+    ("src.tools.telephony.attended_transfer", "AttendedTransferTool"),
+    ("src.tools.telephony.cancel_transfer", "CancelTransferTool"),
+    ("src.tools.telephony.hangup", "HangupCallTool"),
+    ("src.tools.telephony.voicemail", "VoicemailTool"),
+    ("src.tools.telephony.check_extension_status", "CheckExtensionStatusTool"),
+    ("src.tools.telephony.live_agent_transfer", "LiveAgentTransferTool"),
+    # Business tools
+    ("src.tools.business.email_summary", "SendEmailSummaryTool"),
+    ("src.tools.business.request_transcript", "RequestTranscriptTool"),
+)
+
+def _close_aliases(aliases: Dict[str, str], max_hops: int = 8) -> Dict[str, str]:
+    """Resolve alias chains (a -> b -> c) so every alias maps straight to its final name."""
+    closed: Dict[str, str] = {}
+    for alias, target in aliases.items():
+        seen = {alias}
+        hops = 0
+        while target in aliases and target not in seen and hops < max_hops:
+            seen.add(target)
+            target = aliases[target]
+            hops += 1
+        closed[alias] = target
+    return closed
+
+
+# Provider schema formats exported by ToolRegistry, dispatched through the
+# unbound ToolDefinition methods (no per-call getattr / string formatting).
+_SCHEMA_BUILDERS = {
+    "deepgram": ToolDefinition.to_deepgram_schema,
+    "openai": ToolDefinition.to_openai_schema,
+    "openai_realtime": ToolDefinition.to_openai_realtime_schema,
+    "elevenlabs": ToolDefinition.to_elevenlabs_schema,
+    "local_llm": ToolDefinition.to_local_llm_schema,
+}
+_SCHEMA_KINDS = tuple(_SCHEMA_BUILDERS)
+
+# Guards first construction of the ToolRegistry singleton.
+_singleton_lock = threading.Lock()
+
+
+def _serialized_init(method):
+    """
+    Run a registry bootstrap method under the instance init lock.
+    
+    The methods re-check their own "already done" guards (`_initialized`,
+    the in-call config cache) once inside, so concurrent startup paths
+    coalesce into a single registration pass.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._init_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _fingerprint_default(obj: Any) -> Any:
+    # Sets have no stable iteration order; sort them so equal configs hash equally.
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    return str(obj)
+
+
+if orjson is not None:
+    _FINGERPRINT_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def _fingerprint_dumps(config: Any) -> bytes:
+        try:
+            return orjson.dumps(config, option=_FINGERPRINT_OPTIONS, default=_fingerprint_default)
+        except TypeError:
+            # e.g. >64-bit ints or mixed key types orjson cannot sort
+            return json.dumps(config, sort_keys=True, default=_fingerprint_default).encode("utf-8")
+else:  # pragma: no cover
+    def _fingerprint_dumps(config: Any) -> bytes:
+        return json.dumps(config, sort_keys=True, default=_fingerprint_default).encode("utf-8")
+
+
+def _config_fingerprint(config: Any) -> str:
+    """
+    Order-independent dedup key for a config mapping.
+    
+    Not security-sensitive, so a fast non-cryptographic hash (xxh3) is used when
+    available, with BLAKE2b as the stdlib fallback.
+    """
+    payload = _fingerprint_dumps(config)
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(payload)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _log_bootstrap_failures(label: str, failures: List[Tuple[str, Exception]]) -> None:
+    """
+    Summarize config-driven tool creation failures in one warning.
+    
+    A systematic problem (e.g. a missing env var) fails every entry the same
+    way, so only the first traceback is logged alongside the list of names.
+    """
+    if not failures or not logger.isEnabledFor(logging.WARNING):
+        return
+    logger.warning(
+        "Failed to create %d %s tool(s): %s",
+        len(failures),
+        label,
+        "; ".join(f"{name}: {exc}" for name, exc in failures),
+        exc_info=failures[0][1],
+    )
+
 
 class ToolRegistry:
     """
@@ -22,6 +146,9 @@ class ToolRegistry:
     
     _instance = None
     
+    # Upper bound on memoized schema lists (one per provider kind x allowlist).
+    _SCHEMA_CACHE_MAX_ENTRIES = 256
+    
     # Tool name aliases for provider compatibility
     # Different providers use different naming conventions for the same tools
     TOOL_ALIASES = {
@@ -33,16 +160,72 @@ class ToolRegistry:
         "live_agent": "live_agent_transfer",  # Short alias used by some prompts
         "transfer_to_live_agent": "live_agent_transfer",
     }
+    _CLOSED_ALIASES = _close_aliases(TOOL_ALIASES)
     
     def __new__(cls):
         """Singleton pattern - only one instance exists."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._tools: Dict[str, Tool] = {}
-            cls._instance._initialized = False
-            cls._instance._in_call_http_init_cache: Set[str] = set()
+        if cls._instance is not None:
+            return cls._instance
+        with _singleton_lock:
+            if cls._instance is not None:
+                return cls._instance
+            instance = super().__new__(cls)
+            instance._tools: Dict[str, Tool] = {}
+            instance._initialized = False
+            # Serializes the initialize_* bootstrap methods (concurrent startup paths).
+            instance._init_lock = threading.RLock()
+            instance._in_call_http_init_cache: Set[str] = set()
+            # Bumped on every registration change; derived views are cached per version.
+            instance._version = 0
+            instance._schema_cache: Dict[Tuple[str, Optional[Tuple[str, ...]]], List[Dict]] = {}
+            instance._tool_schemas: Dict[str, Dict[str, Dict]] = {}
+            instance._prompt_cache: Dict[str, str] = {}
+            instance._tools_snapshot: Optional[Tuple[Tool, ...]] = None
+            instance._names_snapshot: Optional[Tuple[str, ...]] = None
+            instance._prompt_cache_version = -1
+            # Alias -> canonical name, consulted by canonicalize_tool_name/is_tool_allowed.
+            instance._alias_resolve: Dict[str, str] = dict(cls._CLOSED_ALIASES)
+            # Name -> registry key for get(): closed aliases plus identity entries for
+            # registered tools (an exact registration wins over an alias).
+            instance._get_resolve: Dict[str, str] = dict(cls._CLOSED_ALIASES)
+            instance._allowed_cache: Dict[Tuple[Any, ...], FrozenSet[str]] = {}
+            # Inverted indexes (name -> tool, registration order) maintained on register/unregister.
+            instance._by_phase: Dict[ToolPhase, Dict[str, Tool]] = {}
+            instance._by_category: Dict[ToolCategory, Dict[str, Tool]] = {}
+            instance._global_by_phase: Dict[ToolPhase, Dict[str, Tool]] = {}
+            # Publish only once fully initialized (the fast path above reads without the lock).
+            cls._instance = instance
         return cls._instance
     
+    def _index_add(self, tool_name: str, tool: Tool, definition: ToolDefinition) -> None:
+        self._by_phase.setdefault(definition.phase, {})[tool_name] = tool
+        self._by_category.setdefault(definition.category, {})[tool_name] = tool
+        if definition.is_global:
+            self._global_by_phase.setdefault(definition.phase, {})[tool_name] = tool
+    
+    def _index_remove(self, tool_name: str) -> None:
+        for index in (self._by_phase, self._by_category, self._global_by_phase):
+            for bucket in index.values():
+                bucket.pop(tool_name, None)
+    
+    def _release_name(self, tool_name: str) -> None:
+        """Drop a registered name's identity entry, restoring its alias mapping if any."""
+        if tool_name in self._CLOSED_ALIASES:
+            self._get_resolve[tool_name] = self._CLOSED_ALIASES[tool_name]
+        else:
+            self._get_resolve.pop(tool_name, None)
+    
+    def _invalidate(self, tool_name: Optional[str] = None) -> None:
+        """Drop cached schema views after the tool set changes."""
+        self._version += 1
+        self._schema_cache.clear()
+        self._tools_snapshot = None
+        self._names_snapshot = None
+        if tool_name is None:
+            self._tool_schemas.clear()
+        else:
+            self._tool_schemas.pop(tool_name, None)
+    
     def register(self, tool_class: Type[Tool]) -> None:
         """
         Register a tool class.
@@ -53,24 +236,26 @@ class ToolRegistry:
         Example:
             registry.register(UnifiedTransferTool)
         """
-        tool = tool_class()
-        tool_name = tool.definition.name
-        
-        if tool_name in self._tools:
-            logger.warning(f"Tool {tool_name} already registered, overwriting")
-        
-        self._tools[tool_name] = tool
-        logger.info(f"✅ Registered tool: {tool_name} ({tool.definition.category.value})")
+        self._add(tool_class())
 
     def register_instance(self, tool: Tool) -> None:
         """
         Register a tool instance (used for dynamically constructed tools like MCP wrappers).
         """
-        tool_name = tool.definition.name
+        self._add(tool)
+
+    def _add(self, tool: Tool) -> None:
+        definition = tool.definition
+        tool_name = definition.name
         if tool_name in self._tools:
-            logger.warning(f"Tool {tool_name} already registered, overwriting")
+            logger.warning("Tool %s already registered, overwriting", tool_name)
+            self._index_remove(tool_name)
         self._tools[tool_name] = tool
-        logger.info(f"✅ Registered tool: {tool_name} ({tool.definition.category.value})")
+        self._index_add(tool_name, tool, definition)
+        self._get_resolve[tool_name] = tool_name
+        self._invalidate(tool_name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("✅ Registered tool: %s (%s)", tool_name, definition.category.value)
 
     def get(self, name: str) -> Optional[Tool]:
         """
@@ -82,24 +267,36 @@ class ToolRegistry:
         Returns:
             Tool instance or None if not found
         """
-        # Try direct lookup first
-        tool = self._tools.get(name)
-        if tool:
-            return tool
-        
-        # Try alias lookup
-        canonical_name = self.TOOL_ALIASES.get(name)
-        if canonical_name:
-            return self._tools.get(canonical_name)
-        
-        return None
+        return self._tools.get(self._get_resolve.get(name, name))
 
     def canonicalize_tool_name(self, name: str) -> str:
         """Return canonical tool name for alias-aware comparisons."""
-        raw_name = str(name or "").strip()
+        raw_name = name.strip() if isinstance(name, str) else str(name or "").strip()
         if not raw_name:
             return ""
-        return self.TOOL_ALIASES.get(raw_name, raw_name)
+        return self._alias_resolve.get(raw_name, raw_name)
+
+    def _canonical_allowed(self, allowed_names: Iterable[str]) -> FrozenSet[str]:
+        """Canonicalized allowlist, memoized per distinct allowlist contents."""
+        names = tuple(allowed_names)
+        try:
+            cached = self._allowed_cache.get(names)
+        except TypeError:
+            cached = None
+            names_hashable = False
+        else:
+            names_hashable = True
+        if cached is None:
+            cached = frozenset(
+                self.canonicalize_tool_name(name)
+                for name in names
+                if str(name or "").strip()
+            )
+            if names_hashable:
+                if len(self._allowed_cache) >= self._SCHEMA_CACHE_MAX_ENTRIES:
+                    self._allowed_cache.clear()
+                self._allowed_cache[names] = cached
+        return cached
 
     def is_tool_allowed(self, requested_name: str, allowed_names: Optional[Iterable[str]]) -> bool:
         """
@@ -109,17 +306,14 @@ class ToolRegistry:
         """
         if allowed_names is None:
             return True
+        if isinstance(allowed_names, (list, tuple, set, frozenset)) and not allowed_names:
+            return False
 
         canonical_requested = self.canonicalize_tool_name(requested_name)
         if not canonical_requested:
             return False
 
-        canonical_allowed = {
-            self.canonicalize_tool_name(name)
-            for name in allowed_names
-            if str(name or "").strip()
-        }
-        return canonical_requested in canonical_allowed
+        return canonical_requested in self._canonical_allowed(allowed_names)
 
     def has(self, name: str) -> bool:
         """Return True if a tool is registered under this exact name (no alias resolution)."""
@@ -129,6 +323,9 @@ class ToolRegistry:
         """Unregister a tool by exact name (no alias resolution)."""
         if name in self._tools:
             self._tools.pop(name, None)
+            self._index_remove(name)
+            self._release_name(name)
+            self._invalidate(name)
             logger.info(f"🗑️ Unregistered tool: {name}")
             return True
         return False
@@ -140,14 +337,20 @@ class ToolRegistry:
                 removed += 1
         return removed
     
-    def get_all(self) -> List[Tool]:
+    def get_all(self, copy: bool = False) -> Union[Tuple[Tool, ...], List[Tool]]:
         """
         Get all registered tools.
         
+        Args:
+            copy: Return a new list the caller may mutate
+        
         Returns:
-            List of all tool instances
+            Immutable tuple snapshot of all tool instances (rebuilt only when
+            registrations change), or a list when copy=True
         """
-        return list(self._tools.values())
+        if self._tools_snapshot is None:
+            self._tools_snapshot = tuple(self._tools.values())
+        return list(self._tools_snapshot) if copy else self._tools_snapshot
     
     def get_by_category(self, category: ToolCategory) -> List[Tool]:
         """
@@ -159,10 +362,7 @@ class ToolRegistry:
         Returns:
             List of tools in that category
         """
-        return [
-            tool for tool in self._tools.values()
-            if tool.definition.category == category
-        ]
+        return list(self._by_category.get(category, {}).values())
     
     def get_by_phase(self, phase: ToolPhase) -> List[Tool]:
         """
@@ -174,10 +374,7 @@ class ToolRegistry:
         Returns:
             List of tools in that phase
         """
-        return [
-            tool for tool in self._tools.values()
-            if tool.definition.phase == phase
-        ]
+        return list(self._by_phase.get(phase, {}).values())
     
     def get_global_tools(self, phase: Optional[ToolPhase] = None) -> List[Tool]:
         """
@@ -189,13 +386,19 @@ class ToolRegistry:
         Returns:
             List of global tools, optionally filtered by phase
         """
-        tools = [
+        if phase is not None:
+            return list(self._global_by_phase.get(phase, {}).values())
+        return [
             tool for tool in self._tools.values()
             if tool.definition.is_global
         ]
-        if phase is not None:
-            tools = [t for t in tools if t.definition.phase == phase]
-        return tools
+    
+    def _phase_tools(self, phase: ToolPhase, include_global: bool) -> List[Tool]:
+        bucket = self._by_phase.get(phase, {})
+        if include_global:
+            return list(bucket.values())
+        global_names = self._global_by_phase.get(phase, {})
+        return [tool for name, tool in bucket.items() if name not in global_names]
     
     def get_pre_call_tools(self, include_global: bool = True) -> List[Tool]:
         """
@@ -207,10 +410,7 @@ class ToolRegistry:
         Returns:
             List of pre-call tools
         """
-        tools = self.get_by_phase(ToolPhase.PRE_CALL)
-        if not include_global:
-            tools = [t for t in tools if not t.definition.is_global]
-        return tools
+        return self._phase_tools(ToolPhase.PRE_CALL, include_global)
     
     def get_post_call_tools(self, include_global: bool = True) -> List[Tool]:
         """
@@ -222,10 +422,7 @@ class ToolRegistry:
         Returns:
             List of post-call tools
         """
-        tools = self.get_by_phase(ToolPhase.POST_CALL)
-        if not include_global:
-            tools = [t for t in tools if not t.definition.is_global]
-        return tools
+        return self._phase_tools(ToolPhase.POST_CALL, include_global)
     
     def get_in_call_tools(self, include_global: bool = True) -> List[Tool]:
         """
@@ -237,10 +434,7 @@ class ToolRegistry:
         Returns:
             List of in-call tools
         """
-        tools = self.get_by_phase(ToolPhase.IN_CALL)
-        if not include_global:
-            tools = [t for t in tools if not t.definition.is_global]
-        return tools
+        return self._phase_tools(ToolPhase.IN_CALL, include_global)
     
     def get_tools_for_context(
         self,
@@ -261,20 +455,27 @@ class ToolRegistry:
         Returns:
             List of tools to execute for this context and phase
         """
-        disabled = set(disabled_global_tools or [])
+        global_tools = self._global_by_phase.get(phase, {})
+        if not context_tool_names and not disabled_global_tools:
+            return list(global_tools.values())
+        
+        disabled = frozenset(disabled_global_tools or ())
         
         # Start with global tools for this phase (minus opt-outs)
-        result_tools: Dict[str, Tool] = {}
-        for tool in self.get_global_tools(phase):
-            if tool.definition.name not in disabled:
-                result_tools[tool.definition.name] = tool
+        result_tools: Dict[str, Tool] = {
+            name: tool
+            for name, tool in global_tools.items()
+            if name not in disabled
+        }
         
         # Add context-specific tools
         if context_tool_names:
+            phase_tools = self._by_phase.get(phase, {})
             for name in context_tool_names:
-                tool = self.get(name)
-                if tool and tool.definition.phase == phase:
-                    result_tools[tool.definition.name] = tool
+                tool_name = self._get_resolve.get(name, name)
+                tool = phase_tools.get(tool_name)
+                if tool is not None:
+                    result_tools[tool_name] = tool
         
         return list(result_tools.values())
     
@@ -287,21 +488,82 @@ class ToolRegistry:
         """
         return [tool.definition for tool in self._tools.values()]
 
-    def _iter_tools_filtered(self, tool_names: Optional[List[str]]) -> Iterable[Tool]:
+    def _iter_named_tools(self, tool_names: Optional[List[str]]) -> Iterable[Tuple[str, Tool]]:
+        """(registry name, tool) pairs for the allowlist, alias-resolved and de-duplicated."""
         if tool_names is None:
-            return self._tools.values()
+            return self._tools.items()
+        registered = self._tools
+        resolve = self._get_resolve
         seen: Set[str] = set()
-        tools: List[Tool] = []
+        pairs: List[Tuple[str, Tool]] = []
         for name in tool_names:
-            tool = self.get(name)
-            if not tool:
-                continue
-            tname = tool.definition.name
-            if tname in seen:
+            key = resolve.get(name, name)
+            if key in seen or key not in registered:
                 continue
-            seen.add(tname)
-            tools.append(tool)
-        return tools
+            seen.add(key)
+            pairs.append((key, registered[key]))
+        return pairs
+
+    def _tool_schema(self, tool_name: str, tool: Tool, kind: str) -> Dict:
+        per_tool = self._tool_schemas.get(tool_name)
+        if per_tool is None:
+            per_tool = self._tool_schemas[tool_name] = {}
+        schema = per_tool.get(kind)
+        if schema is None:
+            schema = per_tool[kind] = _SCHEMA_BUILDERS[kind](tool.definition)
+        return schema
+
+    def _export(self, kind: str, tool_names: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Export schemas of the given kind, memoized until the tool set changes.
+        
+        Keyed by the ordered allowlist (order determines output order). The
+        returned list is fresh, but the schema dicts are shared and must be
+        treated as read-only.
+        """
+        key = (kind, tuple(tool_names) if tool_names is not None else None)
+        schemas = self._schema_cache.get(key)
+        if schemas is None:
+            schemas = [
+                self._tool_schema(tool_name, tool, kind)
+                for tool_name, tool in self._iter_named_tools(tool_names)
+            ]
+            self._store_export(key, schemas)
+        return list(schemas)
+
+    def _store_export(self, key: Tuple[str, Optional[Tuple[str, ...]]], schemas: List[Dict]) -> None:
+        if len(self._schema_cache) >= self._SCHEMA_CACHE_MAX_ENTRIES:
+            self._schema_cache.clear()
+        self._schema_cache[key] = schemas
+
+    def to_all_schemas(self, tool_names: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+        """
+        Export every provider format in a single pass over the tools.
+        
+        For pipelines that need more than one format (e.g. OpenAI Realtime with a
+        local LLM fallback). Results also seed the per-provider export cache.
+        
+        Returns:
+            Dict mapping provider kind ("deepgram", "openai", "openai_realtime",
+            "elevenlabs", "local_llm") to its schema list
+        """
+        names_key = tuple(tool_names) if tool_names is not None else None
+        out: Dict[str, List[Dict]] = {kind: [] for kind in _SCHEMA_KINDS}
+        for tool_name, tool in self._iter_named_tools(tool_names):
+            per_tool = self._tool_schemas.get(tool_name)
+            if per_tool is None:
+                per_tool = self._tool_schemas[tool_name] = {}
+            definition = None
+            for kind, build in _SCHEMA_BUILDERS.items():
+                schema = per_tool.get(kind)
+                if schema is None:
+                    if definition is None:
+                        definition = tool.definition
+                    schema = per_tool[kind] = build(definition)
+                out[kind].append(schema)
+        for kind, schemas in out.items():
+            self._store_export((kind, names_key), schemas)
+        return {kind: list(schemas) for kind, schemas in out.items()}
 
     def to_deepgram_schema(self) -> List[Dict]:
         """
@@ -310,10 +572,10 @@ class ToolRegistry:
         Returns:
             List of tool schemas for Deepgram
         """
-        return [tool.definition.to_deepgram_schema() for tool in self._tools.values()]
+        return self._export("deepgram")
 
     def to_deepgram_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_deepgram_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return self._export("deepgram", tool_names)
     
     def to_openai_schema(self) -> List[Dict]:
         """
@@ -322,10 +584,10 @@ class ToolRegistry:
         Returns:
             List of tool schemas for OpenAI Chat Completions (nested format)
         """
-        return [tool.definition.to_openai_schema() for tool in self._tools.values()]
+        return self._export("openai")
 
     def to_openai_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_openai_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return self._export("openai", tool_names)
     
     def to_openai_realtime_schema(self) -> List[Dict]:
         """
@@ -334,10 +596,10 @@ class ToolRegistry:
         Returns:
             List of tool schemas for OpenAI Realtime API (flat format)
         """
-        return [tool.definition.to_openai_realtime_schema() for tool in self._tools.values()]
+        return self._export("openai_realtime")
 
     def to_openai_realtime_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_openai_realtime_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return self._export("openai_realtime", tool_names)
     
     def to_elevenlabs_schema(self) -> List[Dict]:
         """
@@ -346,10 +608,17 @@ class ToolRegistry:
         Returns:
             List of tool schemas for ElevenLabs (client-side execution)
         """
-        return [tool.definition.to_elevenlabs_schema() for tool in self._tools.values()]
+        return self._export("elevenlabs")
 
     def to_elevenlabs_schema_filtered(self, tool_names: Optional[List[str]]) -> List[Dict]:
-        return [tool.definition.to_elevenlabs_schema() for tool in self._iter_tools_filtered(tool_names)]
+        return self._export("elevenlabs", tool_names)
+    
+    def _cached_prompt(self, key: str) -> Optional[str]:
+        """Return a cached prompt rendering, dropping stale entries after tool-set changes."""
+        if self._prompt_cache_version != self._version:
+            self._prompt_cache.clear()
+            self._prompt_cache_version = self._version
+        return self._prompt_cache.get(key)
     
     def to_prompt_text(self) -> str:
         """
@@ -360,13 +629,17 @@ class ToolRegistry:
         """
         if not self._tools:
             return ""
+        cached = self._cached_prompt("to_prompt_text")
+        if cached is not None:
+            return cached
         
         lines = ["Available tools:\n"]
         for tool in self._tools.values():
             lines.append(tool.definition.to_prompt_text())
             lines.append("")  # Blank line between tools
         
-        return "\n".join(lines)
+        self._prompt_cache["to_prompt_text"] = "\n".join(lines)
+        return self._prompt_cache["to_prompt_text"]
     
     def to_local_llm_schema(self) -> List[Dict]:
         """
@@ -375,10 +648,7 @@ class ToolRegistry:
         Returns:
             List of tool schemas for local LLM prompt injection
         """
-        return [
-            tool.definition.to_local_llm_schema()
-            for tool in self._tools.values()
-        ]
+        return self._export("local_llm")
     
     def to_local_llm_prompt(self) -> str:
         """
@@ -387,13 +657,19 @@ class ToolRegistry:
         Returns a formatted string that can be injected into system prompts
         for local LLMs like Phi-3, Llama, etc.
         """
-        import json
         if not self._tools:
             return ""
+        cached = self._cached_prompt("to_local_llm_prompt")
+        if cached is not None:
+            return cached
         
-        tools_json = json.dumps(self.to_local_llm_schema(), indent=2)
+        schemas = self.to_local_llm_schema()
+        if orjson is not None:
+            tools_json = orjson.dumps(schemas, option=orjson.OPT_INDENT_2).decode("utf-8")
+        else:
+            tools_json = json.dumps(schemas, indent=2, ensure_ascii=False)
         
-        return f"""## Available Tools
+        self._prompt_cache["to_local_llm_prompt"] = f"""## Available Tools
 
 You have access to the following tools. When you need to use a tool, output EXACTLY this format:
 
@@ -414,7 +690,9 @@ After outputting a tool call, provide a brief spoken response.
 - Always provide a spoken response along with tool calls
 - Only use tools when the user's intent clearly matches the tool's purpose
 """
+        return self._prompt_cache["to_local_llm_prompt"]
     
+    @_serialized_init
     def initialize_default_tools(self) -> None:
         """
         Register all built-in tools.
@@ -427,69 +705,18 @@ After outputting a tool call, provide a brief spoken response.
         
         logger.info("Initializing default tools...")
         
-        # Import and register telephony tools
-        try:
-            from src.tools.telephony.unified_transfer import UnifiedTransferTool
-            self.register(UnifiedTransferTool)
-        except ImportError as e:
-            logger.warning(f"Could not import UnifiedTransferTool: {e}")
-
-        try:
-            from src.tools.telephony.attended_transfer import AttendedTransferTool
-            self.register(AttendedTransferTool)
-        except ImportError as e:
-            logger.warning(f"Could not import AttendedTransferTool: {e}")
-        
-        try:
-            from src.tools.telephony.cancel_transfer import CancelTransferTool
-            self.register(CancelTransferTool)
-        except ImportError as e:
-            logger.warning(f"Could not import CancelTransferTool: {e}")
-        
-        try:
-            from src.tools.telephony.hangup import HangupCallTool
-            self.register(HangupCallTool)
-        except ImportError as e:
-            logger.warning(f"Could not import HangupCallTool: {e}")
-        
-        try:
-            from src.tools.telephony.voicemail import VoicemailTool
-            self.register(VoicemailTool)
-        except ImportError as e:
-            logger.warning(f"Could not import VoicemailTool: {e}")
-
-        try:
-            from src.tools.telephony.check_extension_status import CheckExtensionStatusTool
-            self.register(CheckExtensionStatusTool)
-        except ImportError as e:
-            logger.warning(f"Could not import CheckExtensionStatusTool: {e}")
-
-        try:
-            from src.tools.telephony.live_agent_transfer import LiveAgentTransferTool
-            self.register(LiveAgentTransferTool)
-        except ImportError as e:
-            logger.warning(f"Could not import LiveAgentTransferTool: {e}")
-        
-        # Business tools
-        try:
-            from src.tools.business.email_summary import SendEmailSummaryTool
-            self.register(SendEmailSummaryTool)
-        except ImportError as e:
-            logger.warning(f"Could not import SendEmailSummaryTool: {e}")
-        
-        try:
-            from src.tools.business.request_transcript import RequestTranscriptTool
-            self.register(RequestTranscriptTool)
-        except ImportError as e:
-            logger.warning(f"Could not import RequestTranscriptTool: {e}")
-        
-        # Future tools will be registered here:
-        # from src.tools.telephony.voicemail import SendToVoicemailTool
-        # self.register(SendToVoicemailTool)
+        for module_name, class_name in _DEFAULT_TOOLS:
+            try:
+                tool_class = getattr(importlib.import_module(module_name), class_name)
+            except (ImportError, AttributeError) as e:
+                logger.warning(f"Could not import {class_name}: {e}")
+                continue
+            self.register(tool_class)
         
         self._initialized = True
         logger.info(f"🛠️  Initialized {len(self._tools)} tools")
     
+    @_serialized_init
     def initialize_http_tools_from_config(self, tools_config: Dict[str, Any]) -> None:
         """
         Initialize HTTP lookup and webhook tools from YAML config.
@@ -504,6 +731,7 @@ After outputting a tool call, provide a brief spoken response.
             return
         
         http_tool_count = 0
+        failures: List[Tuple[str, Exception]] = []
         
         for tool_name, tool_config in tools_config.items():
             if not isinstance(tool_config, dict):
@@ -519,7 +747,7 @@ After outputting a tool call, provide a brief spoken response.
                     http_tool_count += 1
                     logger.info(f"✅ Registered HTTP lookup tool: {tool_name}")
                 except Exception as e:  # noqa: BLE001 - best-effort tool bootstrapping from user config
-                    logger.warning(f"Failed to create HTTP lookup tool {tool_name}: {e}", exc_info=True)
+                    failures.append((tool_name, e))
             
             elif kind == 'generic_webhook':
                 try:
@@ -529,11 +757,13 @@ After outputting a tool call, provide a brief spoken response.
                     http_tool_count += 1
                     logger.info(f"✅ Registered webhook tool: {tool_name}")
                 except Exception as e:  # noqa: BLE001 - best-effort tool bootstrapping from user config
-                    logger.warning(f"Failed to create webhook tool {tool_name}: {e}", exc_info=True)
+                    failures.append((tool_name, e))
         
+        _log_bootstrap_failures("HTTP", failures)
         if http_tool_count > 0:
             logger.info(f"🌐 Initialized {http_tool_count} HTTP tools from config")
 
+    @_serialized_init
     def initialize_in_call_http_tools_from_config(self, in_call_tools_config: Dict[str, Any], *, cache_key: Optional[str] = None) -> None:
         """
         Initialize in-call HTTP tools from YAML config.
@@ -550,8 +780,7 @@ After outputting a tool call, provide a brief spoken response.
         effective_key = cache_key
         if not effective_key:
             try:
-                payload = json.dumps(in_call_tools_config, sort_keys=True, default=str).encode("utf-8")
-                effective_key = hashlib.sha256(payload).hexdigest()
+                effective_key = _config_fingerprint(in_call_tools_config)
             except Exception:
                 effective_key = repr(in_call_tools_config)
 
@@ -559,6 +788,7 @@ After outputting a tool call, provide a brief spoken response.
             return
         
         in_call_tool_count = 0
+        failures: List[Tuple[str, Exception]] = []
         
         for tool_name, tool_config in in_call_tools_config.items():
             if not isinstance(tool_config, dict):
@@ -580,20 +810,26 @@ After outputting a tool call, provide a brief spoken response.
                     in_call_tool_count += 1
                     logger.info(f"✅ Registered in-call HTTP tool: {tool_name}")
                 except Exception as e:  # noqa: BLE001 - best-effort tool bootstrapping from user config
-                    logger.warning(f"Failed to create in-call HTTP tool {tool_name}: {e}", exc_info=True)
+                    failures.append((tool_name, e))
         
+        _log_bootstrap_failures("in-call HTTP", failures)
         if in_call_tool_count > 0:
             logger.info(f"📞 Initialized {in_call_tool_count} in-call HTTP tools from config")
         self._in_call_http_init_cache.add(effective_key)
     
-    def list_tools(self) -> List[str]:
+    def list_tools(self, copy: bool = False) -> Union[Tuple[str, ...], List[str]]:
         """
         Get list of all tool names.
         
+        Args:
+            copy: Return a new list the caller may mutate
+        
         Returns:
-            List of tool names
+            Immutable tuple snapshot of tool names, or a list when copy=True
         """
-        return list(self._tools.keys())
+        if self._names_snapshot is None:
+            self._names_snapshot = tuple(self._tools)
+        return list(self._names_snapshot) if copy else self._names_snapshot
     
     def clear(self) -> None:
         """
@@ -602,6 +838,11 @@ After outputting a tool call, provide a brief spoken response.
         Mainly for testing purposes.
         """
         self._tools.clear()
+        self._by_phase.clear()
+        self._by_category.clear()
+        self._global_by_phase.clear()
+        self._get_resolve = dict(self._CLOSED_ALIASES)
+        self._invalidate()
         self._initialized = False
         self._in_call_http_init_cache.clear()
         logger.info("Cleared all registered tools")
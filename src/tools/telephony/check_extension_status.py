@@ -9,20 +9,99 @@ Notes:
 - Uses ARI deviceStates API (GET /ari/deviceStates/{deviceStateName}).
 - Device state name is usually "<TECH>/<EXT>" (e.g., "PJSIP/2765" or "SIP/6000").
 - Tech selection should be configurable per extension via Admin UI (stored under tools.extensions.internal).
+- Resolvers return config entries as-is (ExtEntry) rather than copies; treat them as read-only.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple, List
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple, List
 from urllib.parse import quote
 
 import structlog
 
 from src.tools.base import Tool, ToolDefinition, ToolParameter, ToolCategory, ToolPhase
 from src.tools.context import ToolExecutionContext
+from src.tools.telephony.config_index import ConfigIndexCache
 
 logger = structlog.get_logger(__name__)
 
+# A config entry handed out by the resolvers below; shared with the live config, never mutated.
+ExtEntry = Mapping[str, Any]
+
+# Device/endpoint state is re-queried within seconds while the model decides on a
+# transfer; a short TTL absorbs those repeats without hiding real state changes.
+_DEFAULT_ARI_CACHE_TTL_SECONDS = 1.0
+_ARI_CACHE_MAX_ENTRIES = 256
+
+# Device states that leave availability open; only these warrant the extra endpoint probe.
+_AMBIGUOUS_DEVICE_STATES = frozenset({"", "INVALID", "UNKNOWN"})
+
+
+def _retrieve_task_exception(task: "asyncio.Task[Any]") -> None:
+    # Callers re-raise the error themselves; this only stops asyncio from logging
+    # "exception was never retrieved" when every caller was cancelled first.
+    if not task.cancelled():
+        task.exception()
+
+
+class _AriGetCache:
+    """Short-lived cache for ARI GET responses with single-flight for concurrent lookups."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+
+    async def get(self, ari_client: Any, resource: str, ttl: float) -> Any:
+        if ttl <= 0:
+            return await ari_client.send_command(method="GET", resource=resource)
+
+        entry = self._entries.get(resource)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        # The GET runs in its own task that every caller awaits through shield(), so cancelling
+        # any one caller (e.g. a losing tech probe) never cancels the fetch the others share.
+        task = self._inflight.get(resource)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(ari_client, resource))
+            task.add_done_callback(_retrieve_task_exception)
+            self._inflight[resource] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(self, ari_client: Any, resource: str) -> Any:
+        try:
+            resp = await ari_client.send_command(method="GET", resource=resource)
+            self._store(resource, resp)
+            return resp
+        finally:
+            self._inflight.pop(resource, None)
+
+    def _store(self, resource: str, resp: Any) -> None:
+        now = time.monotonic()
+        if len(self._entries) >= _ARI_CACHE_MAX_ENTRIES:
+            # Entries older than the longest sane TTL are dead weight; drop them first.
+            for key in [k for k, (ts, _) in self._entries.items() if now - ts >= 60.0]:
+                del self._entries[key]
+            if len(self._entries) >= _ARI_CACHE_MAX_ENTRIES:
+                self._entries.pop(next(iter(self._entries)))
+        self._entries[resource] = (now, resp)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _strip(value: Any) -> str:
+    """str(value or "").strip() without building the intermediate "" for missing values."""
+    return str(value).strip() if value else ""
+
+
+def _s(value: Any) -> str:
+    """Case-folded _strip(), for comparing config names/types."""
+    return str(value).strip().lower() if value else ""
+
 
 def _as_str_list(value: Any) -> List[str]:
     if value is None:
@@ -33,13 +112,34 @@ def _as_str_list(value: Any) -> List[str]:
         return [str(v) for v in value if v is not None]
     return [str(value)]
 
+def _coerce_cache_ttl(value: Any) -> float:
+    try:
+        ttl = float(value)
+    except (TypeError, ValueError):
+        return _DEFAULT_ARI_CACHE_TTL_SECONDS
+    return ttl if ttl > 0 else 0.0
+
+
+def _is_ext_num(value: str) -> bool:
+    """_looks_like_extension_number for values already stripped by the caller."""
+    # str.isdigit() is False for "", so no separate emptiness check is needed.
+    return value.isdigit()
+
+
 def _looks_like_extension_number(value: str) -> bool:
-    value = (value or "").strip()
-    return bool(value) and value.isdigit()
+    return _is_ext_num((value or "").strip())
+
+
+# Common channel techs, matched by prefix before falling back to a general split.
+_KNOWN_TECH_PREFIXES = ("PJSIP/", "SIP/", "IAX2/", "Local/", "DAHDI/", "Motif/")
 
 
 def _parse_dial_string_tech(dial_string: str) -> Optional[str]:
-    dial_string = (dial_string or "").strip()
+    dial_string = (dial_string or "").lstrip()
+    for prefix in _KNOWN_TECH_PREFIXES:
+        if dial_string.startswith(prefix):
+            return prefix[:-1]
+    dial_string = dial_string.rstrip()
     if not dial_string:
         return None
     # Common patterns: "PJSIP/2765", "SIP/6000", "PJSIP/2765@from-internal"
@@ -51,11 +151,78 @@ def _parse_dial_string_tech(dial_string: str) -> Optional[str]:
     return tech
 
 
+@dataclass(frozen=True)
+class _ExtensionIndex:
+    """Lookup tables derived from tools.extensions.internal."""
+
+    # Lowercased name/alias -> (config key, resolution source); first entry in config order wins.
+    by_label: Dict[str, Tuple[Any, str]]
+    # Every X for which an entry's dial_string ends with "/X" or contains "/X@" -> first such key.
+    by_dial_suffix: Dict[str, Any]
+
+
+# Indexes hold config keys, not entries, so a hit never hands out fields the fingerprint
+# does not cover; callers read the entry from their own config copy.
+_EXT_INDEX_CACHE: ConfigIndexCache[_ExtensionIndex] = ConfigIndexCache()
+
+
+def _dial_string_suffixes(dial_string: str) -> List[str]:
+    suffixes: List[str] = []
+    slash = dial_string.find("/")
+    while slash != -1:
+        start = slash + 1
+        suffixes.append(dial_string[start:])
+        at = dial_string.find("@", start)
+        while at != -1:
+            suffixes.append(dial_string[start:at])
+            at = dial_string.find("@", at + 1)
+        slash = dial_string.find("/", start)
+    return suffixes
+
+
+def _build_extension_index(extensions_config: Dict[str, Any]) -> _ExtensionIndex:
+    by_label: Dict[str, Tuple[Any, str]] = {}
+    by_dial_suffix: Dict[str, Any] = {}
+    for key, ext_cfg in extensions_config.items():
+        if not isinstance(ext_cfg, dict):
+            continue
+        name = _s(ext_cfg.get("name"))
+        if name:
+            by_label.setdefault(name, (key, "config.name"))
+        for alias in _as_str_list(ext_cfg.get("aliases")):
+            alias = alias.strip().lower()
+            if alias:
+                by_label.setdefault(alias, (key, "config.alias"))
+        for suffix in _dial_string_suffixes(str(ext_cfg.get("dial_string", "") or "")):
+            by_dial_suffix.setdefault(suffix, key)
+    return _ExtensionIndex(by_label=by_label, by_dial_suffix=by_dial_suffix)
+
+
+def _extension_index_fingerprint(extensions_config: Dict[str, Any]) -> Tuple[Any, ...]:
+    """The fields _build_extension_index reads, per entry, in config order."""
+    fingerprint = []
+    for key, ext_cfg in extensions_config.items():
+        if isinstance(ext_cfg, dict):
+            aliases = ext_cfg.get("aliases")
+            if isinstance(aliases, list):
+                aliases = tuple(aliases)
+            fingerprint.append((key, ext_cfg.get("name"), aliases, ext_cfg.get("dial_string")))
+    return tuple(fingerprint)
+
+
+def _get_extension_index(extensions_config: Dict[str, Any]) -> _ExtensionIndex:
+    """Return the index for this config's content, built once per distinct content."""
+    return _EXT_INDEX_CACHE.get(
+        _extension_index_fingerprint(extensions_config),
+        lambda: _build_extension_index(extensions_config),
+    )
+
+
 def _resolve_extension_entry(
     *,
     target: str,
     extensions_config: Dict[str, Any],
-) -> Tuple[str, Dict[str, Any], str]:
+) -> Tuple[str, ExtEntry, str]:
     """
     Resolve a user-supplied target (e.g., "2765", "support", "sales_agent") to a configured extension entry.
 
@@ -67,21 +234,12 @@ def _resolve_extension_entry(
         return "", {}, ""
 
     if target in extensions_config and isinstance(extensions_config.get(target), dict):
-        return target, dict(extensions_config[target]), "config.key"
-
-    target_lower = target.lower()
-    for ext_num, ext_cfg in extensions_config.items():
-        if not isinstance(ext_num, str):
-            ext_num = str(ext_num)
-        if not isinstance(ext_cfg, dict):
-            continue
-        name = str(ext_cfg.get("name", "") or "").strip().lower()
-        if name and name == target_lower:
-            return ext_num, dict(ext_cfg), "config.name"
+        return target, extensions_config[target], "config.key"
 
-        aliases = [a.strip().lower() for a in _as_str_list(ext_cfg.get("aliases")) if a.strip()]
-        if target_lower in aliases:
-            return ext_num, dict(ext_cfg), "config.alias"
+    hit = _get_extension_index(extensions_config).by_label.get(target.lower())
+    if hit is not None:
+        key, source = hit
+        return str(key), extensions_config[key], source
 
     return "", {}, ""
 
@@ -89,7 +247,7 @@ def _resolve_transfer_destination_extension(
     *,
     target: str,
     destinations: Dict[str, Any],
-) -> Tuple[str, Dict[str, Any], str]:
+) -> Tuple[str, ExtEntry, str]:
     """
     Resolve a transfer destination key (tools.transfer.destinations.<key>) to an extension number.
 
@@ -104,14 +262,14 @@ def _resolve_transfer_destination_extension(
     if not isinstance(dest, dict):
         return "", {}, ""
 
-    if str(dest.get("type", "") or "").strip().lower() != "extension":
+    if _s(dest.get("type")) != "extension":
         return "", {}, ""
 
-    ext = str(dest.get("target", "") or "").strip()
-    if not _looks_like_extension_number(ext):
+    ext = _strip(dest.get("target"))
+    if not _is_ext_num(ext):
         return "", {}, ""
 
-    return ext, dict(dest), "config.transfer.destinations"
+    return ext, dest, "config.transfer.destinations"
 
 
 def _resolve_device_state_id(
@@ -140,20 +298,16 @@ def _resolve_device_state_id(
 
     # Best-effort: if the extension isn't keyed by its number, try to match by dial_string suffix.
     if entry is None and isinstance(extensions_config, dict):
-        for _, cfg in extensions_config.items():
-            if not isinstance(cfg, dict):
-                continue
-            dial_string = str(cfg.get("dial_string", "") or "")
-            if dial_string.endswith(f"/{extension}") or f"/{extension}@" in dial_string:
-                entry = cfg
-                break
+        key = _get_extension_index(extensions_config).by_dial_suffix.get(extension)
+        if key is not None:
+            entry = extensions_config[key]
 
     if isinstance(entry, dict):
-        cfg_state_id = str(entry.get("device_state_id", "") or "").strip()
+        cfg_state_id = _strip(entry.get("device_state_id"))
         if cfg_state_id:
             return cfg_state_id, "config.device_state_id"
 
-        cfg_tech = str(entry.get("device_state_tech", "") or "").strip()
+        cfg_tech = _strip(entry.get("device_state_tech"))
         if cfg_tech and cfg_tech.lower() != "auto":
             tech = cfg_tech
             return f"{tech.upper()}/{extension}", "config.device_state_tech"
@@ -175,6 +329,8 @@ async def _probe_endpoint(
     context: ToolExecutionContext,
     tech: str,
     extension: str,
+    cache: Optional[_AriGetCache] = None,
+    cache_ttl: float = 0.0,
 ) -> Optional[Dict[str, Any]]:
     """
     Best-effort ARI endpoint probe.
@@ -187,11 +343,12 @@ async def _probe_endpoint(
     extension = (extension or "").strip()
     if not tech or not extension:
         return None
+    resource = f"endpoints/{tech}/{quote(extension, safe='')}"
     try:
-        resp = await context.ari_client.send_command(
-            method="GET",
-            resource=f"endpoints/{tech}/{quote(extension, safe='')}",
-        )
+        if cache is not None:
+            resp = await cache.get(context.ari_client, resource, cache_ttl)
+        else:
+            resp = await context.ari_client.send_command(method="GET", resource=resource)
     except Exception:
         logger.debug(
             "ARI endpoint probe failed",
@@ -210,7 +367,57 @@ async def _probe_endpoint(
     return resp
 
 
+async def _probe_first_endpoint(
+    *,
+    context: ToolExecutionContext,
+    techs: Tuple[str, ...],
+    extension: str,
+    cache: Optional[_AriGetCache] = None,
+    cache_ttl: float = 0.0,
+) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Probe all techs concurrently and return the first one (in preference order) with an endpoint.
+
+    Lower-preference probes still running once a winner is known are cancelled.
+    """
+    tasks = [
+        asyncio.create_task(
+            _probe_endpoint(context=context, tech=tech, extension=extension, cache=cache, cache_ttl=cache_ttl)
+        )
+        for tech in techs
+    ]
+    try:
+        for tech, task in zip(techs, tasks):
+            endpoint = await task
+            if endpoint:
+                return tech, endpoint
+        return "", None
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def _get_device_state(
+    *,
+    context: ToolExecutionContext,
+    encoded_id: str,
+    cache: _AriGetCache,
+    cache_ttl: float,
+) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """Query deviceStates/{encoded_id}; returns (response, error) instead of raising."""
+    if not encoded_id:
+        return None, None
+    try:
+        return await cache.get(context.ari_client, f"deviceStates/{encoded_id}", cache_ttl), None
+    except Exception as exc:
+        return None, exc
+
+
 class CheckExtensionStatusTool(Tool):
+    def __init__(self) -> None:
+        self._ari_cache = _AriGetCache()
+
     @property
     def definition(self) -> ToolDefinition:
         return ToolDefinition(
@@ -252,23 +459,32 @@ class CheckExtensionStatusTool(Tool):
         if not context.ari_client:
             return {"status": "error", "message": "ARI client not available in tool context"}
 
-        target = str(parameters.get("extension", "") or "").strip()
-        tech = str(parameters.get("tech", "") or "").strip()
-        device_state_id = str(parameters.get("device_state_id", "") or "").strip()
+        target = _strip(parameters.get("extension"))
+        tech = _strip(parameters.get("tech"))
+        device_state_id = _strip(parameters.get("device_state_id"))
 
         extensions_cfg = context.get_config_value("tools.extensions.internal", {}) or {}
         transfer_destinations = context.get_config_value("tools.transfer.destinations", {}) or {}
+        cache_ttl = _coerce_cache_ttl(
+            context.get_config_value("tools.check_extension_status.cache_ttl", _DEFAULT_ARI_CACHE_TTL_SECONDS)
+        )
+        if cache_ttl > 0:
+            ari_cache = self._ari_cache
+        else:
+            # Cross-call caching is off; still share identical GETs within this one execution
+            # (e.g. an endpoint probed during auto-detect and again during INVALID recovery).
+            ari_cache, cache_ttl = _AriGetCache(), float("inf")
 
         # Resolve what the caller/model provided into a real extension number.
         resolved_ext = ""
-        ext_entry: Dict[str, Any] = {}
+        ext_entry: ExtEntry = {}
         ext_source = ""
-        destination_cfg: Dict[str, Any] = {}
+        destination_cfg: ExtEntry = {}
         destination_source = ""
 
-        if _looks_like_extension_number(target):
+        if _is_ext_num(target):
             resolved_ext = target
-            ext_entry = dict(extensions_cfg.get(target) or {}) if isinstance(extensions_cfg, dict) else {}
+            ext_entry = (extensions_cfg.get(target) or {}) if isinstance(extensions_cfg, dict) else {}
             ext_source = "parameter.extension"
         else:
             # First, resolve via internal extension config (key/name/aliases).
@@ -279,7 +495,7 @@ class CheckExtensionStatusTool(Tool):
                     target=target, destinations=transfer_destinations
                 )
                 if resolved_ext and not ext_entry and isinstance(extensions_cfg, dict):
-                    ext_entry = dict(extensions_cfg.get(resolved_ext) or {})
+                    ext_entry = extensions_cfg.get(resolved_ext) or {}
 
         extension = resolved_ext or target
 
@@ -301,29 +517,18 @@ class CheckExtensionStatusTool(Tool):
                 resolved_id = ""
             else:
                 # Try common techs in an opinionated order (most FreePBX installs are PJSIP-first).
-                for candidate in ("PJSIP", "SIP"):
-                    endpoint = await _probe_endpoint(context=context, tech=candidate, extension=extension)
-                    if endpoint:
-                        endpoint_info = endpoint
-                        used_tech = candidate
-                        source = "ari.endpoints.detected"
-                        resolved_id = f"{candidate}/{extension}"
-                        break
-
-        # If we did resolve a tech (via config/param), also try to fetch endpoint state for extra context.
-        if not endpoint_info:
-            inferred_tech = ""
-            if device_state_id and "/" in device_state_id:
-                inferred_tech = device_state_id.split("/", 1)[0]
-            elif resolved_id and "/" in resolved_id:
-                inferred_tech = resolved_id.split("/", 1)[0]
-            elif tech:
-                inferred_tech = tech
-            if inferred_tech:
-                endpoint = await _probe_endpoint(context=context, tech=inferred_tech, extension=extension)
+                candidate, endpoint = await _probe_first_endpoint(
+                    context=context,
+                    techs=("PJSIP", "SIP"),
+                    extension=extension,
+                    cache=ari_cache,
+                    cache_ttl=cache_ttl,
+                )
                 if endpoint:
                     endpoint_info = endpoint
-                    used_tech = inferred_tech
+                    used_tech = candidate
+                    source = "ari.endpoints.detected"
+                    resolved_id = f"{candidate}/{extension}"
 
         if not resolved_id and not endpoint_info:
             logger.warning(
@@ -342,19 +547,41 @@ class CheckExtensionStatusTool(Tool):
                 "target": target,
             }
 
+        # If we did resolve a tech (via config/param), also fetch endpoint state for extra context.
+        inferred_tech = ""
+        if not endpoint_info:
+            if device_state_id and "/" in device_state_id:
+                inferred_tech = device_state_id.split("/", 1)[0]
+            elif resolved_id and "/" in resolved_id:
+                inferred_tech = resolved_id.split("/", 1)[0]
+            elif tech:
+                inferred_tech = tech
+
         # ARI expects deviceStateName in the URL path, so URL-encode slashes.
         encoded = quote(resolved_id, safe="") if resolved_id else ""
 
+        # The endpoint probe only adds context once the device state is definitive, so by default it
+        # is deferred until we know the state was ambiguous. With always_probe_endpoint both are
+        # issued together.
+        always_probe_endpoint = bool(
+            context.get_config_value("tools.check_extension_status.always_probe_endpoint", False)
+        )
+        endpoint: Optional[Dict[str, Any]] = None
+        if inferred_tech and always_probe_endpoint:
+            endpoint, (device_state_resp, device_state_exc) = await asyncio.gather(
+                _probe_endpoint(
+                    context=context, tech=inferred_tech, extension=extension, cache=ari_cache, cache_ttl=cache_ttl
+                ),
+                _get_device_state(context=context, encoded_id=encoded, cache=ari_cache, cache_ttl=cache_ttl),
+            )
+        else:
+            device_state_resp, device_state_exc = await _get_device_state(
+                context=context, encoded_id=encoded, cache=ari_cache, cache_ttl=cache_ttl
+            )
+
         device_state_error: Optional[str] = None
-        device_state_resp: Optional[Dict[str, Any]] = None
-        try:
-            if encoded:
-                device_state_resp = await context.ari_client.send_command(
-                    method="GET",
-                    resource=f"deviceStates/{encoded}",
-                )
-        except Exception as exc:
-            device_state_error = str(exc)
+        if device_state_exc is not None:
+            device_state_error = str(device_state_exc)
             logger.warning(
                 "ARI device state query failed; will fall back to endpoint state if available",
                 call_id=context.call_id,
@@ -372,35 +599,60 @@ class CheckExtensionStatusTool(Tool):
             state = str(device_state_resp.get("state", "") or "")
         state_norm = state.strip().upper()
 
+        endpoint_probe_skipped = False
+        if inferred_tech and not always_probe_endpoint:
+            if state_norm in _AMBIGUOUS_DEVICE_STATES:
+                endpoint = await _probe_endpoint(
+                    context=context, tech=inferred_tech, extension=extension, cache=ari_cache, cache_ttl=cache_ttl
+                )
+            else:
+                endpoint_probe_skipped = True
+        if endpoint:
+            endpoint_info = endpoint
+            used_tech = inferred_tech
+
         # If we got INVALID, try to recover (common when tech is wrong, e.g. SIP vs PJSIP).
         if state_norm == "INVALID" and not device_state_id:
             if _looks_like_extension_number(extension):
-                for candidate in ("PJSIP", "SIP"):
-                    if resolved_id and resolved_id.startswith(f"{candidate}/"):
-                        continue
-                    endpoint = await _probe_endpoint(context=context, tech=candidate, extension=extension)
-                    if not endpoint:
-                        continue
-                    try:
-                        candidate_id = f"{candidate}/{extension}"
-                        encoded_candidate = quote(candidate_id, safe="")
-                        candidate_resp = await context.ari_client.send_command(
-                            method="GET",
-                            resource=f"deviceStates/{encoded_candidate}",
+                candidates = [
+                    t for t in ("PJSIP", "SIP") if not (resolved_id and resolved_id.startswith(f"{t}/"))
+                ]
+                # Probe every candidate tech at once, then re-query device state only for techs
+                # that have an endpoint; the first usable answer in preference order wins.
+                endpoints = await asyncio.gather(
+                    *(
+                        _probe_endpoint(
+                            context=context, tech=t, extension=extension, cache=ari_cache, cache_ttl=cache_ttl
                         )
-                    except Exception:
+                        for t in candidates
+                    )
+                )
+                probed = [(t, ep) for t, ep in zip(candidates, endpoints) if ep]
+                state_results = await asyncio.gather(
+                    *(
+                        _get_device_state(
+                            context=context,
+                            encoded_id=quote(f"{t}/{extension}", safe=""),
+                            cache=ari_cache,
+                            cache_ttl=cache_ttl,
+                        )
+                        for t, _ in probed
+                    )
+                )
+                for (candidate, endpoint), (candidate_resp, candidate_exc) in zip(probed, state_results):
+                    if candidate_exc is not None:
                         logger.debug(
                             "ARI fallback probe failed",
                             tech=candidate,
                             extension=extension,
-                            exc_info=True,
+                            exc_info=candidate_exc,
                         )
                         continue
                     if isinstance(candidate_resp, dict):
                         cstate = str(candidate_resp.get("state", "") or "").strip().upper()
                         if cstate and cstate != "INVALID":
                             device_state_resp = candidate_resp
-                            resolved_id = candidate_id
+                            resolved_id = f"{candidate}/{extension}"
                             state_norm = cstate
                             name = str(candidate_resp.get("name", "") or "")
                             source = "ari.deviceStates.fallback"
@@ -461,6 +713,8 @@ class CheckExtensionStatusTool(Tool):
             result["endpoint_channel_ids"] = endpoint_channel_ids
             if used_tech:
                 result["tech"] = used_tech
+        elif endpoint_probe_skipped:
+            result["tech"] = inferred_tech
 
         if warnings:
             result["warnings"] = warnings
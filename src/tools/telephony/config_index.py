@@ -0,0 +1,35 @@
+"""
+Memo for lookup indexes derived from tool config.
+
+Tool contexts carry a fresh ``config.dict()`` copy per call, so indexes are keyed on a
+fingerprint of the config fields they read rather than on the config object itself.
+"""
+
+from typing import Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class ConfigIndexCache(Generic[T]):
+    """Bounded fingerprint -> index memo; the oldest entry is evicted first."""
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self._max_entries = max_entries
+        self._entries: Dict[Hashable, T] = {}
+
+    def get(self, fingerprint: Hashable, build: Callable[[], T]) -> T:
+        """Return the index for fingerprint, calling build() on a miss."""
+        try:
+            index = self._entries.get(fingerprint)
+        except TypeError:
+            # Unhashable config values (e.g. nested lists): build without caching.
+            return build()
+        if index is None:
+            index = build()
+            if len(self._entries) >= self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[fingerprint] = index
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
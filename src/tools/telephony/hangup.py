@@ -16,6 +16,9 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+_FAREWELL_CONFIG_KEY = 'tools.hangup_call.farewell_message'
+_DEFAULT_FAREWELL = "Thank you for calling. Goodbye!"
+
 
 class HangupCallTool(Tool):
     """
@@ -89,10 +92,7 @@ class HangupCallTool(Tool):
         farewell = parameters.get('farewell_message')
         
         if not farewell:
-            farewell = context.get_config_value(
-                'tools.hangup_call.farewell_message',
-                "Thank you for calling. Goodbye!"
-            )
+            farewell = context.get_config_value(_FAREWELL_CONFIG_KEY, _DEFAULT_FAREWELL)
         
         logger.info("📞 Hangup requested", 
                    call_id=context.call_id,
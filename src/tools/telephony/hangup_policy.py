@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import json
 import re
-from typing import Any, Dict, Iterable, List
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple, Union
 
 DEFAULT_HANGUP_MARKERS: Dict[str, List[str]] = {
     "end_call": [
@@ -76,16 +79,72 @@ DEFAULT_HANGUP_POLICY: Dict[str, Any] = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class MarkerSet:
+    """A normalized marker bucket, precompiled so a transcript is scanned once."""
+
+    markers: Tuple[str, ...]
+    # text_contains_marker semantics: multi-word markers as plain substrings, single-word
+    # markers whole-word via one alternation. str.__contains__ beats a regex alternation of
+    # literals, so phrases are kept out of the pattern.
+    phrases: Tuple[str, ...]
+    single_word_pattern: Optional[Pattern[str]]
+    # Every marker whole-word (text_contains_marker_word semantics).
+    word_pattern: Optional[Pattern[str]]
+
+    def search(self, normalized_text: str) -> bool:
+        for phrase in self.phrases:
+            if phrase in normalized_text:
+                return True
+        return self.single_word_pattern is not None and self.single_word_pattern.search(normalized_text) is not None
+
+    def search_words(self, normalized_text: str) -> bool:
+        return self.word_pattern is not None and self.word_pattern.search(normalized_text) is not None
+
+
+MarkerSource = Union[Iterable[str], MarkerSet]
+
+_MARKER_BUCKETS = ("end_call", "assistant_farewell", "affirmative", "negative")
+
+
+@dataclass(frozen=True, slots=True)
+class HangupPolicy:
+    """Normalized tools.hangup_call.policy; immutable, so instances are shared freely."""
+
+    mode: str
+    enforce_transcript_offer: bool
+    block_during_contact_capture: bool
+    end_call: MarkerSet
+    assistant_farewell: MarkerSet
+    affirmative: MarkerSet
+    negative: MarkerSet
+
+    def marker_sets(self) -> Dict[str, MarkerSet]:
+        return {bucket: getattr(self, bucket) for bucket in _MARKER_BUCKETS}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form, shaped like the config section."""
+        return {
+            "mode": self.mode,
+            "enforce_transcript_offer": self.enforce_transcript_offer,
+            "block_during_contact_capture": self.block_during_contact_capture,
+            "markers": {bucket: list(getattr(self, bucket).markers) for bucket in _MARKER_BUCKETS},
+        }
+
+
+@functools.lru_cache(maxsize=512)
 def _normalize_text(value: str) -> str:
     return " ".join((value or "").strip().lower().split())
 
 
+_MARKER_SPLIT_RE = re.compile(r"[\n,]+")
+
+
 def _coerce_marker_list(value: Any) -> List[str]:
     if value is None:
         return []
     if isinstance(value, str):
-        parts = re.split(r"[\n,]+", value)
-        return [p.strip().lower() for p in parts if p.strip()]
+        return [s for s in (p.strip().lower() for p in _MARKER_SPLIT_RE.split(value)) if s]
     if isinstance(value, (list, tuple, set)):
         out: List[str] = []
         for item in value:
@@ -114,36 +173,60 @@ def normalize_marker_list(value: Any, fallback: List[str]) -> List[str]:
     return _dedupe(items)
 
 
-def normalize_hangup_policy(policy: Any) -> Dict[str, Any]:
+_POLICY_CACHE_MAX_ENTRIES = 16
+_POLICY_CACHE: Dict[str, HangupPolicy] = {}
+
+
+def _policy_cache_key(policy: Any) -> Optional[str]:
+    try:
+        return json.dumps(policy, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_hangup_policy(policy: Any) -> HangupPolicy:
+    """Return the normalized policy, memoized on the policy's content."""
+    if isinstance(policy, HangupPolicy):
+        return policy
     if not isinstance(policy, dict):
         policy = {}
+    key = _policy_cache_key(policy)
+    if key is None:
+        return _build_hangup_policy(policy)
+    cached = _POLICY_CACHE.get(key)
+    if cached is None:
+        cached = _build_hangup_policy(policy)
+        if len(_POLICY_CACHE) >= _POLICY_CACHE_MAX_ENTRIES:
+            _POLICY_CACHE.pop(next(iter(_POLICY_CACHE)))
+        _POLICY_CACHE[key] = cached
+    return cached
+
 
+def _build_hangup_policy(policy: Dict[str, Any]) -> HangupPolicy:
     mode = str(policy.get("mode") or DEFAULT_HANGUP_POLICY["mode"]).strip().lower()
     if mode not in ("relaxed", "normal", "strict"):
         mode = DEFAULT_HANGUP_POLICY["mode"]
 
     markers_cfg = policy.get("markers") if isinstance(policy.get("markers"), dict) else {}
 
-    markers = {
-        "end_call": normalize_marker_list(markers_cfg.get("end_call"), DEFAULT_HANGUP_MARKERS["end_call"]),
-        "assistant_farewell": normalize_marker_list(markers_cfg.get("assistant_farewell"), DEFAULT_HANGUP_MARKERS["assistant_farewell"]),
-        "affirmative": normalize_marker_list(markers_cfg.get("affirmative"), DEFAULT_HANGUP_MARKERS["affirmative"]),
-        "negative": normalize_marker_list(markers_cfg.get("negative"), DEFAULT_HANGUP_MARKERS["negative"]),
-    }
+    marker_sets: Dict[str, MarkerSet] = {}
+    for bucket in _MARKER_BUCKETS:
+        items = _coerce_marker_list(markers_cfg.get(bucket))
+        marker_sets[bucket] = compile_markers(_dedupe(items)) if items else _DEFAULT_COMPILED[bucket]
 
-    return {
-        "mode": mode,
-        "enforce_transcript_offer": bool(
+    return HangupPolicy(
+        mode=mode,
+        enforce_transcript_offer=bool(
             policy.get("enforce_transcript_offer", DEFAULT_HANGUP_POLICY["enforce_transcript_offer"])
         ),
-        "block_during_contact_capture": bool(
+        block_during_contact_capture=bool(
             policy.get("block_during_contact_capture", DEFAULT_HANGUP_POLICY["block_during_contact_capture"])
         ),
-        "markers": markers,
-    }
+        **marker_sets,
+    )
 
 
-def resolve_hangup_policy(tools_cfg: Any) -> Dict[str, Any]:
+def resolve_hangup_policy(tools_cfg: Any) -> HangupPolicy:
     if isinstance(tools_cfg, dict):
         hangup_cfg = tools_cfg.get("hangup_call")
         if isinstance(hangup_cfg, dict):
@@ -151,32 +234,78 @@ def resolve_hangup_policy(tools_cfg: Any) -> Dict[str, Any]:
     return normalize_hangup_policy({})
 
 
-def text_contains_marker(text: str, markers: Iterable[str]) -> bool:
-    t = _normalize_text(text)
-    if not t:
-        return False
+@functools.lru_cache(maxsize=64)
+def _compile_marker_tuple(markers: Tuple[str, ...]) -> MarkerSet:
+    words: List[str] = []
+    phrases: List[str] = []
     for m in markers:
+        m = m.strip().lower()
         if not m:
             continue
-        m = str(m).strip().lower()
-        if not m:
-            continue
-        # Multi-word markers use substring matching after normalization.
+        # Multi-word markers use substring matching after normalization; single-word
+        # markers match whole words to avoid false positives (e.g., "no" in "notification").
         if " " in m:
-            if m in t:
-                return True
-            continue
-        # Single-word markers should match whole words to avoid false positives (e.g., "no" in "notification").
-        if re.search(rf"(?:^|\b){re.escape(m)}(?:\b|$)", t):
-            return True
-    return False
+            phrases.append(m)
+        else:
+            words.append(re.escape(m))
+    single_word_pattern = re.compile(rf"(?:^|\b)(?:{'|'.join(words)})(?:\b|$)") if words else None
+    return MarkerSet(
+        markers=markers,
+        phrases=tuple(phrases),
+        single_word_pattern=single_word_pattern,
+        word_pattern=_word_marker_pattern(markers),
+    )
+
+
+def compile_markers(markers: MarkerSource) -> MarkerSet:
+    if isinstance(markers, MarkerSet):
+        return markers
+    return _compile_marker_tuple(tuple(str(m) for m in markers if m))
+
 
+@functools.lru_cache(maxsize=64)
+def _word_marker_pattern(markers: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    if not markers:
+        return None
+    return re.compile(rf"(?:^|\b)(?:{'|'.join(map(re.escape, markers))})(?:\b|$)")
 
-def text_contains_marker_word(text: str, markers: Iterable[str]) -> bool:
+
+# Defaults deduped and compiled once at import; a policy that leaves a bucket unset reuses them.
+_DEFAULT_MARKERS_NORMALIZED: Dict[str, Tuple[str, ...]] = {
+    bucket: tuple(_dedupe(items)) for bucket, items in DEFAULT_HANGUP_MARKERS.items()
+}
+_DEFAULT_COMPILED: Dict[str, MarkerSet] = {
+    bucket: compile_markers(items) for bucket, items in _DEFAULT_MARKERS_NORMALIZED.items()
+}
+
+
+def text_contains_marker(text: str, markers: MarkerSource) -> bool:
     t = _normalize_text(text)
     if not t:
         return False
-    for m in markers:
-        if re.search(rf"(?:^|\b){re.escape(m)}(?:\b|$)", t):
-            return True
-    return False
+    return compile_markers(markers).search(t)
+
+
+def text_contains_marker_compiled(text: str, compiled: MarkerSet) -> bool:
+    """text_contains_marker for a prebuilt MarkerSet (e.g. policy.end_call); skips list handling."""
+    t = _normalize_text(text)
+    return bool(t) and compiled.search(t)
+
+
+def text_contains_marker_word(text: str, markers: MarkerSource) -> bool:
+    t = _normalize_text(text)
+    if not t:
+        return False
+    if isinstance(markers, MarkerSet):
+        return markers.search_words(t)
+    pattern = _word_marker_pattern(tuple(markers))
+    return pattern is not None and pattern.search(t) is not None
+
+
+def classify_text(text: str, policy: Union[HangupPolicy, Dict[str, Any]]) -> Set[str]:
+    """Return the marker buckets (end_call, affirmative, ...) that match text, normalizing it once."""
+    t = _normalize_text(text)
+    if not t:
+        return set()
+    policy = normalize_hangup_policy(policy)
+    return {bucket for bucket in _MARKER_BUCKETS if getattr(policy, bucket).search(t)}
@@ -7,21 +7,80 @@ Default behavior (v6.1.1+): route to configured Live Agents (`tools.extensions.i
 Advanced/legacy override: route via a transfer destination key (`tools.transfer.*`).
 """
 
+from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple, List, Mapping
 
 import structlog
 
 from src.tools.base import Tool, ToolCategory, ToolDefinition
 from src.tools.context import ToolExecutionContext
+from src.tools.telephony.config_index import ConfigIndexCache
 from src.tools.telephony.unified_transfer import UnifiedTransferTool
 
 logger = structlog.get_logger(__name__)
 
+# Destination names treat "_" and "-" as word separators.
+_NORMALIZE_TABLE = str.maketrans({"_": " ", "-": " "})
+
+
+@dataclass(frozen=True)
+class _LiveAgentDestinationIndex:
+    """Live-agent facts derived from tools.transfer.destinations in one pass."""
+
+    # Keys marked `live_agent: true`, in config order.
+    live_agent_keys: Tuple[str, ...]
+    # Whether the conventional "live_agent" key exists.
+    has_default_key: bool
+    # Extension target -> live-agent destination keys (marked, or the conventional key) of type extension.
+    ext_to_keys: Dict[str, Tuple[str, ...]]
+
+
+_EMPTY_INDEX = _LiveAgentDestinationIndex(live_agent_keys=(), has_default_key=False, ext_to_keys={})
+
+_LIVE_AGENT_INDEX_CACHE: ConfigIndexCache[_LiveAgentDestinationIndex] = ConfigIndexCache()
+
+
+def _build_live_agent_index(destinations: Dict[str, Any]) -> _LiveAgentDestinationIndex:
+    live_agent_keys: List[str] = []
+    ext_to_keys: Dict[str, List[str]] = {}
+    for key, cfg in destinations.items():
+        if not isinstance(cfg, dict):
+            continue
+        is_live_agent = bool(cfg.get("live_agent"))
+        if is_live_agent:
+            live_agent_keys.append(str(key))
+        # Only map to destinations explicitly marked as live-agent (or the conventional key),
+        # otherwise we risk labeling a live-agent transfer as "Support agent", etc.
+        if key != "live_agent" and not is_live_agent:
+            continue
+        if str(cfg.get("type", "") or "").strip().lower() == "extension":
+            target = str(cfg.get("target", "") or "").strip()
+            ext_to_keys.setdefault(target, []).append(str(key))
+    return _LiveAgentDestinationIndex(
+        live_agent_keys=tuple(live_agent_keys),
+        has_default_key="live_agent" in destinations,
+        ext_to_keys={ext: tuple(keys) for ext, keys in ext_to_keys.items()},
+    )
+
+
+def _get_live_agent_index(transfer_cfg: Any) -> _LiveAgentDestinationIndex:
+    """Return the index for transfer_cfg["destinations"], built once per distinct content."""
+    destinations = (transfer_cfg.get("destinations") or {}) if isinstance(transfer_cfg, dict) else {}
+    if not isinstance(destinations, dict) or not destinations:
+        return _EMPTY_INDEX
+
+    # Only the fields _build_live_agent_index reads, so unrelated edits keep the index.
+    fingerprint = tuple([
+        (key, cfg.get("live_agent"), cfg.get("type"), cfg.get("target")) if isinstance(cfg, dict) else (key,)
+        for key, cfg in destinations.items()
+    ])
+    return _LIVE_AGENT_INDEX_CACHE.get(fingerprint, lambda: _build_live_agent_index(destinations))
+
 
 class LiveAgentTransferTool(Tool):
     @staticmethod
     def _normalize_text(value: Any) -> str:
-        return " ".join(str(value or "").strip().lower().replace("_", " ").replace("-", " ").split())
+        return " ".join(str(value).lower().translate(_NORMALIZE_TABLE).split()) if value else ""
 
     @property
     def definition(self) -> ToolDefinition:
@@ -73,16 +132,13 @@ class LiveAgentTransferTool(Tool):
         if not isinstance(destinations, dict) or not destinations:
             return None, "no_destinations"
 
-        live_agent_keys: List[str] = []
-        for key, cfg in destinations.items():
-            if isinstance(cfg, dict) and bool(cfg.get("live_agent")):
-                live_agent_keys.append(str(key))
-        if len(live_agent_keys) == 1:
-            return live_agent_keys[0], "destinations.<key>.live_agent"
-        if len(live_agent_keys) > 1:
+        index = _get_live_agent_index(transfer_cfg)
+        if len(index.live_agent_keys) == 1:
+            return index.live_agent_keys[0], "destinations.<key>.live_agent"
+        if len(index.live_agent_keys) > 1:
             return None, "destinations.live_agent_ambiguous"
 
-        if "live_agent" in destinations:
+        if index.has_default_key:
             return "live_agent", "default.live_agent_key"
 
         return None, "unconfigured"
@@ -154,21 +210,7 @@ class LiveAgentTransferTool(Tool):
         extension: str,
         transfer_cfg: Dict[str, Any],
     ) -> Optional[str]:
-        destinations = (transfer_cfg.get("destinations") or {}) if isinstance(transfer_cfg, dict) else {}
-        matches: List[str] = []
-
-        for key, cfg in destinations.items():
-            if not isinstance(cfg, dict):
-                continue
-            # Only map to destinations explicitly marked as live-agent (or the conventional key),
-            # otherwise we risk labeling a live-agent transfer as "Support agent", etc.
-            if key != "live_agent" and not bool(cfg.get("live_agent")):
-                continue
-            transfer_type = str(cfg.get("type", "") or "").strip().lower()
-            target = str(cfg.get("target", "") or "").strip()
-            if transfer_type == "extension" and target == extension:
-                matches.append(str(key))
-
+        matches = _get_live_agent_index(transfer_cfg).ext_to_keys.get(extension, ())
         if len(matches) == 1:
             return matches[0]
 
@@ -13,6 +13,9 @@ from ..context import ToolExecutionContext
 
 logger = structlog.get_logger(__name__)
 
+# Destination names treat "_" and "-" as word separators.
+_NORMALIZE_TABLE = str.maketrans({"_": " ", "-": " "})
+
 
 class UnifiedTransferTool(Tool):
     """
@@ -53,7 +56,8 @@ class UnifiedTransferTool(Tool):
 
     @staticmethod
     def _normalize_text(value: str) -> str:
-        return " ".join(str(value or "").strip().lower().replace("_", " ").replace("-", " ").split())
+        # split() with no arguments already strips and collapses whitespace.
+        return " ".join(str(value).lower().translate(_NORMALIZE_TABLE).split()) if value else ""
 
     def _resolve_destination_key(self, destination: Any, destinations: Dict[str, Any]) -> Tuple[Optional[str], str]:
         raw = str(destination or "").strip()
@@ -0,0 +1,50 @@
+import asyncio
+import types
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.engine import Engine
+
+
+@pytest.mark.unit
+async def test_post_call_webhooks_share_one_summary():
+    """Several webhook tools are dispatched as one batch; other tools still run on their own."""
+    from src.tools.http.generic_webhook import GenericWebhookTool, WebhookConfig
+    from src.tools.registry import tool_registry
+
+    engine = Engine.__new__(Engine)
+    engine.config = types.SimpleNamespace(default_provider="local")
+
+    webhooks = [
+        GenericWebhookTool(WebhookConfig(name=f"hook_{i}", url="https://x.test", generate_summary=True))
+        for i in range(2)
+    ]
+    other = types.SimpleNamespace(
+        definition=types.SimpleNamespace(name="crm_update"),
+        execute=AsyncMock(),
+    )
+    session = types.SimpleNamespace(
+        context_name=None,
+        caller_number="+15551234567",
+        caller_name="Jane",
+        provider_name="local",
+        start_time=None,
+        summary=None,
+    )
+
+    async def slow_summary(context):
+        # Yield like a real LLM request so unbatched webhooks would race to summarize.
+        await asyncio.sleep(0)
+        return "Summary."
+
+    with patch.object(tool_registry, "get_tools_for_context", return_value=[*webhooks, other]), \
+            patch.object(GenericWebhookTool, "_generate_summary", new=AsyncMock(side_effect=slow_summary)) as mock_summary, \
+            patch.object(GenericWebhookTool, "_send", new=AsyncMock()) as mock_send:
+        await engine._execute_post_call_tools("call-1", session)
+        pending = [t for t in asyncio.all_tasks() if t.get_name().startswith("post-call-")]
+        await asyncio.gather(*pending)
+
+    assert mock_summary.await_count == 1
+    assert mock_send.await_count == 2
+    other.execute.assert_awaited_once()
@@ -0,0 +1,112 @@
+import pytest
+
+
+def _make_tool(**behavior_kwargs):
+    from src.tools.mcp_tool import MCPTool, MCPToolBehavior
+
+    return MCPTool(
+        exposed_name="mcp_demo_lookup",
+        server_id="demo",
+        mcp_tool_name="lookup",
+        description="",
+        input_schema=None,
+        manager=None,
+        behavior=MCPToolBehavior(**behavior_kwargs),
+    )
+
+
+@pytest.mark.unit
+def test_render_template_fills_and_clears_placeholders():
+    from src.tools.mcp_tool import _render_template
+
+    out = _render_template("Hi {name},  {missing} visibility {wx.vis}", {"name": "Bob", "wx.vis": 10})
+    assert out == "Hi Bob, visibility 10"
+    assert _render_template("", {"name": "Bob"}) == ""
+
+
+@pytest.mark.unit
+def test_compile_template_reuses_plan():
+    from src.tools.mcp_tool import _compile_template
+
+    assert _compile_template("Hi {name}") is _compile_template("Hi {name}")
+
+
+@pytest.mark.unit
+def test_speech_template_compiled_once_and_rendered():
+    tool = _make_tool(speech_template="Wind {wind} at {station}")
+    assert tool._template_segments == (("Wind ", "wind"), (" at ", "station"))
+
+    msg = tool._build_speech_message({"structured": {"wind": "270 at 10", "station": "KSFO"}})
+    assert msg == "Wind 270 at 10 at KSFO"
+
+
+@pytest.mark.unit
+def test_speech_message_falls_back_to_content_text():
+    tool = _make_tool(speech_template="{missing}")
+    msg = tool._build_speech_message({"content": [{"type": "text", "text": "hello"}]})
+    assert msg == "hello"
+
+
+@pytest.mark.unit
+def test_speech_field_parts_precomputed():
+    tool = _make_tool(speech_field="weather.metar.raw")
+    assert tool._speech_field_parts == ("weather", "metar", "raw")
+    import sys
+    assert all(sys.intern(part) is part for part in tool._speech_field_parts)
+
+    msg = tool._build_speech_message({"data": {"weather": {"metar": {"raw": " KSFO 121853Z "}}}})
+    assert msg == "KSFO 121853Z"
+    assert tool._build_speech_message({"data": {"weather": {}}}) == "I have the result."
+
+
+@pytest.mark.unit
+def test_speech_data_source_precedence():
+    tool = _make_tool(speech_template="{v}")
+    assert tool._build_speech_message({"data": {"v": "d"}, "output": {"v": "o"}}) == "d"
+    assert tool._build_speech_message({"data": "text", "result": {"v": "r"}}) == "r"
+    # Empty structured payloads fall back to top-level fields.
+    assert tool._build_speech_message({"structured": {}, "v": "top"}) == "top"
+
+
+@pytest.mark.unit
+def test_speech_message_tolerates_odd_content():
+    tool = _make_tool()
+    assert tool._build_speech_message({"content": "not a list"}) == "I have the result."
+    assert tool._build_speech_message({"content": [None, {"type": "image"}, {"type": "text", "text": 5}]}) == "5"
+    assert tool._build_speech_message(None) == "I have the result."
+
+
+@pytest.mark.unit
+def test_definition_built_once():
+    tool = _make_tool(timeout_ms=2500)
+    definition = tool.definition
+    assert definition is tool.definition
+    assert definition.name == "mcp_demo_lookup"
+    assert definition.description == "MCP tool 'lookup' from server 'demo'."
+    assert definition.max_execution_time == 2
+
+
+@pytest.mark.unit
+def test_select_data_obj_avoids_copy_without_content():
+    from src.tools.mcp_tool import _select_data_obj
+
+    result = {"answer": 42}
+    assert _select_data_obj(result) is result
+    assert _select_data_obj({"answer": 42, "content": []}) == {"answer": 42}
+    assert _select_data_obj({"data": {}, "answer": 1}) == {"data": {}, "answer": 1}
+    assert _select_data_obj(["not", "a", "dict"]) == {}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "template",
+    ["Static  reply ", "The answer is {result}", "{result}", "{a} and {b}!", "  {result}  tail "],
+)
+def test_specialized_renderer_matches_generic(template):
+    from src.tools.mcp_tool import _compile_template, _render_compiled, _specialize_template
+
+    segments = _compile_template(template)
+    render = _specialize_template(segments)
+    for data in ({}, {"result": " 42 ", "a": 1, "b": 2}, {"other": 1}):
+        assert render(data) == _render_compiled(segments, data)
+    assert _specialize_template(_compile_template("")) is None
@@ -0,0 +1,216 @@
+import pytest
+
+
+@pytest.mark.unit
+def test_parse_primary_format_with_nested_arguments():
+    from src.tools.parser import parse_tool_calls
+
+    text = 'Sure. <tool_call>{"name": "transfer", "arguments": {"target": {"ext": "6000"}}}</tool_call>'
+    assert parse_tool_calls(text) == [{"name": "transfer", "parameters": {"target": {"ext": "6000"}}}]
+
+
+@pytest.mark.unit
+def test_parse_primary_format_accepts_parameters_key_and_case():
+    from src.tools.parser import parse_tool_calls
+
+    text = '<TOOL_CALL>\n{"name": "hangup_call", "parameters": {"farewell": "bye"}}\n</TOOL_CALL>'
+    assert parse_tool_calls(text) == [{"name": "hangup_call", "parameters": {"farewell": "bye"}}]
+
+
+@pytest.mark.unit
+def test_parse_functools_format():
+    from src.tools.parser import parse_tool_calls
+
+    text = 'functools[[{"name": "a", "arguments": {"x": [1, 2]}}, {"name": "b"}]]'
+    assert parse_tool_calls(text) == [
+        {"name": "a", "parameters": {"x": [1, 2]}},
+        {"name": "b", "parameters": {}},
+    ]
+
+
+@pytest.mark.unit
+def test_parse_function_format():
+    from src.tools.parser import parse_tool_calls
+
+    text = 'ok { "function": "hangup_call", "function_parameters": {"farewell": "Goodbye"} } done'
+    assert parse_tool_calls(text) == [{"name": "hangup_call", "parameters": {"farewell": "Goodbye"}}]
+
+
+@pytest.mark.unit
+def test_parse_primary_format_wins_over_others():
+    from src.tools.parser import parse_tool_calls
+
+    text = (
+        '{"function": "other", "function_parameters": {}} '
+        '<tool_call>{"name": "first", "arguments": {}}</tool_call>'
+    )
+    assert parse_tool_calls(text) == [{"name": "first", "parameters": {}}]
+
+
+@pytest.mark.unit
+def test_parse_invalid_json_and_plain_text():
+    from src.tools.parser import parse_tool_calls
+
+    assert parse_tool_calls("<tool_call>{not json}</tool_call>") == []
+    assert parse_tool_calls("Just a normal reply.") == []
+    assert parse_tool_calls("<tool_call>{\"name\": \"x\"}") == []
+
+
+@pytest.mark.unit
+def test_parse_response_with_tools_strips_markers():
+    from src.tools.parser import parse_response_with_tools
+
+    text, calls = parse_response_with_tools(
+        'Goodbye!\n\n<tool_call>{"name": "hangup_call", "arguments": {}}</tool_call>'
+    )
+    assert text == "Goodbye!"
+    assert calls == [{"name": "hangup_call", "parameters": {}}]
+
+    text, calls = parse_response_with_tools("Hello there.")
+    assert text == "Hello there."
+    assert calls is None
+
+
+@pytest.mark.unit
+def test_validate_tool_call():
+    from src.tools.parser import validate_tool_call
+
+    assert validate_tool_call({"name": "a", "parameters": {}}, ["a", "b"])
+    assert not validate_tool_call({"name": "c", "parameters": {}}, ["a", "b"])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_parse_response_with_tools_async_large_and_small():
+    from src.tools.parser import parse_response_with_tools_async
+
+    call = '<tool_call>{"name": "hangup_call", "arguments": {}}</tool_call>'
+    text, calls = await parse_response_with_tools_async("Bye. " + call)
+    assert text == "Bye."
+    assert calls == [{"name": "hangup_call", "parameters": {}}]
+
+    text, calls = await parse_response_with_tools_async("word " * 3000 + call)
+    assert calls == [{"name": "hangup_call", "parameters": {}}]
+    assert text.endswith("word")
+
+
+@pytest.mark.unit
+def test_parse_response_with_tools_matches_extract_text():
+    from src.tools.parser import extract_text_without_tools, parse_response_with_tools
+
+    samples = [
+        'A\n\n<tool_call>{"name": "x", "arguments": {}}</tool_call>\n\nB',
+        'functools[[{"name": "y"}]] then text',
+        'pre {"function": "z", "function_parameters": {"a": 1}} post',
+        '<tool_call>{broken}</tool_call> kept',
+        'ok functools[[{"name":"x", bad}]] done',
+        'say {"function": "x", "function_parameters": {bad}} end',
+        'no markers at all\n\n\nhere',
+    ]
+    for sample in samples:
+        assert (parse_response_with_tools(sample)[0] or "") == extract_text_without_tools(sample)
+
+    assert parse_response_with_tools('ok functools[[{"name":"x", bad}]] done') == ("ok  done", None)
+    assert parse_response_with_tools('say {"function": "x", "function_parameters": {bad}} end') == ("say  end", None)
+
+
+@pytest.mark.unit
+def test_plain_text_skips_scanner(monkeypatch):
+    from src.tools import parser
+
+    def _fail(_response):
+        raise AssertionError("scanner should not run")
+
+    monkeypatch.setattr(parser, "_iter_candidates", _fail)
+    assert parser.parse_response_with_tools("Hello.\n\n\nBye.  ") == ("Hello.\nBye.", None)
+    assert parser.parse_tool_calls("Hello") == []
+    assert parser.extract_text_without_tools("  Hello ") == "Hello"
+
+
+@pytest.mark.unit
+def test_validate_tool_call_accepts_sets_and_large_lists():
+    from src.tools.parser import validate_tool_call
+
+    names = [f"tool_{i}" for i in range(20)]
+    assert validate_tool_call({"name": "tool_7"}, names)
+    assert validate_tool_call({"name": "tool_7"}, frozenset(names))
+    assert not validate_tool_call({"name": "nope"}, set(names))
+
+
+@pytest.mark.unit
+def test_loads_falls_back_to_stdlib():
+    from src.tools.parser import _loads
+
+    assert _loads('{"name": "x", "arguments": {"n": 1}}') == {"name": "x", "arguments": {"n": 1}}
+    assert _loads('{"v": NaN}')["v"] != _loads('{"v": NaN}')["v"]
+    with pytest.raises(ValueError):
+        _loads("{bad}")
+
+
+@pytest.mark.unit
+def test_extract_text_without_tools_strips_all_formats():
+    from src.tools.parser import extract_text_without_tools
+
+    text = (
+        'One <TOOL_CALL>{"name": "a"}</TOOL_CALL>\n\n'
+        'two FUNCTOOLS[[{"name": "b"}]] three '
+        '{"function": "c", "function_parameters": {}}\n\n\nfour'
+    )
+    assert extract_text_without_tools(text) == "One \ntwo  three \nfour"
+    # The {"function": ...} format stays case-sensitive.
+    assert extract_text_without_tools('{"FUNCTION": "c", "function_parameters": {}}').startswith("{")
+
+
+@pytest.mark.unit
+def test_extract_text_handles_deep_nesting_and_unclosed_blocks():
+    import time
+
+    from src.tools.parser import extract_text_without_tools
+
+    nested = 'Hi <tool_call>{"name": "t", "arguments": {"a": {"b": {"c": 1}}}}</tool_call> there'
+    assert extract_text_without_tools(nested) == "Hi  there"
+
+    malformed = "<tool_call>{" + '"x": 1, ' * 20000
+    started = time.perf_counter()
+    assert extract_text_without_tools(malformed) == malformed.strip()
+    assert time.perf_counter() - started < 1.0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_closing_tag_inside_json_string_does_not_end_block(monkeypatch, use_orjson):
+    from src.tools import parser
+
+    if not use_orjson:
+        monkeypatch.setattr(parser, "orjson", None)
+    text = 'x <tool_call>{"name":"a","arguments":{"s":"</tool_call>"}}</tool_call> y'
+    assert parser.parse_response_with_tools(text) == ("x  y", [{"name": "a", "parameters": {"s": "</tool_call>"}}])
+    assert parser.extract_text_without_tools(text) == "x  y"
+
+    # Malformed bodies are still stripped up to the first "}</tool_call>".
+    assert parser.parse_response_with_tools('a <tool_call>{"name": "b"} junk }</tool_call> c') == ("a  c", None)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_decode_span_with_and_without_orjson(monkeypatch, use_orjson):
+    from src.tools import parser
+
+    if not use_orjson:
+        monkeypatch.setattr(parser, "orjson", None)
+    text = '<tool_call> {"name": "a", "arguments": {"n": 1}} </tool_call>'
+    assert parser.parse_tool_calls(text) == [{"name": "a", "parameters": {"n": 1}}]
+    assert parser.parse_tool_calls('<tool_call>{"name": "a"} {"x": 1}</tool_call>') == []
+
+
+@pytest.mark.unit
+def test_parse_results_cached_but_not_shared():
+    from src.tools import parser
+
+    parser._scan_response_cached.cache_clear()
+    text = 'Ok <tool_call>{"name": "a", "arguments": {"nested": {"n": 1}}}</tool_call>'
+    first = parser.parse_tool_calls(text)
+    first[0]["parameters"]["nested"]["n"] = 99
+    _clean, second = parser.parse_response_with_tools(text)
+    assert second == [{"name": "a", "parameters": {"nested": {"n": 1}}}]
+    assert parser._scan_response_cached.cache_info().hits == 1
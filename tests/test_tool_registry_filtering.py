@@ -40,3 +40,316 @@ def test_tool_registry_filtered_schema():
 
     tool_registry.clear()
 
+
+
+def _make_tool_class(name, category=None, **definition_kwargs):
+    from src.tools.base import Tool, ToolCategory, ToolDefinition
+
+    class _Tool(Tool):
+        @property
+        def definition(self) -> ToolDefinition:
+            return ToolDefinition(
+                name=name,
+                description=name.upper(),
+                category=category or ToolCategory.BUSINESS,
+                **definition_kwargs,
+            )
+
+        async def execute(self, parameters, context):
+            return {"status": "success"}
+
+    return _Tool
+
+
+@pytest.mark.unit
+def test_tool_registry_schema_cache_invalidated_on_change():
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    tool_registry.register(_make_tool_class("tool_a"))
+    tool_registry.register(_make_tool_class("tool_b"))
+
+    first = tool_registry.to_deepgram_schema_filtered(["tool_b", "tool_a"])
+    second = tool_registry.to_deepgram_schema_filtered(["tool_b", "tool_a"])
+    assert [s["name"] for s in first] == ["tool_b", "tool_a"]
+    assert first == second and first is not second
+    assert first[0] is second[0]
+
+    tool_registry.unregister("tool_a")
+    assert [s["name"] for s in tool_registry.to_deepgram_schema_filtered(["tool_b", "tool_a"])] == ["tool_b"]
+
+    tool_registry.register(_make_tool_class("tool_c"))
+    assert [s["function"]["name"] for s in tool_registry.to_openai_schema()] == ["tool_b", "tool_c"]
+
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_config_fingerprint_is_order_independent():
+    from src.tools.registry import _config_fingerprint
+
+    a = {"lookup": {"kind": "in_call_http_lookup", "url": "https://x", "timeout_ms": 500}}
+    b = {"lookup": {"timeout_ms": 500, "url": "https://x", "kind": "in_call_http_lookup"}}
+    assert _config_fingerprint(a) == _config_fingerprint(b)
+    assert _config_fingerprint(a) != _config_fingerprint({"lookup": {"kind": "other"}})
+    assert _config_fingerprint({1: {"when": object}}) == _config_fingerprint({1: {"when": object}})
+
+
+@pytest.mark.unit
+def test_tool_registry_phase_and_category_indexes():
+    from src.tools.base import ToolCategory, ToolPhase
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    tool_registry.register(_make_tool_class("in_a"))
+    tool_registry.register(_make_tool_class("in_global", is_global=True))
+    tool_registry.register(_make_tool_class("pre_a", phase=ToolPhase.PRE_CALL, category=ToolCategory.TELEPHONY))
+    tool_registry.register(_make_tool_class("pre_global", phase=ToolPhase.PRE_CALL, is_global=True))
+
+    def names(tools):
+        return [t.definition.name for t in tools]
+
+    assert names(tool_registry.get_in_call_tools()) == ["in_a", "in_global"]
+    assert names(tool_registry.get_in_call_tools(include_global=False)) == ["in_a"]
+    assert names(tool_registry.get_global_tools()) == ["in_global", "pre_global"]
+    assert names(tool_registry.get_by_category(ToolCategory.TELEPHONY)) == ["pre_a"]
+    assert names(
+        tool_registry.get_tools_for_context(ToolPhase.PRE_CALL, ["pre_a", "in_a"], ["pre_global"])
+    ) == ["pre_a"]
+
+    # Re-registering under the same name with a different phase moves it between indexes.
+    tool_registry.register(_make_tool_class("in_a", phase=ToolPhase.POST_CALL))
+    assert names(tool_registry.get_in_call_tools()) == ["in_global"]
+    assert names(tool_registry.get_post_call_tools()) == ["in_a"]
+
+    tool_registry.unregister("pre_a")
+    assert tool_registry.get_by_category(ToolCategory.TELEPHONY) == []
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_is_tool_allowed_with_aliases_and_memo():
+    from src.tools.registry import tool_registry
+
+    allowed = ["blind_transfer", " hangup_call ", ""]
+    assert tool_registry.is_tool_allowed("transfer_call", allowed)
+    assert tool_registry.is_tool_allowed(" end_call", allowed)
+    assert not tool_registry.is_tool_allowed("leave_voicemail", allowed)
+    assert not tool_registry.is_tool_allowed("", allowed)
+    assert tool_registry.is_tool_allowed("anything", None)
+    assert tool_registry._canonical_allowed(allowed) is tool_registry._canonical_allowed(list(allowed))
+    assert tool_registry.canonicalize_tool_name(None) == ""
+
+
+@pytest.mark.unit
+def test_in_call_http_init_is_single_flight(monkeypatch):
+    import threading
+
+    from src.tools.registry import ToolRegistry, tool_registry
+
+    assert ToolRegistry() is tool_registry
+    tool_registry.clear()
+    calls = []
+    original = tool_registry.register_instance
+
+    def slow_register(tool):
+        calls.append(tool.definition.name)
+        threading.Event().wait(0.05)
+        original(tool)
+
+    monkeypatch.setattr(tool_registry, "register_instance", slow_register)
+    config = {"crm_lookup": {"kind": "in_call_http_lookup", "url": "https://example.com", "description": "x"}}
+    threads = [
+        threading.Thread(target=tool_registry.initialize_in_call_http_tools_from_config, args=(config,))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert calls == ["crm_lookup"]
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_initialize_default_tools_registers_builtin_table():
+    from src.tools.registry import _DEFAULT_TOOLS, tool_registry
+
+    tool_registry.clear()
+    tool_registry.initialize_default_tools()
+    names = tool_registry.list_tools()
+    assert len(names) == len(_DEFAULT_TOOLS)
+    assert names[0] == "blind_transfer"
+    assert "hangup_call" in names and "request_transcript" in names
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_prompt_text_cached_until_tools_change():
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    assert tool_registry.to_local_llm_prompt() == ""
+    tool_registry.register(_make_tool_class("tool_a"))
+    prompt = tool_registry.to_local_llm_prompt()
+    assert '"name": "tool_a"' in prompt
+    assert tool_registry.to_local_llm_prompt() is prompt
+    text = tool_registry.to_prompt_text()
+    assert text.startswith("Available tools:") and "tool_a: TOOL_A" in text
+
+    tool_registry.register(_make_tool_class("tool_b"))
+    assert '"name": "tool_b"' in tool_registry.to_local_llm_prompt()
+    assert "tool_b: TOOL_B" in tool_registry.to_prompt_text()
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_alias_resolution_closure_and_exact_registration_precedence():
+    from src.tools.registry import _close_aliases, tool_registry
+
+    assert _close_aliases({"legacy_xfer": "transfer", "transfer": "blind_transfer"}) == {
+        "legacy_xfer": "blind_transfer",
+        "transfer": "blind_transfer",
+    }
+    assert _close_aliases({"a": "b", "b": "a"}) == {"a": "a", "b": "b"}
+
+    tool_registry.clear()
+    tool_registry.register(_make_tool_class("blind_transfer"))
+    assert tool_registry.get("transfer_call").definition.name == "blind_transfer"
+
+    # A tool registered under an alias name is found directly, until it is removed.
+    tool_registry.register(_make_tool_class("transfer_call"))
+    assert tool_registry.get("transfer_call").definition.name == "transfer_call"
+    tool_registry.unregister("transfer_call")
+    assert tool_registry.get("transfer_call").definition.name == "blind_transfer"
+    assert tool_registry.get("missing") is None
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_filtered_schema_dedupes_aliases_and_skips_unknown():
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    tool_registry.register(_make_tool_class("blind_transfer"))
+    tool_registry.register(_make_tool_class("hangup_call"))
+
+    schemas = tool_registry.to_openai_realtime_schema_filtered(
+        ["transfer", "hangup", "blind_transfer", "unknown", "end_call"]
+    )
+    assert [s["name"] for s in schemas] == ["blind_transfer", "hangup_call"]
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_to_all_schemas_matches_per_provider_exports():
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    tool_registry.register(_make_tool_class("tool_a"))
+    tool_registry.register(_make_tool_class("tool_b"))
+
+    combined = tool_registry.to_all_schemas(["tool_b"])
+    assert set(combined) == {"deepgram", "openai", "openai_realtime", "elevenlabs", "local_llm"}
+    assert combined["openai_realtime"] == tool_registry.to_openai_realtime_schema_filtered(["tool_b"])
+    assert combined["deepgram"][0] is tool_registry.to_deepgram_schema_filtered(["tool_b"])[0]
+    assert [s["name"] for s in tool_registry.to_all_schemas()["local_llm"]] == ["tool_a", "tool_b"]
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_get_all_and_list_tools_snapshots():
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    tool_registry.register(_make_tool_class("tool_a"))
+    names = tool_registry.list_tools()
+    assert names == ("tool_a",)
+    assert tool_registry.list_tools() is names
+    assert tool_registry.get_all() is tool_registry.get_all()
+
+    copied = tool_registry.list_tools(copy=True)
+    copied.append("x")
+    assert tool_registry.list_tools() == ("tool_a",)
+
+    tool_registry.register(_make_tool_class("tool_b"))
+    assert tool_registry.list_tools() == ("tool_a", "tool_b")
+    assert len(tool_registry.get_all()) == 2
+    tool_registry.clear()
+    assert tool_registry.list_tools() == ()
+
+
+@pytest.mark.unit
+def test_tools_for_context_overlays_context_tools_on_globals():
+    from src.tools.base import ToolPhase
+    from src.tools.registry import tool_registry
+
+    tool_registry.clear()
+    tool_registry.register(_make_tool_class("hangup_call", is_global=True))
+    tool_registry.register(_make_tool_class("blind_transfer"))
+    tool_registry.register(_make_tool_class("crm", phase=ToolPhase.PRE_CALL))
+
+    def names(tools):
+        return [t.definition.name for t in tools]
+
+    assert names(tool_registry.get_tools_for_context(ToolPhase.IN_CALL)) == ["hangup_call"]
+    assert names(tool_registry.get_tools_for_context(ToolPhase.IN_CALL, ["transfer", "crm", "end_call"])) == [
+        "hangup_call",
+        "blind_transfer",
+    ]
+    assert names(tool_registry.get_tools_for_context(ToolPhase.IN_CALL, None, ["hangup_call"])) == []
+    tool_registry.clear()
+
+
+@pytest.mark.unit
+def test_config_fingerprint_stable_for_sets_and_paths():
+    from pathlib import Path
+
+    from src.tools.registry import _config_fingerprint
+
+    a = {"t": {"methods": {"GET", "POST", "PUT"}, "path": Path("/tmp/x"), "big": 2**70}}
+    b = {"t": {"big": 2**70, "path": Path("/tmp/x"), "methods": {"PUT", "GET", "POST"}}}
+    assert _config_fingerprint(a) == _config_fingerprint(b)
+
+
+@pytest.mark.unit
+def test_is_tool_allowed_empty_allowlist_denies():
+    from src.tools.registry import tool_registry
+
+    assert not tool_registry.is_tool_allowed("hangup_call", [])
+    assert not tool_registry.is_tool_allowed("hangup_call", frozenset())
+    assert not tool_registry.is_tool_allowed("hangup_call", iter(()))
+    # "*" is not a wildcard: allowlists are literal everywhere (schema export included).
+    assert not tool_registry.is_tool_allowed("hangup_call", ["*"])
+
+
+@pytest.mark.unit
+def test_http_tool_bootstrap_failures_logged_once(caplog, monkeypatch):
+    import logging
+
+    import src.tools.http.generic_lookup as generic_lookup
+    import src.tools.http.generic_webhook as generic_webhook
+    from src.tools.registry import tool_registry
+
+    def _boom(name, cfg):
+        raise ValueError(f"broken {name}")
+
+    monkeypatch.setattr(generic_lookup, "create_http_lookup_tool", _boom)
+    monkeypatch.setattr(generic_webhook, "create_webhook_tool", _boom)
+
+    tool_registry.clear()
+    config = {
+        "bad_one": {"kind": "generic_http_lookup"},
+        "bad_two": {"kind": "generic_webhook"},
+        "not_a_tool": "skip",
+    }
+    with caplog.at_level(logging.WARNING, logger="src.tools.registry"):
+        tool_registry.initialize_http_tools_from_config(config)
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "Failed to create 2 HTTP tool(s)" in warnings[0].getMessage()
+    assert "bad_one: broken bad_one" in warnings[0].getMessage()
+    assert warnings[0].exc_info is not None
+    tool_registry.clear()
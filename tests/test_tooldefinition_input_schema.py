@@ -39,3 +39,18 @@ def test_tooldefinition_deepgram_strips_defaults_in_input_schema():
     schema = td.to_deepgram_schema()
     assert "default" not in schema["parameters"]["properties"]["x"]
 
+
+
+@pytest.mark.unit
+def test_tooldefinition_is_slotted():
+    from src.tools.base import ToolCategory, ToolDefinition, ToolParameter
+
+    definition = ToolDefinition(
+        name="demo",
+        description="Demo tool",
+        category=ToolCategory.BUSINESS,
+        parameters=[ToolParameter(name="x", type="string", description="X", required=True)],
+    )
+    assert not hasattr(definition, "__dict__")
+    assert not hasattr(definition.parameters[0], "__dict__")
+    assert definition.to_openai_schema()["function"]["parameters"]["required"] == ["x"]
@@ -150,3 +150,331 @@ class TestCheckExtensionStatusTool:
         assert result["status"] == "success"
         assert result["device_state_id"] == "PJSIP/2765"
         assert result["available"] is True
+
+    @pytest.mark.asyncio
+    async def test_repeated_device_state_queries_hit_cache(self, tool, tool_context, mock_ari_client):
+        tool_context.config["tools"]["extensions"]["internal"]["6000"]["device_state_tech"] = "SIP"
+        mock_ari_client.send_command = AsyncMock(return_value={"name": "SIP/6000", "state": "NOT_INUSE"})
+
+        first = await tool.execute({"extension": "6000"}, tool_context)
+        calls_after_first = mock_ari_client.send_command.await_count
+        second = await tool.execute({"extension": "6000"}, tool_context)
+        assert second == first
+        assert mock_ari_client.send_command.await_count == calls_after_first
+
+    @pytest.mark.asyncio
+    async def test_cache_ttl_zero_disables_cache(self, tool, tool_context, mock_ari_client):
+        tool_context.config["tools"]["check_extension_status"] = {"cache_ttl": 0}
+        tool_context.config["tools"]["extensions"]["internal"]["6000"]["device_state_tech"] = "SIP"
+        mock_ari_client.send_command = AsyncMock(return_value={"name": "SIP/6000", "state": "NOT_INUSE"})
+
+        await tool.execute({"extension": "6000"}, tool_context)
+        calls_after_first = mock_ari_client.send_command.await_count
+        await tool.execute({"extension": "6000"}, tool_context)
+        assert mock_ari_client.send_command.await_count == 2 * calls_after_first
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, mock_ari_client):
+        import asyncio
+
+        from src.tools.telephony.check_extension_status import _AriGetCache
+
+        release = asyncio.Event()
+
+        async def slow_get(method, resource, data=None, params=None):
+            await release.wait()
+            return {"name": "PJSIP/2765", "state": "INUSE"}
+
+        mock_ari_client.send_command = AsyncMock(side_effect=slow_get)
+        cache = _AriGetCache()
+        waiters = [asyncio.create_task(cache.get(mock_ari_client, "deviceStates/PJSIP%2F2765", 1.0)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+        assert all(r == {"name": "PJSIP/2765", "state": "INUSE"} for r in results)
+        assert mock_ari_client.send_command.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_not_cached(self, mock_ari_client):
+        from src.tools.telephony.check_extension_status import _AriGetCache
+
+        mock_ari_client.send_command = AsyncMock(side_effect=[RuntimeError("boom"), {"state": "NOT_INUSE"}])
+        cache = _AriGetCache()
+        with pytest.raises(RuntimeError):
+            await cache.get(mock_ari_client, "deviceStates/SIP%2F6000", 1.0)
+        assert await cache.get(mock_ari_client, "deviceStates/SIP%2F6000", 1.0) == {"state": "NOT_INUSE"}
+
+    @pytest.mark.asyncio
+    async def test_definitive_device_state_skips_endpoint_probe(self, tool, tool_context, mock_ari_client):
+        tool_context.config["tools"]["extensions"]["internal"]["6000"]["device_state_tech"] = "SIP"
+        mock_ari_client.send_command = AsyncMock(return_value={"name": "SIP/6000", "state": "INUSE"})
+
+        result = await tool.execute({"extension": "6000"}, tool_context)
+        assert result["available"] is False
+        assert result["tech"] == "SIP"
+        assert "endpoint_state" not in result
+        resources = [c.kwargs["resource"] for c in mock_ari_client.send_command.call_args_list]
+        assert resources == ["deviceStates/SIP%2F6000"]
+
+    @pytest.mark.asyncio
+    async def test_always_probe_endpoint_flag(self, tool, tool_context, mock_ari_client):
+        tool_context.config["tools"]["check_extension_status"] = {"always_probe_endpoint": True}
+        tool_context.config["tools"]["extensions"]["internal"]["6000"]["device_state_tech"] = "SIP"
+
+        async def send_command(method, resource, data=None, params=None):
+            if resource.startswith("endpoints/"):
+                return {"technology": "SIP", "resource": "6000", "state": "online", "channel_ids": []}
+            return {"name": "SIP/6000", "state": "NOT_INUSE"}
+
+        mock_ari_client.send_command = AsyncMock(side_effect=send_command)
+        result = await tool.execute({"extension": "6000"}, tool_context)
+        assert result["endpoint_state"] == "online"
+        assert mock_ari_client.send_command.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_always_probe_endpoint_issues_both_requests_together(self, tool, tool_context, mock_ari_client):
+        import asyncio
+
+        tool_context.config["tools"]["check_extension_status"] = {"always_probe_endpoint": True}
+        tool_context.config["tools"]["extensions"]["internal"]["6000"]["device_state_tech"] = "SIP"
+        in_flight = set()
+        both_seen = asyncio.Event()
+
+        async def send_command(method, resource, data=None, params=None):
+            in_flight.add(resource)
+            if len(in_flight) == 2:
+                both_seen.set()
+            # Neither request completes until the other one has been issued.
+            await asyncio.wait_for(both_seen.wait(), timeout=1.0)
+            if resource.startswith("endpoints/"):
+                return {"technology": "SIP", "resource": "6000", "state": "online", "channel_ids": []}
+            return {"name": "SIP/6000", "state": "NOT_INUSE"}
+
+        mock_ari_client.send_command = AsyncMock(side_effect=send_command)
+        result = await tool.execute({"extension": "6000"}, tool_context)
+        assert result["available"] is True
+        assert in_flight == {"deviceStates/SIP%2F6000", "endpoints/SIP/6000"}
+
+
+@pytest.mark.unit
+def test_extension_index_matches_first_entry_and_is_shared_across_config_copies():
+    import copy
+
+    from src.tools.telephony.check_extension_status import (
+        _get_extension_index,
+        _resolve_device_state_id,
+        _resolve_extension_entry,
+    )
+
+    cfg = {
+        6000: {"name": "Support", "aliases": ["help"], "dial_string": "PJSIP/agent1@edge"},
+        "6001": {"name": "Help", "aliases": "Sales"},
+        "bad": "not a dict",
+    }
+    assert _resolve_extension_entry(target="HELP", extensions_config=cfg) == (
+        "6000", cfg[6000], "config.alias"
+    )
+    assert _resolve_extension_entry(target="sales", extensions_config=cfg)[::2] == ("6001", "config.alias")
+    assert _resolve_extension_entry(target="nobody", extensions_config=cfg) == ("", {}, "")
+
+    # Tool contexts get a fresh config.dict() copy per call; equal content reuses one index,
+    # while resolved entries still come from the caller's own copy.
+    first, second = copy.deepcopy(cfg), copy.deepcopy(cfg)
+    assert _get_extension_index(first) is _get_extension_index(second)
+    assert _resolve_extension_entry(target="support", extensions_config=second)[1] is second[6000]
+    second[6000]["device_state_tech"] = "SIP"
+    assert _resolve_device_state_id(extension="agent1", extensions_config=second) == (
+        "SIP/agent1", "config.device_state_tech"
+    )
+
+    # Changing an indexed field (as a reload would) yields a new index.
+    reloaded = copy.deepcopy(cfg)
+    reloaded["6001"]["aliases"] = ["billing"]
+    assert _get_extension_index(reloaded) is not _get_extension_index(first)
+    assert _resolve_extension_entry(target="billing", extensions_config=reloaded)[0] == "6001"
+    assert _resolve_extension_entry(target="sales", extensions_config=reloaded) == ("", {}, "")
+
+    # Unhashable alias values are still indexed, just not cached.
+    odd = {"7000": {"name": "Odd", "aliases": [["nested"]]}}
+    assert _resolve_extension_entry(target="odd", extensions_config=odd)[0] == "7000"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_probe_first_endpoint_prefers_pjsip_and_runs_concurrently(tool_context, mock_ari_client):
+    import asyncio
+
+    from src.tools.telephony.check_extension_status import _probe_first_endpoint
+
+    started = []
+
+    async def send_command(method, resource, data=None, params=None):
+        started.append(resource)
+        if resource.startswith("endpoints/PJSIP/"):
+            # SIP has already been requested by the time PJSIP answers.
+            await asyncio.sleep(0.01)
+            assert len(started) == 2
+        return {"technology": resource.split("/")[1], "resource": "2765", "state": "online"}
+
+    mock_ari_client.send_command = AsyncMock(side_effect=send_command)
+    tech, endpoint = await _probe_first_endpoint(context=tool_context, techs=("PJSIP", "SIP"), extension="2765")
+    assert tech == "PJSIP"
+    assert endpoint["technology"] == "PJSIP"
+
+    mock_ari_client.send_command = AsyncMock(return_value={"message": "Endpoint not found"})
+    assert await _probe_first_endpoint(context=tool_context, techs=("PJSIP", "SIP"), extension="2765") == ("", None)
+
+
+@pytest.mark.unit
+def test_device_state_id_resolved_via_dial_string_suffix():
+    from src.tools.telephony.check_extension_status import _dial_string_suffixes, _resolve_device_state_id
+
+    assert _dial_string_suffixes("PJSIP/2765@from-internal") == ["2765@from-internal", "2765"]
+    assert _dial_string_suffixes("Local/a/b@ctx") == ["a/b@ctx", "a/b", "b@ctx", "b"]
+
+    cfg = {
+        "agent": {"dial_string": "IAX2/2765@trunk"},
+        "other": {"dial_string": "SIP/2765", "device_state_tech": "SIP"},
+    }
+    assert _resolve_device_state_id(extension="2765", extensions_config=cfg) == ("IAX2/2765", "config.dial_string")
+    assert _resolve_device_state_id(extension="276", extensions_config=cfg) == ("", "")
+    assert _resolve_device_state_id(extension="276", extensions_config=cfg, tech="pjsip") == ("PJSIP/276", "parameter.tech")
+
+
+@pytest.mark.unit
+def test_extension_number_predicates():
+    from src.tools.telephony.check_extension_status import _is_ext_num, _looks_like_extension_number
+
+    assert _is_ext_num("2765")
+    assert not _is_ext_num("")
+    assert not _is_ext_num("support")
+    assert _looks_like_extension_number(" 2765 ")
+    assert not _looks_like_extension_number(None)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_invalid_recovery_prefers_pjsip_and_skips_techs_without_endpoint(tool_context, mock_ari_client):
+    from src.tools.telephony.check_extension_status import CheckExtensionStatusTool
+
+    tool_context.config["tools"]["extensions"]["internal"] = {"2765": {"device_state_id": "IAX2/2765"}}
+    seen = []
+
+    async def send_command(method, resource, data=None, params=None):
+        seen.append(resource)
+        if resource == "deviceStates/IAX2%2F2765":
+            return {"name": "IAX2/2765", "state": "INVALID"}
+        if resource.startswith("endpoints/"):
+            return {"technology": resource.split("/")[1], "resource": "2765", "state": "online", "channel_ids": []}
+        if resource == "deviceStates/PJSIP%2F2765":
+            return {"name": "PJSIP/2765", "state": "RINGING"}
+        return {"name": "SIP/2765", "state": "NOT_INUSE"}
+
+    mock_ari_client.send_command = AsyncMock(side_effect=send_command)
+    result = await CheckExtensionStatusTool().execute({"extension": "2765"}, tool_context)
+    assert result["device_state_id"] == "PJSIP/2765"
+    assert result["resolution_source"] == "ari.deviceStates.fallback"
+    assert result["available"] is False
+    assert {"endpoints/PJSIP/2765", "endpoints/SIP/2765", "deviceStates/SIP%2F2765"} <= set(seen)
+
+
+@pytest.mark.unit
+def test_resolvers_return_config_entries_without_copying():
+    from src.tools.telephony.check_extension_status import (
+        _resolve_extension_entry,
+        _resolve_transfer_destination_extension,
+    )
+
+    entry = {"name": "Support"}
+    dest = {"type": "extension", "target": "6000"}
+    assert _resolve_extension_entry(target="6000", extensions_config={"6000": entry})[1] is entry
+    assert _resolve_extension_entry(target="support", extensions_config={"6000": entry})[1] is entry
+    assert _resolve_transfer_destination_extension(target="support", destinations={"support": dest})[1] is dest
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dial_string,expected",
+    [
+        ("PJSIP/2765", "PJSIP"),
+        ("  SIP/6000@from-internal ", "SIP"),
+        ("Local/100@ctx/n", "Local"),
+        ("pjsip/2765", "pjsip"),
+        ("Custom /1", "Custom"),
+        ("/2765", None),
+        ("2765", None),
+        ("   ", None),
+        (None, None),
+    ],
+)
+def test_parse_dial_string_tech(dial_string, expected):
+    from src.tools.telephony.check_extension_status import _parse_dial_string_tech
+
+    assert _parse_dial_string_tech(dial_string) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_identical_gets_shared_within_one_execution_when_cache_disabled(tool_context, mock_ari_client):
+    from collections import Counter
+
+    from src.tools.telephony.check_extension_status import CheckExtensionStatusTool
+
+    tool_context.config["tools"]["check_extension_status"] = {"cache_ttl": 0}
+    tool_context.config["tools"]["extensions"]["internal"] = {}
+    seen = Counter()
+
+    async def send_command(method, resource, data=None, params=None):
+        seen[resource] += 1
+        if resource == "endpoints/SIP/2765":
+            return {"technology": "SIP", "resource": "2765", "state": "online", "channel_ids": []}
+        if resource.startswith("endpoints/"):
+            return {"message": "Endpoint not found"}
+        return {"name": "SIP/2765", "state": "INVALID"}
+
+    mock_ari_client.send_command = AsyncMock(side_effect=send_command)
+    tool = CheckExtensionStatusTool()
+    await tool.execute({"extension": "2765"}, tool_context)
+    # Auto-detect and INVALID recovery both want endpoints/PJSIP/2765; only one GET goes out.
+    assert seen["endpoints/PJSIP/2765"] == 1
+
+    await tool.execute({"extension": "2765"}, tool_context)
+    assert seen["endpoints/PJSIP/2765"] == 2
+
+
+@pytest.mark.unit
+def test_string_normalizers_match_inline_chains():
+    from src.tools.telephony.check_extension_status import _s, _strip
+
+    for value in (None, "", 0, False, " PJSIP/2765 ", 6000, " Live Agent "):
+        assert _strip(value) == str(value or "").strip()
+        assert _s(value) == str(value or "").strip().lower()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_owner_does_not_cancel_shared_fetch(mock_ari_client):
+    import asyncio
+
+    from src.tools.telephony.check_extension_status import _AriGetCache
+
+    release = asyncio.Event()
+
+    async def slow_get(method, resource, data=None, params=None):
+        await release.wait()
+        return {"name": "SIP/6000", "state": "NOT_INUSE"}
+
+    mock_ari_client.send_command = AsyncMock(side_effect=slow_get)
+    cache = _AriGetCache()
+    owner = asyncio.create_task(cache.get(mock_ari_client, "deviceStates/SIP%2F6000", 1.0))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get(mock_ari_client, "deviceStates/SIP%2F6000", 1.0))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == {"name": "SIP/6000", "state": "NOT_INUSE"}
+    assert owner.cancelled()
+    assert mock_ari_client.send_command.await_count == 1
@@ -0,0 +1,153 @@
+import re
+
+import pytest
+
+
+def _legacy_contains(text, markers):
+    t = " ".join((text or "").strip().lower().split())
+    if not t:
+        return False
+    for m in markers:
+        m = str(m).strip().lower() if m else ""
+        if not m:
+            continue
+        if " " in m:
+            if m in t:
+                return True
+            continue
+        if re.search(rf"(?:^|\b){re.escape(m)}(?:\b|$)", t):
+            return True
+    return False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "text",
+    [
+        "No, that's all for today",
+        "I got a notification",
+        "Okay BYE now",
+        "bye-bye",
+        "please hangup",
+        "Don't send a transcript.",
+        "nothing",
+        "",
+        "   ",
+        "a.b (c) + yes?",
+    ],
+)
+def test_text_contains_marker_matches_per_marker_scan(text):
+    from src.tools.telephony.hangup_policy import DEFAULT_HANGUP_MARKERS, text_contains_marker
+
+    for markers in list(DEFAULT_HANGUP_MARKERS.values()) + [["a.b", "(c)", " + "], [], ["", None]]:
+        assert text_contains_marker(text, markers) == _legacy_contains(text, markers)
+
+
+@pytest.mark.unit
+def test_normalized_policy_carries_marker_sets():
+    from src.tools.telephony.hangup_policy import compile_markers, normalize_hangup_policy, text_contains_marker
+
+    policy = normalize_hangup_policy({"markers": {"end_call": "wrap it up, ciao"}})
+    compiled = policy.end_call
+    assert compiled.markers == ("wrap it up", "ciao")
+    assert compile_markers(compiled) is compiled
+    assert compile_markers(["wrap it up", "ciao"]) is compiled
+    assert text_contains_marker("OK, Ciao!", compiled)
+    assert not text_contains_marker("ciaooo", compiled)
+
+
+@pytest.mark.unit
+def test_text_contains_marker_word_uses_whole_words():
+    from src.tools.telephony.hangup_policy import text_contains_marker_word
+
+    assert text_contains_marker_word("please end call now", ["end call"])
+    assert not text_contains_marker_word("please end caller", ["end call"])
+    assert not text_contains_marker_word("notification", ["no"])
+    assert not text_contains_marker_word("anything", [])
+
+
+@pytest.mark.unit
+def test_resolve_hangup_policy_memoized_on_content():
+    from src.tools.telephony import hangup_policy
+
+    tools_cfg = {"hangup_call": {"policy": {"mode": "Strict", "markers": {"negative": ["Nah"]}}}}
+    first = hangup_policy.resolve_hangup_policy(tools_cfg)
+    assert first.mode == "strict"
+    assert first.negative.markers == ("nah",)
+    assert hangup_policy.resolve_hangup_policy(tools_cfg) is first
+
+    tools_cfg["hangup_call"]["policy"]["mode"] = "relaxed"
+    assert hangup_policy.resolve_hangup_policy(tools_cfg).mode == "relaxed"
+    assert hangup_policy.resolve_hangup_policy(None) is hangup_policy.normalize_hangup_policy({})
+    assert len(hangup_policy._POLICY_CACHE) <= hangup_policy._POLICY_CACHE_MAX_ENTRIES
+
+
+@pytest.mark.unit
+def test_compiled_matcher_supports_both_match_modes():
+    from src.tools.telephony.hangup_policy import (
+        normalize_hangup_policy,
+        text_contains_marker,
+        text_contains_marker_compiled,
+        text_contains_marker_word,
+    )
+
+    policy = normalize_hangup_policy({})
+    end_call = policy.end_call
+    raw = list(end_call.markers)
+    for text in ("ok that's it then", "that's itemized", "Bye!", "goodbyes", ""):
+        assert text_contains_marker_compiled(text, end_call) == text_contains_marker(text, raw)
+        assert text_contains_marker_word(text, end_call) == text_contains_marker_word(text, raw)
+
+
+@pytest.mark.unit
+def test_classify_text_reports_matching_buckets():
+    from src.tools.telephony.hangup_policy import classify_text, normalize_hangup_policy
+
+    policy = normalize_hangup_policy({})
+    assert classify_text("No thanks, that's all. Bye!", policy) == {"end_call", "assistant_farewell", "negative"}
+    assert classify_text("Yes, that's right", policy) == {"affirmative"}
+    assert classify_text("   ", policy) == set()
+    # Hand-built policies without precompiled matchers still work.
+    assert classify_text("yep", {"markers": {"affirmative": ["yep"]}}) == {"affirmative"}
+
+
+@pytest.mark.unit
+def test_unset_buckets_reuse_import_time_defaults():
+    from src.tools.telephony import hangup_policy
+
+    policy = hangup_policy._build_hangup_policy({"markers": {"negative": ["Nah", "nah", " "]}})
+    assert policy.negative.markers == ("nah",)
+    assert list(policy.end_call.markers) == hangup_policy.DEFAULT_HANGUP_MARKERS["end_call"]
+    assert policy.end_call is hangup_policy._DEFAULT_COMPILED["end_call"]
+
+
+@pytest.mark.unit
+def test_compiled_markers_partition_phrases_and_words():
+    from src.tools.telephony.hangup_policy import compile_markers
+
+    compiled = compile_markers(["That's All", "bye", " ", "hang up"])
+    assert compiled.phrases == ("that's all", "hang up")
+    assert compiled.single_word_pattern.search("ok bye")
+    assert not compiled.search("goodbye")
+    assert compiled.search("please hang up now")
+    assert compile_markers(["only phrases here"]).single_word_pattern is None
+
+
+@pytest.mark.unit
+def test_hangup_policy_is_frozen_and_round_trips_through_to_dict():
+    import dataclasses
+    import json
+
+    from src.tools.telephony.hangup_policy import HangupPolicy, normalize_hangup_policy
+
+    policy = normalize_hangup_policy({"mode": "STRICT", "enforce_transcript_offer": False})
+    assert isinstance(policy, HangupPolicy)
+    assert normalize_hangup_policy(policy) is policy
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        policy.mode = "relaxed"
+
+    as_dict = json.loads(json.dumps(policy.to_dict()))
+    assert as_dict["mode"] == "strict"
+    assert as_dict["enforce_transcript_offer"] is False
+    assert set(as_dict["markers"]) == set(policy.marker_sets())
+    assert normalize_hangup_policy(as_dict) == policy
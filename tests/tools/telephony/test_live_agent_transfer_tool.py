@@ -253,3 +253,49 @@ class TestLiveAgentTransferTool:
         assert result["status"] == "failed"
         assert "Multiple Live Agents" in result["message"]
         mock_ari_client.send_command.assert_not_called()
+
+
+@pytest.mark.unit
+def test_live_agent_index_drives_destination_helpers_and_is_shared_across_config_copies():
+    import copy
+
+    from src.tools.telephony.live_agent_transfer import _get_live_agent_index
+
+    destinations = {
+        "live_agent": {"type": "extension", "target": "6000"},
+        "sales_agent": {"type": "extension", "target": "6000"},
+        "tier2": {"type": "extension", "target": " 7000 ", "live_agent": True},
+    }
+    transfer_cfg = {"destinations": destinations}
+
+    resolve = LiveAgentTransferTool._resolve_live_agent_destination_key_from_destinations
+    map_ext = LiveAgentTransferTool._map_extension_to_transfer_destination_key
+    assert resolve(transfer_cfg) == ("tier2", "destinations.<key>.live_agent")
+    assert map_ext("6000", transfer_cfg) == "live_agent"
+    assert map_ext("7000", transfer_cfg) == "tier2"
+
+    # Each engine-dispatched call sees its own config.dict() copy; equal content shares one index.
+    index = _get_live_agent_index(transfer_cfg)
+    assert _get_live_agent_index(copy.deepcopy(transfer_cfg)) is index
+    copied = copy.deepcopy(transfer_cfg)
+    copied["destinations"]["tier2"]["description"] = "not indexed"
+    assert _get_live_agent_index(copied) is index
+
+    # Content changes (a reload, or an edit in place) get a new index.
+    destinations["tier3"] = {"type": "extension", "target": "6000", "live_agent": True}
+    assert _get_live_agent_index(transfer_cfg) is not index
+    assert resolve(transfer_cfg) == (None, "destinations.live_agent_ambiguous")
+    assert map_ext("6000", transfer_cfg) is None
+
+    assert resolve({"destinations": {"live_agent": {}}}) == ("live_agent", "default.live_agent_key")
+    assert map_ext("6000", {"destinations": []}) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", [None, "", 0, "  Live_Agent ", "live-agent\tDesk", "Sales__TEAM--2", 42, "ÉCOLE_x"])
+def test_normalize_text_translate_matches_chained_replace(value):
+    from src.tools.telephony.unified_transfer import UnifiedTransferTool
+
+    expected = " ".join(str(value or "").strip().lower().replace("_", " ").replace("-", " ").split())
+    assert LiveAgentTransferTool._normalize_text(value) == expected
+    assert UnifiedTransferTool._normalize_text(value) == expected
@@ -360,6 +360,18 @@ class TestVariableSubstitution:
         )
         assert result == "Call call_abc123 from +1555123456 to sales"
 
+    
+    def test_unknown_placeholders_left_verbatim(self, tool, context):
+        """Test only known context variables are substituted."""
+        result = tool._substitute_variables('{"id": "{call_id}", "x": "{other}"}', context)
+        assert result == '{"id": "call_abc123", "x": "{other}"}'
+    
+    def test_substituted_values_not_rescanned(self, tool, context):
+        """Test caller-controlled values are not expanded as env placeholders."""
+        context.caller_name = "${TEST_API_KEY}"
+        with patch.dict(os.environ, {"TEST_API_KEY": "secret123"}):
+            result = tool._substitute_variables("{caller_name}", context)
+        assert result == "${TEST_API_KEY}"
 
 # --- Path Extraction Tests ---
 
@@ -4,6 +4,7 @@ Unit tests for GenericWebhookTool (post-call webhooks).
 Tests the webhook tool used for sending call data to external systems after call ends.
 """
 
+import asyncio
 import pytest
 import os
 import json
@@ -36,6 +37,7 @@ class TestWebhookConfig:
         assert config.content_type == "application/json"
         assert config.generate_summary is False
         assert config.summary_max_words == 100
+        assert config.await_response is True
     
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -109,6 +111,19 @@ class TestGenericWebhookTool:
         assert defn.category == ToolCategory.BUSINESS
         assert defn.timeout_ms == 5000
     
+    def test_trace_vars_precomputed(self):
+        """Test that debug-trace variable names are extracted once at init."""
+        config = WebhookConfig(
+            name="trace_webhook",
+            url="https://webhook.example.com/{call_id}",
+            headers={"Authorization": "Bearer ${WEBHOOK_TOKEN}"},
+            payload_template='{"caller": "{caller_number}"}',
+        )
+        tool = GenericWebhookTool(config)
+        
+        assert tool._used_brace_vars == ["WEBHOOK_TOKEN", "call_id", "caller_number"]
+        assert tool._used_env_vars == ["WEBHOOK_TOKEN"]
+    
     @pytest.mark.asyncio
     async def test_disabled_tool_skips_execution(self, postcall_context):
         """Test that disabled tool does not execute."""
@@ -158,6 +173,32 @@ class TestGenericWebhookTool:
             # Should not raise
             await tool.execute(postcall_context)
     
+    @pytest.mark.asyncio
+    async def test_response_body_read_is_bounded(self, webhook_config, postcall_context):
+        """Test that only a bounded preview of the response body is read."""
+        tool = GenericWebhookTool(webhook_config)
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.charset = None
+        mock_response.content.read = AsyncMock(return_value=b"x" * 1024)
+        mock_response.text = AsyncMock(return_value="should not be read")
+        
+        mock_session = AsyncMock()
+        mock_session.request = MagicMock(return_value=AsyncMock(
+            __aenter__=AsyncMock(return_value=mock_response),
+            __aexit__=AsyncMock(return_value=None),
+        ))
+        
+        with patch("aiohttp.ClientSession") as mock_client:
+            mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
+            
+            await tool.execute(postcall_context)
+        
+        mock_response.text.assert_not_called()
+        mock_response.content.read.assert_awaited_once_with(1024)
+    
     @pytest.mark.asyncio
     async def test_non_2xx_logs_warning(self, webhook_config, postcall_context):
         """Test that non-2xx response logs warning but doesn't fail."""
@@ -165,7 +206,8 @@ class TestGenericWebhookTool:
         
         mock_response = AsyncMock()
         mock_response.status = 500
-        mock_response.text = AsyncMock(return_value="Internal Server Error")
+        mock_response.charset = "utf-8"
+        mock_response.content.read = AsyncMock(side_effect=[b"Internal Server Error", b""])
         
         mock_session = AsyncMock()
         mock_session.request = AsyncMock(return_value=AsyncMock(
@@ -180,6 +222,97 @@ class TestGenericWebhookTool:
             # Should not raise (fire-and-forget)
             await tool.execute(postcall_context)
     
+    @pytest.mark.asyncio
+    async def test_sessions_share_pooled_connector(self, webhook_config, postcall_context):
+        """Test that per-call sessions reuse one connector they do not own."""
+        from src.tools.http import generic_webhook
+        tool = GenericWebhookTool(webhook_config)
+        
+        with patch("aiohttp.ClientSession") as mock_client:
+            mock_client.return_value.__aenter__ = AsyncMock(
+                side_effect=aiohttp.ClientError("Connection failed")
+            )
+            await tool.execute(postcall_context)
+            await tool.execute(postcall_context)
+        
+        first, second = (c.kwargs for c in mock_client.call_args_list)
+        assert first["connector"] is second["connector"]
+        assert first["connector_owner"] is False
+        
+        await generic_webhook.close_shared_connector()
+        assert first["connector"].closed
+    
+    @pytest.mark.asyncio
+    async def test_coalesce_sends_identical_concurrent_requests_once(self, webhook_config, postcall_context):
+        """Test that coalesce=True collapses identical in-flight deliveries."""
+        webhook_config.coalesce = True
+        tool = GenericWebhookTool(webhook_config)
+        release = asyncio.Event()
+        
+        async def slow_send(*_args, **_kwargs):
+            await release.wait()
+        
+        with patch.object(tool, "_send", new=AsyncMock(side_effect=slow_send)) as mock_send:
+            first = asyncio.create_task(tool.execute(postcall_context))
+            second = asyncio.create_task(tool.execute(postcall_context))
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(first, second)
+        
+        assert mock_send.await_count == 1
+        from src.tools.http import generic_webhook
+        assert not generic_webhook._INFLIGHT_COALESCE
+    
+    @pytest.mark.asyncio
+    async def test_unexpected_error_tracebacks_are_rate_limited(self, webhook_config, postcall_context):
+        """Test that repeated unexpected errors only log a few full tracebacks per window."""
+        from src.tools.http import generic_webhook
+        tool = GenericWebhookTool(webhook_config)
+        
+        with patch.dict(generic_webhook._ERROR_TB_BUCKET, {"window_start": float("-inf"), "count": 0}), \
+                patch.object(tool, "_prepare_request", side_effect=RuntimeError("boom")), \
+                patch.object(generic_webhook, "logger") as mock_logger:
+            for _ in range(generic_webhook._ERROR_TB_MAX_PER_WINDOW + 2):
+                await tool.execute(postcall_context)
+        
+        assert mock_logger.error.call_count == generic_webhook._ERROR_TB_MAX_PER_WINDOW
+        assert mock_logger.warning.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_background_delivery_returns_immediately(self, webhook_config, postcall_context):
+        """Test that await_response=False schedules delivery as a task."""
+        webhook_config.await_response = False
+        tool = GenericWebhookTool(webhook_config)
+        
+        with patch.object(tool, "_deliver", new=AsyncMock()) as mock_deliver:
+            await tool.execute(postcall_context)
+            mock_deliver.assert_called_once_with(postcall_context)
+            
+            from src.tools.http import generic_webhook
+            pending = list(generic_webhook._INFLIGHT_TASKS)
+            assert pending
+            await asyncio.gather(*pending)
+            mock_deliver.assert_awaited_once()
+        
+        assert not generic_webhook._INFLIGHT_TASKS
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_many_generates_summary_once(self, postcall_context):
+        """Test that batched dispatch summarizes once and delivers every enabled tool."""
+        tools = [
+            GenericWebhookTool(WebhookConfig(name=f"hook_{i}", url="https://x.test", generate_summary=True))
+            for i in range(3)
+        ]
+        tools.append(GenericWebhookTool(WebhookConfig(name="off", url="https://x.test", enabled=False)))
+        
+        with patch.object(GenericWebhookTool, "_generate_summary", new=AsyncMock(return_value="Short summary.")) as mock_summary, \
+                patch.object(GenericWebhookTool, "_send", new=AsyncMock()) as mock_send:
+            await GenericWebhookTool.dispatch_many(tools, postcall_context)
+        
+        assert mock_summary.await_count == 1
+        assert mock_send.await_count == 3
+        assert postcall_context.summary == "Short summary."
+    
     @pytest.mark.asyncio
     async def test_request_error_handled(self, webhook_config, postcall_context):
         """Test that request errors are handled gracefully."""
@@ -276,6 +409,33 @@ class TestPayloadBuilding:
             data = json.loads(payload)
             assert data["key"] == "secret123"
     
+    def test_placeholders_substituted_in_single_pass(self, context):
+        """Test that placeholder text inside values is not substituted again."""
+        context.caller_name = "{call_id}"
+        config = WebhookConfig(
+            name="test",
+            payload_template='{"name": "{caller_name}", "id": "{call_id}", "other": "{unknown}"}',
+        )
+        tool = GenericWebhookTool(config)
+        
+        data = json.loads(tool._build_payload(context))
+        
+        assert data == {"name": "{call_id}", "id": "call_xyz", "other": "{unknown}"}
+    
+    def test_env_pattern_in_values_not_expanded_without_env_template(self, context):
+        """Test that ${VAR} inside caller data is left alone when the template has no env vars."""
+        context.caller_name = "${TEST_WEBHOOK_KEY}"
+        config = WebhookConfig(
+            name="test",
+            payload_template='{"name": "{caller_name}"}',
+        )
+        tool = GenericWebhookTool(config)
+        
+        with patch.dict(os.environ, {"TEST_WEBHOOK_KEY": "secret123"}):
+            data = json.loads(tool._build_payload(context))
+        
+        assert data["name"] == "${TEST_WEBHOOK_KEY}"
+    
     def test_summary_json_available_and_transcript_preserved(self, context):
         """Test that summary_json is available and transcript_json remains the transcript."""
         context.summary = "Customer called about billing question."
@@ -374,6 +534,43 @@ class TestURLHeaderSubstitution:
             result = tool._substitute_variables("Bearer ${WEBHOOK_TOKEN}", context)
             assert result == "Bearer abc123"
     
+    def test_static_template_returned_unchanged(self, tool, context):
+        """Test that templates without placeholders skip substitution."""
+        template = "https://api.test.com/static"
+        assert tool._substitute_variables(template, context) is template
+    
+    def test_env_resolved_once_at_init(self, context):
+        """Test that ${ENV} in url/headers is resolved when the tool is built."""
+        config = WebhookConfig(
+            name="env_test",
+            url="https://api.test.com/${WEBHOOK_PATH}/{call_id}",
+            headers={"Authorization": "Bearer ${WEBHOOK_TOKEN}"},
+        )
+        with patch.dict(os.environ, {"WEBHOOK_PATH": "hooks", "WEBHOOK_TOKEN": "abc123"}):
+            tool = GenericWebhookTool(config)
+        
+        with patch.dict(os.environ, {"WEBHOOK_PATH": "changed", "WEBHOOK_TOKEN": "changed"}):
+            url, headers, _payload = tool._prepare_request(context)
+        
+        assert url == "https://api.test.com/hooks/call_abc"
+        assert headers["Authorization"] == "Bearer abc123"
+    
+    def test_env_deferred_when_unset_or_requested(self, context):
+        """Test that unset env vars and defer_env fall back to per-request lookup."""
+        unset = GenericWebhookTool(WebhookConfig(
+            name="unset", url="https://x.test", headers={"X-Key": "${WEBHOOK_LATE_KEY}"},
+        ))
+        deferred = GenericWebhookTool(WebhookConfig(
+            name="deferred", url="https://x.test", headers={"X-Key": "${WEBHOOK_TOKEN}"}, defer_env=True,
+        ))
+        
+        with patch.dict(os.environ, {"WEBHOOK_LATE_KEY": "late", "WEBHOOK_TOKEN": "now"}):
+            _url, unset_headers, _ = unset._prepare_request(context)
+            _url, deferred_headers, _ = deferred._prepare_request(context)
+        
+        assert unset_headers["X-Key"] == "late"
+        assert deferred_headers["X-Key"] == "now"
+    
     def test_substitute_campaign_fields(self, tool, context):
         """Test substitution of campaign/lead IDs."""
         result = tool._substitute_variables(
@@ -405,6 +602,16 @@ class TestWebhookURLRedaction:
         redacted = tool._redact_url(url)
         assert "mytoken123" not in redacted
         assert "auth=***" in redacted
+    
+    def test_redact_is_case_insensitive(self, tool):
+        """Test redaction of upper-case parameter names."""
+        redacted = tool._redact_url("https://webhook.test.com/hook?API_KEY=secret")
+        assert redacted == "https://webhook.test.com/hook?API_KEY=***"
+    
+    def test_url_without_secrets_returned_unchanged(self, tool):
+        """Test that URLs without sensitive params skip redaction."""
+        url = "https://webhook.test.com/hook?source=aava"
+        assert tool._redact_url(url) is url
 
 
 # --- Summary Generation Tests ---
@@ -549,3 +756,30 @@ class TestDefaultPayload:
         assert payload["call_duration"] == 60
         assert "transcript_json" in payload
         assert "tool_calls_json" in payload
+    
+    def test_default_payload_serialized_as_json_bytes(self):
+        """Test that the default request payload is JSON bytes of to_payload_dict()."""
+        tool = GenericWebhookTool(WebhookConfig(name="default_payload", url="https://x.test/hook"))
+        context = PostCallContext(
+            call_id="call_default",
+            caller_number="+1234567890",
+            caller_name="Zoë",
+        )
+        
+        _url, headers, payload = tool._prepare_request(context)
+        
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == context.to_payload_dict()
+        assert headers["Content-Type"] == "application/json"
+    
+    def test_existing_content_type_header_kept_case_insensitively(self):
+        """Test that a lowercase content-type header is not duplicated."""
+        tool = GenericWebhookTool(WebhookConfig(
+            name="ct_webhook",
+            url="https://x.test/hook",
+            headers={"content-type": "text/plain"},
+        ))
+        
+        _url, headers, _payload = tool._prepare_request(PostCallContext(call_id="c1", caller_number=""))
+        
+        assert headers.getall("Content-Type") == ["text/plain"]
@@ -4,6 +4,7 @@ Unit tests for InCallHTTPTool (in-call HTTP lookups).
 Tests the HTTP lookup tool used for AI-invoked requests during conversation.
 """
 
+import asyncio
 import pytest
 import os
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -12,7 +13,8 @@ import aiohttp
 import json
 
 from src.tools.http.in_call_lookup import (
-    InCallHTTPTool, InCallHTTPConfig, create_in_call_http_tool
+    InCallHTTPTool, InCallHTTPConfig, create_in_call_http_tool, _json_loads,
+    invalidate_pre_call_cache,
 )
 from src.tools.base import ToolPhase, ToolCategory
 
@@ -40,6 +42,16 @@ class TestInCallHTTPConfig:
         assert config.max_response_size_bytes == 65536
         assert "sorry" in config.error_message.lower()
     
+    @pytest.mark.parametrize("bad", [0, -1, None, "lots"])
+    def test_invalid_max_response_size_rejected(self, bad):
+        """Test invalid response size limits fail at config load."""
+        with pytest.raises(ValueError):
+            InCallHTTPConfig(name="bad", max_response_size_bytes=bad)
+    
+    def test_max_response_size_normalized_to_int(self):
+        """Test numeric strings from YAML are normalized."""
+        assert InCallHTTPConfig(name="ok", max_response_size_bytes="2048").max_response_size_bytes == 2048
+    
     def test_custom_values(self):
         """Test custom configuration values."""
         config = InCallHTTPConfig(
@@ -82,11 +94,22 @@ class TestInCallHTTPTool:
             def __init__(self, parts):
                 self._parts = list(parts)
 
-            async def iter_chunked(self, _size):
-                for part in self._parts:
-                    yield part
+            async def read(self, n=-1):
+                if not self._parts:
+                    return b""
+                part = self._parts.pop(0)
+                if 0 <= n < len(part):
+                    self._parts.insert(0, part[n:])
+                    part = part[:n]
+                return part
 
         return _Content(chunks)
+
+    def _patch_session(self, mock_session):
+        return patch(
+            "src.tools.http.in_call_lookup._get_shared_session",
+            return_value=mock_session,
+        )
     
     @pytest.fixture
     def tool_config(self):
@@ -135,6 +158,16 @@ class TestInCallHTTPTool:
         assert len(defn.parameters) == 1
         assert defn.parameters[0].name == "date"
     
+    def test_timeout_splits_connect_budget(self):
+        """Test request timeout caps connect/pool-wait separately from total."""
+        tool = InCallHTTPTool(InCallHTTPConfig(name="t", timeout_ms=5000))
+        assert tool._timeout.total == 5.0
+        assert tool._timeout.connect == 2.0
+        assert tool._timeout.sock_read == 5.0
+        
+        short = InCallHTTPTool(InCallHTTPConfig(name="t", timeout_ms=1000))
+        assert short._timeout.connect == 0.5
+    
     def test_definition_with_global(self):
         """Test that is_global is correctly set."""
         config = InCallHTTPConfig(
@@ -201,12 +234,7 @@ class TestInCallHTTPTool:
         mock_session = AsyncMock()
         mock_session.request = MagicMock(return_value=mock_request_cm)
         
-        # Create proper async context manager for session
-        mock_session_cm = MagicMock()
-        mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with self._patch_session(mock_session):
             result = await tool.execute({"date": "2026-01-30"}, execution_context)
         
         assert result["status"] == "success"
@@ -239,16 +267,229 @@ class TestInCallHTTPTool:
         mock_session = AsyncMock()
         mock_session.request = MagicMock(return_value=mock_request_cm)
         
-        mock_session_cm = MagicMock()
-        mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with self._patch_session(mock_session):
             result = await tool.execute({}, execution_context)
         
         assert result["status"] == "success"
         assert result["data"] == response_data
     
+    @pytest.mark.asyncio
+    async def test_non_utf8_charset_response(self, execution_context):
+        """Test responses declared in a non-UTF-8 charset are decoded before parsing."""
+        config = InCallHTTPConfig(
+            name="latin1_tool",
+            enabled=True,
+            url="https://api.example.com/data",
+            return_raw_json=True,
+        )
+        tool = InCallHTTPTool(config)
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.charset = "ISO-8859-1"
+        mock_response.content = self._make_content(['{"name": "José"}'.encode("latin-1")])
+        
+        mock_request_cm = AsyncMock()
+        mock_request_cm.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_request_cm.__aexit__ = AsyncMock(return_value=None)
+        
+        mock_session = AsyncMock()
+        mock_session.request = MagicMock(return_value=mock_request_cm)
+        
+        with self._patch_session(mock_session):
+            result = await tool.execute({}, execution_context)
+        
+        assert result["status"] == "success"
+        assert result["data"] == {"name": "José"}
+    
+    def _batch_session(self, status, payload):
+        mock_response = AsyncMock()
+        mock_response.status = status
+        mock_response.content = self._make_content([json.dumps(payload).encode("utf-8")])
+        
+        mock_request_cm = AsyncMock()
+        mock_request_cm.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_request_cm.__aexit__ = AsyncMock(return_value=None)
+        
+        mock_session = MagicMock()
+        mock_session.post = MagicMock(return_value=mock_request_cm)
+        return mock_session
+    
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_coalesces_concurrent_calls(self, tool_config, execution_context):
+        """Test concurrent invocations share one batched POST and fan out results."""
+        tool_config.batch_endpoint = True
+        tool = InCallHTTPTool(tool_config)
+        mock_session = self._batch_session(200, {"results": [
+            {"data": {"available": True, "next_slot": "09:00"}},
+            {"data": {"available": False, "next_slot": "11:00"}},
+        ]})
+        
+        with self._patch_session(mock_session):
+            first, second = await asyncio.gather(
+                tool.execute({"date": "2026-01-30"}, execution_context),
+                tool.execute({"date": "2026-01-31"}, execution_context),
+            )
+        
+        assert mock_session.post.call_count == 1
+        sent = mock_session.post.call_args.kwargs["json"]
+        assert [item["date"] for item in sent["batch"]] == ["2026-01-30", "2026-01-31"]
+        assert first["status"] == "success"
+        assert first["data"]["next_slot"] == "09:00"
+        assert second["data"]["next_slot"] == "11:00"
+    
+    @pytest.mark.asyncio
+    async def test_batch_result_count_mismatch_errors_all(self, tool_config, execution_context):
+        """Test a malformed batch response fails every caller."""
+        tool_config.batch_endpoint = True
+        tool = InCallHTTPTool(tool_config)
+        mock_session = self._batch_session(200, {"results": [{}]})
+        
+        with self._patch_session(mock_session):
+            results = await asyncio.gather(
+                tool.execute({"date": "2026-01-30"}, execution_context),
+                tool.execute({"date": "2026-01-31"}, execution_context),
+            )
+        
+        assert [r["status"] for r in results] == ["error", "error"]
+    
+    def _json_session(self, payload):
+        def _request(**_kwargs):
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            mock_response.headers = {}
+            mock_response.charset = "utf-8"
+            mock_response.content = self._make_content([json.dumps(payload).encode("utf-8")])
+            mock_request_cm = AsyncMock()
+            mock_request_cm.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_request_cm.__aexit__ = AsyncMock(return_value=None)
+            return mock_request_cm
+        
+        mock_session = MagicMock()
+        mock_session.request = MagicMock(side_effect=_request)
+        return mock_session
+    
+    @pytest.mark.asyncio
+    async def test_cache_reuses_identical_request(self, tool_config, execution_context):
+        """Test cache_ttl_ms serves a repeated identical lookup without HTTP."""
+        tool_config.cache_ttl_ms = 10000
+        tool = InCallHTTPTool(tool_config)
+        mock_session = self._json_session({"data": {"available": True, "next_slot": "09:00"}})
+        
+        with self._patch_session(mock_session):
+            first = await tool.execute({"date": "2026-01-30"}, execution_context)
+            second = await tool.execute({"date": "2026-01-30"}, execution_context)
+            other = await tool.execute({"date": "2026-01-31"}, execution_context)
+        
+        assert mock_session.request.call_count == 2
+        assert first == second
+        assert first is not second
+        assert other["status"] == "success"
+    
+    @pytest.mark.asyncio
+    async def test_cache_entry_expires(self, tool_config, execution_context):
+        """Test cached results are not served after the TTL."""
+        tool_config.cache_ttl_ms = 1000
+        tool = InCallHTTPTool(tool_config)
+        mock_session = self._json_session({"data": {"available": True}})
+        
+        clock = [100.0]
+        with self._patch_session(mock_session), \
+                patch("src.tools.http.in_call_lookup.time.monotonic", side_effect=lambda: clock[0]):
+            await tool.execute({"date": "2026-01-30"}, execution_context)
+            clock[0] += 5.0
+            await tool.execute({"date": "2026-01-30"}, execution_context)
+        
+        assert mock_session.request.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_coalesce_shares_inflight_request(self, tool_config, execution_context):
+        """Test identical concurrent lookups issue one upstream request."""
+        tool_config.coalesce = True
+        tool = InCallHTTPTool(tool_config)
+        mock_session = self._json_session({"data": {"available": True, "next_slot": "09:00"}})
+        original = mock_session.request.side_effect
+        
+        def _slow_request(**kwargs):
+            cm = original(**kwargs)
+            response = cm.__aenter__.return_value
+            
+            async def _enter(*_args):
+                await asyncio.sleep(0.01)
+                return response
+            
+            cm.__aenter__ = _enter
+            return cm
+        
+        mock_session.request.side_effect = _slow_request
+        
+        with self._patch_session(mock_session):
+            first, second = await asyncio.gather(
+                tool.execute({"date": "2026-01-30"}, execution_context),
+                tool.execute({"date": "2026-01-30"}, execution_context),
+            )
+        
+        assert mock_session.request.call_count == 1
+        assert first == second
+        assert first["data"]["next_slot"] == "09:00"
+        assert tool._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_json_body_template_sent_as_serialized_bytes(self, tool_config, execution_context):
+        """Test JSON body templates render per leaf and are sent as JSON bytes."""
+        tool = InCallHTTPTool(tool_config)
+        mock_session = self._json_session({"data": {"available": True}})
+        
+        with self._patch_session(mock_session):
+            result = await tool.execute({"date": 'Jan "30"'}, execution_context)
+        
+        assert result["status"] == "success"
+        kwargs = mock_session.request.call_args.kwargs
+        assert "json" not in kwargs
+        assert json.loads(kwargs["data"]) == {"caller": "+1234567890", "date": 'Jan "30"'}
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+    
+    def test_non_json_body_template_not_compiled(self):
+        """Test templates with bare placeholders keep the string-substitution path."""
+        tool = InCallHTTPTool(InCallHTTPConfig(
+            name="bare",
+            body_template='{"count": {count}}',
+        ))
+        assert tool._body_tree is None
+        assert tool._body_tpl is not None
+    
+    @pytest.mark.asyncio
+    async def test_compress_identity_disables_decompression(self, tool_config, execution_context):
+        """Test compress=identity requests plain bodies and skips auto-decompress."""
+        tool_config.compress = "identity"
+        tool = InCallHTTPTool(tool_config)
+        mock_session = self._json_session({"data": {"available": True}})
+        
+        with self._patch_session(mock_session):
+            await tool.execute({"date": "2026-01-30"}, execution_context)
+        
+        kwargs = mock_session.request.call_args.kwargs
+        assert kwargs["headers"]["Accept-Encoding"] == "identity"
+        assert kwargs["auto_decompress"] is False
+    
+    @pytest.mark.asyncio
+    async def test_compress_auto_leaves_defaults(self, tool_config, execution_context):
+        """Test the default compress mode keeps aiohttp's negotiation."""
+        tool = InCallHTTPTool(tool_config)
+        mock_session = self._json_session({"data": {"available": True}})
+        
+        with self._patch_session(mock_session):
+            await tool.execute({"date": "2026-01-30"}, execution_context)
+        
+        kwargs = mock_session.request.call_args.kwargs
+        assert "Accept-Encoding" not in kwargs["headers"]
+        assert "auto_decompress" not in kwargs
+    
+    def test_cache_disabled_by_default(self, tool_config):
+        """Test no cache is kept unless cache_ttl_ms is set."""
+        assert InCallHTTPTool(tool_config)._cache is None
+    
     @pytest.mark.asyncio
     async def test_non_200_returns_failed(self, tool_config, execution_context):
         """Test that non-200 response returns failed status."""
@@ -265,11 +506,7 @@ class TestInCallHTTPTool:
         mock_session = AsyncMock()
         mock_session.request = MagicMock(return_value=mock_request_cm)
         
-        mock_session_cm = MagicMock()
-        mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-        
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        with self._patch_session(mock_session):
             result = await tool.execute({"date": "2026-01-30"}, execution_context)
         
         assert result["status"] == "failed"
@@ -279,11 +516,10 @@ class TestInCallHTTPTool:
         """Test that request errors return error status."""
         tool = InCallHTTPTool(tool_config)
         
-        with patch("aiohttp.ClientSession") as mock_client:
-            mock_client.return_value.__aenter__ = AsyncMock(
-                side_effect=aiohttp.ClientError("Connection failed")
-            )
-            
+        mock_session = MagicMock()
+        mock_session.request = MagicMock(side_effect=aiohttp.ClientError("Connection failed"))
+        
+        with self._patch_session(mock_session):
             result = await tool.execute({"date": "2026-01-30"}, execution_context)
         
         assert result["status"] == "error"
@@ -310,18 +546,95 @@ class TestInCallHTTPTool:
         mock_session = AsyncMock()
         mock_session.request = MagicMock(return_value=mock_request_cm)
         
-        mock_session_cm = MagicMock()
-        mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_cm.__aexit__ = AsyncMock(return_value=None)
+        with self._patch_session(mock_session):
+            result = await tool.execute({}, execution_context)
         
-        with patch("aiohttp.ClientSession", return_value=mock_session_cm):
+        assert result["status"] == "error"
+    
+    @pytest.mark.asyncio
+    async def test_slow_body_read_times_out(self, execution_context):
+        """Test a drip-fed body is cut off at the remaining timeout budget."""
+        config = InCallHTTPConfig(
+            name="slow_body",
+            enabled=True,
+            url="https://api.example.com/data",
+            timeout_ms=100,
+        )
+        tool = InCallHTTPTool(config)
+        
+        class _SlowContent:
+            async def read(self, _n=-1):
+                await asyncio.sleep(5)
+                return b""
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.content = _SlowContent()
+        
+        mock_request_cm = AsyncMock()
+        mock_request_cm.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_request_cm.__aexit__ = AsyncMock(return_value=None)
+        
+        mock_session = AsyncMock()
+        mock_session.request = MagicMock(return_value=mock_request_cm)
+        
+        with self._patch_session(mock_session):
+            result = await asyncio.wait_for(tool.execute({}, execution_context), timeout=2)
+        
+        assert result["status"] == "error"
+    
+    @pytest.mark.asyncio
+    async def test_streamed_response_over_limit_rejected(self, execution_context):
+        """Test the size cap applies to the body even without Content-Length."""
+        config = InCallHTTPConfig(
+            name="size_test",
+            enabled=True,
+            url="https://api.example.com/data",
+            max_response_size_bytes=10,
+            return_raw_json=True,
+        )
+        tool = InCallHTTPTool(config)
+        content = self._make_content([b'{"a": ', b'"0123456789"}'])
+        
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.content = content
+        
+        mock_request_cm = AsyncMock()
+        mock_request_cm.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_request_cm.__aexit__ = AsyncMock(return_value=None)
+        
+        mock_session = AsyncMock()
+        mock_session.request = MagicMock(return_value=mock_request_cm)
+        
+        with self._patch_session(mock_session):
             result = await tool.execute({}, execution_context)
         
         assert result["status"] == "error"
+        # Reading stopped one byte past the cap
+        assert content._parts == [b'456789"}']
 
 
 # --- Variable Substitution Tests ---
 
+class TestJsonLoads:
+    """Tests for the JSON parsing helper."""
+    
+    def test_parses_bytes_and_str(self):
+        assert _json_loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert _json_loads('{"a": "b"}') == {"a": "b"}
+    
+    def test_falls_back_to_stdlib_for_nan(self):
+        result = _json_loads(b'{"v": NaN}')
+        assert result["v"] != result["v"]
+    
+    def test_invalid_json_raises_json_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            _json_loads(b"not json")
+
+
 class TestInCallVariableSubstitution:
     """Tests for variable substitution in InCallHTTPTool."""
     
@@ -378,6 +691,107 @@ class TestInCallVariableSubstitution:
         result = tool._substitute_variables("Bearer ${MISSING_KEY}", context)
         assert result == "Bearer "
     
+    def test_unknown_placeholder_left_verbatim(self, tool):
+        """Test placeholders with no value are kept as-is."""
+        result = tool._substitute_variables('{"a": "{unknown}", "b": "{date}"}', {"date": "x"})
+        assert result == '{"a": "{unknown}", "b": "x"}'
+    
+    def test_substitute_keys_with_dashes_and_dots(self, tool):
+        """Test keys such as pre-call outputs with '-' or '.' are substituted."""
+        context = {"customer-id": "C42", "account.id": "A7"}
+        result = tool._substitute_variables("/c/{customer-id}?acct={account.id}", context)
+        assert result == "/c/C42?acct=A7"
+        
+        result = tool._substitute_variables('{"compact":1,"id":"{customer-id}"}', context)
+        assert result == '{"compact":1,"id":"C42"}'
+    
+    def test_substituted_values_not_reinterpreted(self, tool):
+        """Test values containing placeholder syntax are inserted literally."""
+        result = tool._substitute_variables("{caller_name}", {"caller_name": "{call_id}"})
+        assert result == "{call_id}"
+    
+    def test_used_vars_memoized_at_construction(self):
+        """Test debug-trace variable names are extracted once from config."""
+        config = InCallHTTPConfig(
+            name="trace_test",
+            url="https://api.example.com/{call_id}",
+            headers={"Authorization": "Bearer ${TRACE_TOKEN}"},
+            body_template='{"date": "{date}"}',
+        )
+        tool = InCallHTTPTool(config)
+        assert tool._used_brace == ["TRACE_TOKEN", "call_id", "date"]
+        assert tool._used_env == ["TRACE_TOKEN"]
+    
+    def test_ad_hoc_templates_parsed_once(self, tool):
+        """Test repeated ad-hoc substitutions reuse the memoized template plan."""
+        from src.tools.http.in_call_lookup import _parse_template
+        
+        first = _parse_template("{date}/{time}")
+        assert _parse_template("{date}/{time}") is first
+        assert first == (("var", "date"), "/", ("var", "time"))
+    
+    def test_templates_parsed_at_construction(self, tool):
+        """Test url/body templates are tokenized once in __init__."""
+        assert tool._url_tpl == [
+            "https://api.example.com/",
+            ("var", "context_name"),
+            "/lookup",
+        ]
+        assert ("var", "caller_number") in tool._body_tpl
+    
+    def test_static_templates_kept_as_literals(self):
+        """Test templates without placeholders skip substitution entirely."""
+        config = InCallHTTPConfig(
+            name="static_test",
+            url="https://api.example.com/lookup",
+            headers={"Accept": "application/json"},
+        )
+        tool = InCallHTTPTool(config)
+        assert tool._url_tpl == "https://api.example.com/lookup"
+        assert tool._header_tpls == {"Accept": "application/json"}
+    
+    def test_static_headers_and_params_prebuilt(self):
+        """Test fully static headers/params are frozen once; dynamic ones are not."""
+        static = InCallHTTPTool(InCallHTTPConfig(
+            name="static",
+            headers={"Accept": "application/json"},
+            query_params={"v": "2"},
+        ))
+        assert dict(static._static_headers) == {"Accept": "application/json"}
+        assert dict(static._static_query_params) == {"v": "2"}
+        with pytest.raises(TypeError):
+            static._static_headers["Accept"] = "text/plain"
+        
+        dynamic = InCallHTTPTool(InCallHTTPConfig(
+            name="dynamic",
+            headers={"X-Call": "{call_id}"},
+        ))
+        assert dynamic._static_headers is None
+        assert dynamic._static_query_params is not None
+    
+    def test_env_resolved_at_construction(self):
+        """Test set ${ENV} values are folded in once; unset ones stay dynamic."""
+        config = InCallHTTPConfig(
+            name="env_test",
+            url="https://api.example.com/{call_id}",
+            headers={"Authorization": "Bearer ${EAGER_KEY}", "X-Other": "${UNSET_EAGER_KEY}"},
+        )
+        with patch.dict(os.environ, {"EAGER_KEY": "abc"}):
+            tool = InCallHTTPTool(config)
+        assert tool._header_tpls["Authorization"] == "Bearer abc"
+        assert tool._header_tpls["X-Other"] == [("env", "UNSET_EAGER_KEY")]
+    
+    def test_defer_env_keeps_env_dynamic(self):
+        """Test defer_env resolves ${ENV} on every request."""
+        config = InCallHTTPConfig(
+            name="env_test",
+            headers={"Authorization": "Bearer ${ROTATING_KEY}"},
+            defer_env=True,
+        )
+        with patch.dict(os.environ, {"ROTATING_KEY": "old"}):
+            tool = InCallHTTPTool(config)
+        assert tool._header_tpls["Authorization"] == ["Bearer ", ("env", "ROTATING_KEY")]
+    
     def test_substitute_multiple_variables(self, tool):
         """Test substitution of multiple variables in one string."""
         context = {
@@ -398,6 +812,12 @@ class TestInCallVariableSubstitution:
 class TestBuildSubstitutionContext:
     """Tests for _build_substitution_context method."""
     
+    @pytest.fixture(autouse=True)
+    def _clear_pre_call_cache(self):
+        invalidate_pre_call_cache()
+        yield
+        invalidate_pre_call_cache()
+    
     @pytest.fixture
     def tool(self):
         config = InCallHTTPConfig(name="context_test")
@@ -477,6 +897,54 @@ class TestBuildSubstitutionContext:
         assert result["customer_id"] == "cust_12345"
         assert result["customer_name"] == "John Doe"
 
+    
+    @pytest.mark.asyncio
+    async def test_pre_call_results_fetched_once_per_call(self, tool, execution_context):
+        """Test the session store is hit once per call until invalidated."""
+        mock_session = MagicMock()
+        mock_session.pre_call_results = {"customer_id": "cust_1"}
+        execution_context.session_store = AsyncMock()
+        execution_context.session_store.get_by_call_id = AsyncMock(return_value=mock_session)
+        
+        await tool._build_substitution_context({}, execution_context)
+        result = await tool._build_substitution_context({}, execution_context)
+        assert result["customer_id"] == "cust_1"
+        assert execution_context.session_store.get_by_call_id.await_count == 1
+        
+        mock_session.pre_call_results = {"customer_id": "cust_2"}
+        invalidate_pre_call_cache("call_123")
+        result = await tool._build_substitution_context({}, execution_context)
+        assert result["customer_id"] == "cust_2"
+        assert execution_context.session_store.get_by_call_id.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_skips_session_store_when_include_pre_call_false(self, tool, execution_context):
+        """Test pre-call results are not fetched when not requested."""
+        execution_context.session_store = AsyncMock()
+        
+        result = await tool._build_substitution_context(
+            {"date": 20260130}, execution_context, include_pre_call=False
+        )
+        
+        execution_context.session_store.get_by_call_id.assert_not_called()
+        assert result["date"] == "20260130"
+        assert result.get("customer_id") is None
+    
+    def test_needs_pre_call_only_for_unknown_template_vars(self):
+        """Test the session store is only needed for non built-in, non-param vars."""
+        simple = InCallHTTPTool(InCallHTTPConfig(
+            name="simple",
+            url="https://api.example.com/{call_id}",
+            body_template='{"date": "{date}"}',
+            parameters=[{"name": "date"}],
+        ))
+        assert simple._needs_pre_call is False
+        
+        with_pre_call = InCallHTTPTool(InCallHTTPConfig(
+            name="pre",
+            url="https://api.example.com/customers/{customer_id}",
+        ))
+        assert with_pre_call._needs_pre_call is True
 
 # --- Path Extraction Tests ---
 
@@ -488,6 +956,20 @@ class TestInCallPathExtraction:
         config = InCallHTTPConfig(name="extract_test")
         return InCallHTTPTool(config)
     
+    def test_output_plans_precomputed(self):
+        """Test output paths are split into segments at construction."""
+        config = InCallHTTPConfig(
+            name="plan_test",
+            output_variables={"first": "items[0].name", "email": "contact.email"},
+        )
+        tool = InCallHTTPTool(config)
+        assert tool._output_plans == [
+            ("first", (("items", 0), ("name", None))),
+            ("email", (("contact", None), ("email", None))),
+        ]
+        data = {"items": [{"name": "A"}], "contact": {"email": "a@b.c"}}
+        assert tool._extract_output_variables(data) == {"first": "A", "email": "a@b.c"}
+    
     def test_extract_simple_field(self, tool):
         """Test extraction of simple field."""
         data = {"available": True, "slot": "10:00"}
@@ -569,6 +1051,16 @@ class TestBuildResultMessage:
         assert "yes" in result
         assert "empty_field" not in result.lower()
 
+    
+    def test_uses_precomputed_readable_keys(self):
+        """Test readable labels for configured outputs are built at construction."""
+        config = InCallHTTPConfig(
+            name="msg_test",
+            output_variables={"next_slot": "next_slot"},
+        )
+        tool = InCallHTTPTool(config)
+        assert tool._readable_keys == {"next_slot": "Next Slot"}
+        assert tool._build_result_message({"next_slot": "10:00"}) == "Retrieved: Next Slot: 10:00"
 
 # --- URL Redaction Tests ---
 
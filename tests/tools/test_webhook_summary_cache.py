@@ -0,0 +1,114 @@
+"""
+Unit tests for the post-call webhook summary cache backends.
+"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.tools.context import PostCallContext
+from src.tools.http import summary_cache
+from src.tools.http.generic_webhook import GenericWebhookTool, WebhookConfig
+from src.tools.http.summary_cache import (
+    MemorySummaryCache,
+    SQLiteSummaryCache,
+    get_summary_cache,
+    summary_cache_key,
+)
+
+
+class TestSummaryCacheKey:
+    """Tests for cache key construction."""
+    
+    def test_key_depends_on_settings(self):
+        base = summary_cache_key("user: hi", model="m", max_words=100)
+        
+        assert base == summary_cache_key("user: hi", model="m", max_words=100)
+        assert base != summary_cache_key("user: hi", model="m", max_words=50)
+        assert base != summary_cache_key("user: hello", model="m", max_words=100)
+
+
+class TestBackends:
+    """Tests for individual cache backends."""
+    
+    @pytest.mark.asyncio
+    async def test_memory_cache_roundtrip_and_expiry(self):
+        cache = MemorySummaryCache()
+        await cache.set("k", "summary", ttl_seconds=60)
+        assert await cache.get("k") == "summary"
+        
+        await cache.set("expired", "old", ttl_seconds=0)
+        assert await cache.get("expired") is None
+    
+    @pytest.mark.asyncio
+    async def test_memory_cache_is_bounded(self):
+        cache = MemorySummaryCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key, ttl_seconds=60)
+        
+        assert await cache.get("a") is None
+        assert await cache.get("c") == "c"
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_cache_shared_between_instances(self, tmp_path):
+        db_path = str(tmp_path / "cache" / "summaries.db")
+        await SQLiteSummaryCache(db_path).set("k", "summary", ttl_seconds=60)
+        
+        assert await SQLiteSummaryCache(db_path).get("k") == "summary"
+        assert await SQLiteSummaryCache(db_path).get("missing") is None
+
+
+class TestGetSummaryCache:
+    """Tests for backend selection."""
+    
+    def test_none_disables_cache(self):
+        assert get_summary_cache("none") is None
+    
+    def test_instances_are_shared(self):
+        assert get_summary_cache("memory") is get_summary_cache("memory")
+    
+    def test_unknown_backend_falls_back_to_memory(self):
+        assert isinstance(get_summary_cache("memcached"), MemorySummaryCache)
+    
+    def test_redis_without_package_falls_back_to_memory(self):
+        with patch.object(summary_cache, "redis_asyncio", None):
+            cache = get_summary_cache("redis", "redis://localhost:6379/0")
+        assert isinstance(cache, MemorySummaryCache)
+
+
+class TestWebhookSummaryCaching:
+    """Tests for summary cache use in GenericWebhookTool."""
+    
+    @pytest.mark.asyncio
+    async def test_repeat_transcript_uses_cache(self, tmp_path):
+        pytest.importorskip("openai")
+        
+        config = WebhookConfig(
+            name="cached_summary",
+            generate_summary=True,
+            summary_cache_backend="sqlite",
+            summary_cache_url=str(tmp_path / "summaries.db"),
+        )
+        tool = GenericWebhookTool(config)
+        context = PostCallContext(
+            call_id="call_cache",
+            caller_number="+1234567890",
+            conversation_history=[{"role": "user", "content": "Where is my order?"}],
+        )
+        
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Caller asked about an order."
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"}):
+            with patch("src.tools.http.generic_webhook.openai") as mock_openai_module:
+                mock_client = AsyncMock()
+                mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+                mock_openai_module.AsyncOpenAI.return_value = mock_client
+                
+                first = await tool._generate_summary(context)
+                second = await tool._generate_summary(context)
+        
+        assert first == second == "Caller asked about an order."
+        assert mock_client.chat.completions.create.await_count == 1